@@ -58,7 +58,8 @@ async def main() -> None:
 
     mediator = Mediator(event_emitter=event_emitter, request_map=request_map, container=container)
 
-    await mediator.send(CleanUnactiveUsersCommand(eta=timedelta(days=1)))
+    async with message_broker:
+        await mediator.send(CleanUnactiveUsersCommand(eta=timedelta(days=1)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+import random
+
+
+class ExponentialBackoff:
+    """
+    Computes delays between retries, which grow exponentially up to ``maximum`` seconds.
+
+    With ``jitter=True`` a random delay between zero and the exponential one is returned ("full jitter"),
+    so clients, which failed at the same moment, do not retry at the same moment::
+
+      backoff = ExponentialBackoff(initial=0.1, maximum=10)
+      await asyncio.sleep(backoff.delay(attempt))
+
+    """
+
+    def __init__(
+        self,
+        initial: float = 0.1,
+        maximum: float = 30.0,
+        multiplier: float = 2.0,
+        *,
+        jitter: bool = True,
+    ) -> None:
+        if initial < 0 or maximum < initial or multiplier < 1:
+            raise ValueError("Expected 0 <= initial <= maximum and multiplier >= 1.")
+
+        self._initial = initial
+        self._maximum = maximum
+        self._multiplier = multiplier
+        self._jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the delay in seconds before the retry, which follows ``attempt`` failed attempts (starting from 1).
+        """
+        exponent = max(attempt - 1, 0)
+        try:
+            delay = min(self._initial * self._multiplier**exponent, self._maximum)
+        except OverflowError:
+            delay = self._maximum
+
+        if self._jitter:
+            return random.uniform(0, delay)
+        return delay
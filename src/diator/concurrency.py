@@ -0,0 +1,32 @@
+import asyncio
+from typing import Awaitable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+
+async def gather_limited(aws: Iterable[Awaitable[T]], limit: int | None = None) -> list[T | Exception]:
+    """
+    Runs awaitables concurrently, at most ``limit`` of them at a time.
+
+    Returns results and raised exceptions in the order of the input awaitables.
+    Cancellation of the caller is propagated to all running awaitables.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be a positive integer or None.")
+
+    if limit is not None:
+        semaphore = asyncio.Semaphore(limit)
+        aws = [_run_limited(semaphore, aw) for aw in aws]
+
+    results = await asyncio.gather(*aws, return_exceptions=True)
+
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+
+    return results  # type: ignore
+
+
+async def _run_limited(semaphore: asyncio.Semaphore, aw: Awaitable[T]) -> T:
+    async with semaphore:
+        return await aw
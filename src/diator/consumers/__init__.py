@@ -0,0 +1,8 @@
+from diator.consumers.consumer import EventConsumer
+from diator.consumers.source import IMessageSource, ReceivedMessage
+
+__all__ = (
+    "EventConsumer",
+    "IMessageSource",
+    "ReceivedMessage",
+)
@@ -0,0 +1,217 @@
+import asyncio
+import contextlib
+import logging
+from typing import Any, Sequence
+
+from diator.consumers.source import IMessageSource, ReceivedMessage
+from diator.containers.protocol import Container
+from diator.events.decoders import IEventDecoder
+from diator.events.event import Event
+from diator.events.map import EventMap
+from diator.events.registry import MessageTypeRegistry
+from diator.message_brokers.protocol import Message
+
+logger = logging.getLogger(__name__)
+
+
+class EventConsumer:
+    """
+    Receives messages from the message source, decodes them to events and handles them by handlers from the event map.
+
+    Usage::
+
+      event_map = EventMap()
+      event_map.bind(UserJoinedNotificationEvent, UserJoinedNotificationEventHandler)
+
+      consumer = EventConsumer(
+          RedisStreamsSource(redis_client, streams, group="meetings", consumer="meetings-1"),
+          event_map,
+          container,
+          concurrency=8,
+      )
+
+      async with consumer:
+          await shutdown_requested.wait()
+
+    At most ``prefetch`` received messages wait for handling, ``concurrency`` of them are handled at a time.
+    Handled messages are acknowledged in batches of ``ack_batch_size`` or every ``ack_interval`` seconds.
+    Messages, whose handlers failed, are logged and not acknowledged, so the broker can deliver them again,
+    e.g. ``RedisStreamsSource`` claims them after ``min_idle_time``; messages, which could not be decoded,
+    are logged and acknowledged.
+
+    ``aclose`` stops receiving after the current ``receive`` call returns, waits at most ``timeout`` seconds
+    for received messages to be handled, acknowledges them and closes the source, if it has ``aclose``.
+    Messages are decoded by ``MessageTypeRegistry`` of the event map by default, received batches are passed
+    to ``decode_many`` if the decoder has it.
+    """
+
+    def __init__(
+        self,
+        source: IMessageSource,
+        event_map: EventMap,
+        container: Container,
+        *,
+        decoder: IEventDecoder | None = None,
+        concurrency: int = 1,
+        prefetch: int | None = None,
+        ack_batch_size: int = 100,
+        ack_interval: float = 0.5,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be a positive integer.")
+
+        self._source = source
+        self._event_map = event_map
+        self._container = container
+        self._decoder = decoder
+        self._concurrency = concurrency
+        self._prefetch = prefetch or concurrency * 2
+        self._ack_batch_size = ack_batch_size
+        self._ack_interval = ack_interval
+        self._queue: asyncio.Queue[tuple[ReceivedMessage, Event | Exception]] = asyncio.Queue(self._prefetch)
+        self._receipts: list[Any] = []
+        self._ack_requested = asyncio.Event()
+        self._receiving = False
+        self._acking = False
+        self._receiver: asyncio.Task | None = None
+        self._acker: asyncio.Task | None = None
+        self._tasks: list[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._receiver is not None:
+            return
+
+        decoder = self._decoder or MessageTypeRegistry.from_event_map(self._event_map)
+
+        self._receiving = True
+        self._acking = True
+        self._receiver = asyncio.ensure_future(self._receive(decoder))
+        self._acker = asyncio.ensure_future(self._ack_periodically())
+        self._tasks = [asyncio.ensure_future(self._work()) for _ in range(self._concurrency)]
+
+    async def aclose(self, timeout: float | None = 30.0) -> None:
+        receiver, self._receiver = self._receiver, None
+        if receiver is None:
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        # The receiver may wait for a free place in the queue, while handlers hang.
+        self._receiving = False
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(asyncio.shield(receiver), timeout)
+        if not receiver.done():
+            await _cancel(receiver)
+
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._queue.join(), None if deadline is None else max(deadline - loop.time(), 0))
+
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            await _cancel(task)
+
+        # Stopped by the flag rather than cancelled, so an acknowledgement in flight completes instead of
+        # being interrupted halfway.
+        acker, self._acker = self._acker, None
+        self._acking = False
+        self._ack_requested.set()
+        if acker is not None:
+            await acker
+
+        await self._ack()
+
+        aclose = getattr(self._source, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self) -> "EventConsumer":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def _receive(self, decoder: IEventDecoder) -> None:
+        while self._receiving:
+            try:
+                received = await self._source.receive(max(self._prefetch - self._queue.qsize(), 1))
+            except Exception:
+                logger.exception("Failed to receive messages")
+                await asyncio.sleep(1)
+                continue
+
+            if not received:
+                # Sources wait for messages, but yield to other tasks even if one returns at once.
+                await asyncio.sleep(0)
+
+            events = _decode(decoder, [received_message.message for received_message in received])
+            for received_message, event in zip(received, events):
+                await self._queue.put((received_message, event))
+
+    async def _work(self) -> None:
+        while True:
+            received_message, event = await self._queue.get()
+            try:
+                if await self._handle(received_message, event) and received_message.receipt is not None:
+                    self._receipts.append(received_message.receipt)
+                    if len(self._receipts) >= self._ack_batch_size:
+                        self._ack_requested.set()
+            finally:
+                self._queue.task_done()
+
+    async def _handle(self, received_message: ReceivedMessage, event: Event | Exception) -> bool:
+        message = received_message.message
+        if isinstance(event, Exception):
+            logger.error(
+                "Failed to decode message %s(%s)", message.message_name, message.message_id, exc_info=event
+            )
+            return True
+
+        try:
+            for handler_type in self._event_map.get(type(event)):
+                handler = await self._container.resolve(handler_type)
+                await handler.handle(event)
+        except Exception:
+            logger.exception("Failed to handle message %s(%s)", message.message_name, message.message_id)
+            return False
+
+        return True
+
+    async def _ack_periodically(self) -> None:
+        while self._acking:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._ack_requested.wait(), self._ack_interval)
+            self._ack_requested.clear()
+            await self._ack()
+
+    async def _ack(self) -> None:
+        receipts, self._receipts = self._receipts, []
+        if not receipts:
+            return
+
+        try:
+            await self._source.ack(receipts)
+        except Exception:
+            logger.exception("Failed to acknowledge %d messages", len(receipts))
+
+
+def _decode(decoder: IEventDecoder, messages: Sequence[Message]) -> Sequence[Event | Exception]:
+    decode_many = getattr(decoder, "decode_many", None)
+    if decode_many is not None:
+        return decode_many(messages)
+
+    events: list[Event | Exception] = []
+    for message in messages:
+        try:
+            events.append(decoder.decode(message))
+        except Exception as exception:
+            events.append(exception)
+
+    return events
+
+
+async def _cancel(task: asyncio.Task) -> None:
+    task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
@@ -0,0 +1,220 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Any, Sequence
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import ResponseError
+
+from diator.consumers.source import IMessageSource, ReceivedMessage
+from diator.message_brokers.encoding import decode_message, message_from_fields
+
+logger = logging.getLogger(__name__)
+
+
+class RedisPubSubSource(IMessageSource):
+    """
+    Receives messages published by ``RedisMessageBroker`` to Redis Pub/Sub.
+
+    Subscribes to ``channels`` and ``patterns`` on the first ``receive``,
+    all channels of the default prefix are subscribed to by default::
+
+      source = RedisPubSubSource(redis_client, patterns=["python_diator_channel:notification_event:*"])
+
+    Pub/Sub does not support acknowledgements, messages published while nobody is subscribed are lost.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        channels: Sequence[str] = (),
+        patterns: Sequence[str] = ("python_diator_channel:*",),
+        timeout: float = 1.0,
+    ) -> None:
+        self._client = client
+        self._channels = channels
+        self._patterns = patterns
+        self._timeout = timeout
+        self._pubsub: PubSub | None = None
+
+    async def receive(self, max_messages: int) -> Sequence[ReceivedMessage]:
+        pubsub = await self._subscribe()
+
+        received: list[ReceivedMessage] = []
+        timeout = self._timeout
+        while len(received) < max_messages:
+            data = await pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+            if data is None:
+                break
+
+            timeout = 0
+            try:
+                received.append(ReceivedMessage(message=decode_message(data["data"])))
+            except Exception:
+                logger.exception("Failed to decode message from Redis channel %s", data["channel"])
+
+        return received
+
+    async def ack(self, receipts: Sequence[Any]) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pubsub, self._pubsub = self._pubsub, None
+        if pubsub is not None:
+            await pubsub.aclose()  # type: ignore
+
+    async def _subscribe(self) -> PubSub:
+        if self._pubsub is None:
+            pubsub = self._client.pubsub()
+            if self._channels:
+                await pubsub.subscribe(*self._channels)
+            if self._patterns:
+                await pubsub.psubscribe(*self._patterns)
+            self._pubsub = pubsub
+
+        return self._pubsub
+
+
+class RedisStreamsSource(IMessageSource):
+    """
+    Receives messages appended by ``RedisStreamsMessageBroker`` to Redis Streams as a member of a consumer group.
+
+    The group is created on the first ``receive``, if it does not exist, and starts from ``group_start_id``,
+    ``"0"`` reads all entries kept in the streams. Receipts are ``(stream, entry_id)`` pairs,
+    acknowledged by ``XACK``::
+
+      source = RedisStreamsSource(
+          redis_client,
+          ["python_diator_stream:notification_event"],
+          group="meetings",
+          consumer="meetings-1",
+      )
+
+    Pending entries, which were delivered to any consumer of the group but not acknowledged for ``min_idle_time``
+    milliseconds, e.g. because their handlers failed or the consumer stopped, are claimed by ``XAUTOCLAIM``
+    and received again before new entries. Set it above the longest handling time, ``None`` disables claiming.
+    Entries, which could not be decoded, are logged and acknowledged at once.
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        streams: Sequence[str],
+        *,
+        group: str,
+        consumer: str,
+        block: int = 1000,
+        group_start_id: str = "0",
+        min_idle_time: int | None = 60_000,
+    ) -> None:
+        self._client = client
+        self._streams = streams
+        self._group = group
+        self._consumer = consumer
+        self._block = block
+        self._group_start_id = group_start_id
+        self._min_idle_time = min_idle_time
+        self._claim_start_ids: dict[str, Any] = {stream: "0-0" for stream in streams}
+        self._next_claim = 0.0
+        self._groups_created = False
+
+    async def receive(self, max_messages: int) -> Sequence[ReceivedMessage]:
+        await self._create_groups()
+
+        if self._min_idle_time is not None:
+            received = await self._claim(max_messages)
+            if received:
+                return received
+
+        response = await self._client.xreadgroup(
+            self._group,
+            self._consumer,
+            {stream: ">" for stream in self._streams},
+            count=max_messages,
+            block=self._block,
+        )
+
+        return await self._to_received(response or ())
+
+    async def ack(self, receipts: Sequence[Any]) -> None:
+        if not receipts:
+            return
+
+        entry_ids: defaultdict[Any, list[Any]] = defaultdict(list)
+        for stream, entry_id in receipts:
+            entry_ids[stream].append(entry_id)
+
+        async with self._client.pipeline(transaction=False) as pipeline:
+            for stream, ids in entry_ids.items():
+                pipeline.xack(stream, self._group, *ids)
+            await pipeline.execute()
+
+    async def _claim(self, max_messages: int) -> Sequence[ReceivedMessage]:
+        # Pending entries are scanned page by page over several calls, the next scan starts
+        # once ``min_idle_time`` passes after the previous one is finished.
+        loop = asyncio.get_running_loop()
+        if self._min_idle_time is None or loop.time() < self._next_claim:
+            return []
+
+        claimed: list[tuple[Any, Any]] = []
+        finished = True
+        for stream in self._streams:
+            count = max_messages - sum(len(entries) for _, entries in claimed)
+            if count <= 0:
+                finished = False
+                break
+
+            response = await self._client.xautoclaim(
+                stream,
+                self._group,
+                self._consumer,
+                self._min_idle_time,
+                start_id=self._claim_start_ids[stream],
+                count=count,
+            )
+            next_start_id, entries = response[0], response[1]
+            self._claim_start_ids[stream] = next_start_id
+            finished = finished and next_start_id in (b"0-0", "0-0")
+            if entries:
+                claimed.append((stream, entries))
+
+        if finished:
+            self._next_claim = loop.time() + self._min_idle_time / 1000
+
+        return await self._to_received(claimed)
+
+    async def _to_received(self, response: Any) -> list[ReceivedMessage]:
+        received: list[ReceivedMessage] = []
+        malformed: list[tuple[Any, Any]] = []
+        for stream, entries in response:
+            for entry_id, fields in entries:
+                if fields is None:
+                    # The entry was deleted from the stream while it was pending.
+                    malformed.append((stream, entry_id))
+                    continue
+
+                try:
+                    received.append(ReceivedMessage(message=message_from_fields(fields), receipt=(stream, entry_id)))
+                except Exception:
+                    logger.exception("Failed to decode entry %s of Redis stream %s", entry_id, stream)
+                    malformed.append((stream, entry_id))
+
+        if malformed:
+            await self.ack(malformed)
+
+        return received
+
+    async def _create_groups(self) -> None:
+        if self._groups_created:
+            return
+
+        for stream in self._streams:
+            try:
+                await self._client.xgroup_create(stream, self._group, id=self._group_start_id, mkstream=True)
+            except ResponseError as exception:
+                if "BUSYGROUP" not in str(exception):
+                    raise
+
+        self._groups_created = True
@@ -0,0 +1,34 @@
+from dataclasses import dataclass, field
+from typing import Any, Protocol, Sequence
+
+from diator.message_brokers.protocol import Message
+
+
+@dataclass(frozen=True, kw_only=True)
+class ReceivedMessage:
+    """
+    The message received from a message broker.
+
+    ``receipt`` identifies the message for acknowledgement, ``None`` if the broker does not support acknowledgements.
+    """
+
+    message: Message = field()
+    receipt: Any = field(default=None)
+
+
+class IMessageSource(Protocol):
+    """
+    The interface over the receiving side of a message broker.
+    """
+
+    async def receive(self, max_messages: int) -> Sequence[ReceivedMessage]:
+        """
+        Returns at most ``max_messages`` messages, waits for a limited time and returns nothing if there are none.
+        """
+        ...
+
+    async def ack(self, receipts: Sequence[Any]) -> None:
+        """
+        Acknowledges handled messages by their receipts.
+        """
+        ...
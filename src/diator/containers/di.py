@@ -1,6 +1,7 @@
-from typing import Type, TypeVar
+from typing import Any, Type, TypeVar
 
 import di
+from di import SolvedDependent
 from di.dependent import Dependent
 from di.executors import AsyncExecutor
 
@@ -10,8 +11,20 @@ T = TypeVar("T")
 
 
 class DIContainer(Container[di.Container]):
-    def __init__(self) -> None:
+    """
+    The adapter of the ``di`` container.
+
+    Solving the dependency graph is the expensive part of resolution,
+    so the solved graph is cached per type and reused by every later resolution.
+    The cache is dropped, when another external container is attached or ``clear_cache`` is called.
+    Pass ``cache=False`` to solve the graph on every resolution.
+    """
+
+    def __init__(self, *, cache: bool = True) -> None:
         self._external_container: di.Container | None = None
+        self._cache = cache
+        self._solved: dict[type, SolvedDependent[Any]] = {}
+        self._executor = AsyncExecutor()
 
     @property
     def external_container(self) -> di.Container:
@@ -22,9 +35,20 @@ class DIContainer(Container[di.Container]):
 
     def attach_external_container(self, container: di.Container) -> None:
         self._external_container = container
+        self.clear_cache()
+
+    def clear_cache(self) -> None:
+        """
+        Drops solved dependency graphs, e.g. after binding new dependencies to the external container.
+        """
+        self._solved.clear()
 
     async def resolve(self, type_: Type[T]) -> T:
-        executor = AsyncExecutor()
-        solved = self.external_container.solve(Dependent(type_, scope="request"), scopes=["request"])
+        solved = self._solved.get(type_)
+        if solved is None:
+            solved = self.external_container.solve(Dependent(type_, scope="request"), scopes=["request"])
+            if self._cache:
+                self._solved[type_] = solved
+
         with self.external_container.enter_scope("request") as state:
-            return await solved.execute_async(executor=executor, state=state)
+            return await solved.execute_async(executor=self._executor, state=state)
@@ -0,0 +1,99 @@
+import contextlib
+import enum
+from contextvars import ContextVar
+from typing import Any, Iterator, Mapping, Type, TypeVar
+
+from diator.containers.protocol import Container
+
+T = TypeVar("T")
+C = TypeVar("C")
+
+_scope: ContextVar[dict[type, Any] | None] = ContextVar("diator_scope", default=None)
+
+
+class Lifetime(enum.Enum):
+    """
+    Defines how long a resolved handler instance is reused.
+
+    ``TRANSIENT`` resolves a new instance every time.
+    ``SCOPED`` reuses one instance within a ``scope``, e.g. within one ``Mediator.send`` call.
+    ``SINGLETON`` reuses one instance for the lifetime of the container.
+    """
+
+    TRANSIENT = "transient"
+    SCOPED = "scoped"
+    SINGLETON = "singleton"
+
+
+@contextlib.contextmanager
+def scope() -> Iterator[None]:
+    """
+    Opens a scope for ``Lifetime.SCOPED`` instances.
+
+    ``Mediator.send`` opens a scope for handling the request and its events.
+    Scopes are bound to the current context, so tasks started inside a scope share it.
+    """
+    token = _scope.set({})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+class LifetimeContainer(Container[C]):
+    """
+    The container, which wraps another container and reuses resolved instances according to their lifetimes.
+
+    Singleton and scoped lifetimes are meant for stateless handlers,
+    e.g. event handlers or query handlers, which do not publish events.
+    ``Mediator`` clears the events of a handler after taking them, so a reused handler does not publish them again,
+    but a reused handler, which publishes events, must not handle requests concurrently.
+
+    Usage::
+
+      container = LifetimeContainer(
+          rodi_container,
+          {ReadMeetingQueryHandler: Lifetime.SINGLETON, UserJoinedEventHandler: Lifetime.SCOPED},
+      )
+
+    """
+
+    def __init__(
+        self,
+        container: Container[C],
+        lifetimes: Mapping[type, Lifetime] | None = None,
+        *,
+        default: Lifetime = Lifetime.TRANSIENT,
+    ) -> None:
+        self._container = container
+        self._lifetimes = dict(lifetimes or {})
+        self._default = default
+        self._singletons: dict[type, Any] = {}
+
+    @property
+    def external_container(self) -> C:
+        return self._container.external_container
+
+    def attach_external_container(self, container: C) -> None:
+        self._container.attach_external_container(container)
+        self._singletons.clear()
+
+    def set_lifetime(self, type_: type, lifetime: Lifetime) -> None:
+        self._lifetimes[type_] = lifetime
+        self._singletons.pop(type_, None)
+
+    async def resolve(self, type_: Type[T]) -> T:
+        lifetime = self._lifetimes.get(type_, self._default)
+
+        if lifetime is Lifetime.SINGLETON:
+            instances = self._singletons
+        elif lifetime is Lifetime.SCOPED and (scoped_instances := _scope.get()) is not None:
+            instances = scoped_instances
+        else:
+            return await self._container.resolve(type_)
+
+        if type_ in instances:
+            return instances[type_]
+
+        instance = await self._container.resolve(type_)
+        return instances.setdefault(type_, instance)
@@ -8,8 +8,18 @@ T = TypeVar("T")
 
 
 class RodiContainer(Container[rodi.Container]):
-    def __init__(self) -> None:
+    """
+    The adapter of the ``rodi`` container.
+
+    If the attached container does not provide ``resolve``, the services provider is built by ``build_provider``
+    once, lazily on the first resolution or eagerly at attach time if ``eager=True``, and reused until
+    another container is attached.
+    """
+
+    def __init__(self, *, eager: bool = False) -> None:
         self._external_container: rodi.Container | None = None
+        self._eager = eager
+        self._provider: rodi.Services | None = None
 
     @property
     def external_container(self) -> rodi.Container:
@@ -20,6 +30,10 @@ class RodiContainer(Container[rodi.Container]):
 
     def attach_external_container(self, container: rodi.Container) -> None:
         self._external_container = container
+        self._provider = None
+
+        if self._eager and not hasattr(container, "resolve"):
+            self._provider = container.build_provider()
 
     async def resolve(self, type_: Type[T]) -> T:
         if hasattr(self.external_container, "resolve"):
@@ -27,5 +41,7 @@ class RodiContainer(Container[rodi.Container]):
         return self._build_by_provider(type_)
 
     def _build_by_provider(self, type_: Type[T]) -> T:
-        services = self.external_container.build_provider()
-        return services.get(type_)
+        if self._provider is None:
+            self._provider = self.external_container.build_provider()
+
+        return self._provider.get(type_)
@@ -0,0 +1,69 @@
+import asyncio
+import contextlib
+import time
+from contextvars import ContextVar
+from typing import Iterator
+
+from diator.requests.request import IRequest
+
+_deadline: ContextVar[float | None] = ContextVar("diator_deadline", default=None)
+
+
+class RequestTimeoutError(asyncio.TimeoutError):
+    """
+    Raised when handling of the request, including the emission of its events, did not finish before the deadline.
+    """
+
+    def __init__(self, request: IRequest, timeout: float | None) -> None:
+        if timeout is None:
+            super().__init__(f"Handling of {type(request).__name__} did not finish before the deadline.")
+        else:
+            super().__init__(f"Handling of {type(request).__name__} timed out after {timeout}s.")
+        self.request = request
+        self.timeout = timeout
+
+
+def get_deadline() -> float | None:
+    """
+    Returns the deadline of the current request on the ``time.monotonic`` clock or ``None`` if there is no deadline.
+    """
+    return _deadline.get()
+
+
+def remaining() -> float | None:
+    """
+    Returns the number of seconds left until the deadline of the current request or ``None`` if there is no deadline.
+
+    Handlers may pass it to calls to downstream services::
+
+      await client.get(url, timeout=remaining())
+
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+
+    return max(deadline - time.monotonic(), 0.0)
+
+
+@contextlib.contextmanager
+def deadline(timeout: float | None) -> Iterator[float | None]:
+    """
+    Sets the deadline in ``timeout`` seconds for the current context and yields the number of seconds left.
+
+    A deadline never extends the deadline already set by an outer context.
+    """
+    current = _deadline.get()
+    if timeout is None:
+        yield remaining()
+        return
+
+    new = time.monotonic() + timeout
+    if current is not None and current < new:
+        new = current
+
+    token = _deadline.set(new)
+    try:
+        yield remaining()
+    finally:
+        _deadline.reset(token)
@@ -1,9 +1,12 @@
+from diator.dispatchers.compiled import CompiledDispatcher
 from diator.dispatchers.default import DefaultDispatcher
-from diator.dispatchers.dispatch_result import DispatchResult
+from diator.dispatchers.dispatch_result import DispatchResult, StreamDispatchResult
 from diator.dispatchers.protocol import Dispatcher
 
 __all__ = (
+    "CompiledDispatcher",
     "DispatchResult",
     "DefaultDispatcher",
     "Dispatcher",
+    "StreamDispatchResult",
 )
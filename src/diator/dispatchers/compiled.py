@@ -0,0 +1,66 @@
+from typing import Type, TypeVar
+
+from diator.containers.protocol import Container
+from diator.dispatchers.default import DefaultDispatcher, Pipeline
+from diator.dispatchers.dispatch_result import DispatchResult
+from diator.middlewares.base import MiddlewareChain
+from diator.requests.map import RequestMap
+from diator.requests.request import IRequest
+from diator.responses import IResponse
+
+Res = TypeVar("Res", bound=IResponse | None, covariant=True)
+
+
+class CompiledDispatcher(DefaultDispatcher):
+    """
+    The dispatcher, which builds one dispatch pipeline per request type and reuses it on every later call.
+
+    The pipeline is built the first time a request type is dispatched or eagerly by ``freeze``.
+    All pipelines are dropped as soon as ``RequestMap.bind`` or ``MiddlewareChain.add``/``set`` is called.
+
+    Usage::
+
+      mediator = Mediator(
+        request_map=request_map,
+        container=container,
+        middleware_chain=middleware_chain,
+        dispatcher_type=CompiledDispatcher,
+      )
+
+    """
+
+    def __init__(
+        self,
+        request_map: RequestMap,
+        container: Container,
+        middleware_chain: MiddlewareChain | None = None,
+    ) -> None:
+        super().__init__(request_map=request_map, container=container, middleware_chain=middleware_chain)
+        self._pipelines: dict[Type[IRequest], Pipeline] = {}
+        self._versions = (self._request_map.version, self._middleware_chain.version)
+
+    def freeze(self) -> None:
+        """
+        Builds pipelines for all request types bound to the request map.
+        """
+        self._invalidate_if_stale()
+        for request_type in self._request_map.get_requests():
+            self._pipelines[request_type] = self._compile(request_type)
+
+    async def dispatch(self, request: IRequest[Res]) -> DispatchResult[Res]:
+        return await self._get_pipeline(type(request))(request)
+
+    def _get_pipeline(self, request_type: Type[IRequest]) -> Pipeline:
+        self._invalidate_if_stale()
+
+        pipeline = self._pipelines.get(request_type)
+        if pipeline is None:
+            pipeline = self._pipelines[request_type] = self._compile(request_type)
+
+        return pipeline
+
+    def _invalidate_if_stale(self) -> None:
+        versions = (self._request_map.version, self._middleware_chain.version)
+        if versions != self._versions:
+            self._pipelines.clear()
+            self._versions = versions
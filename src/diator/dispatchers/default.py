@@ -1,13 +1,32 @@
-from typing import TypeVar
+import functools
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
 
+from diator.concurrency import gather_limited
+from diator.containers.lifetime import scope
 from diator.containers.protocol import Container
-from diator.dispatchers.dispatch_result import DispatchResult
+from diator.dispatchers.dispatch_result import DispatchResult, StreamDispatchResult
 from diator.middlewares.base import MiddlewareChain
 from diator.requests.map import RequestMap
 from diator.requests.request import IRequest
+from diator.requests.request_handler import IStreamRequestHandler
 from diator.responses import IResponse
+from diator.tracing import start_span, traced
 
 Res = TypeVar("Res", bound=IResponse | None, covariant=True)
+Pipeline = Callable[[IRequest], Awaitable[DispatchResult]]
+
+# The handle of the handler resolved for the current call of a compiled pipeline.
+_handle: ContextVar[Callable[[IRequest], Awaitable[Any]]] = ContextVar("diator_handle")
 
 class DefaultDispatcher:
     def __init__(
@@ -23,10 +42,110 @@ class DefaultDispatcher:
     async def dispatch(self, request: IRequest[Res]) -> DispatchResult[Res]:
         handler_type = self._request_map.get(type(request))
 
-        handler = await self._container.resolve(handler_type)
+        with start_span("diator.dispatch", {"diator.request": type(request).__name__}):
+            with start_span("diator.resolve", {"diator.handler": handler_type.__name__}):
+                handler = await self._container.resolve(handler_type)
 
-        wrapped_handle = self._middleware_chain.wrap(handler.handle)
+            wrapped_handle = self._middleware_chain.wrap(
+                traced(handler.handle, "diator.handle", {"diator.handler": handler_type.__name__})
+            )
 
-        response = await wrapped_handle(request)
+            response = await wrapped_handle(request)
 
         return DispatchResult(response=response, events=handler.events)
+
+    async def dispatch_stream(self, request: IRequest[Res]) -> StreamDispatchResult[Res]:
+        """
+        Dispatches the request to a streaming request handler.
+
+        Middlewares get a ``handle``, which returns the async iterator of results, and may wrap it.
+        """
+        handler_type = self._request_map.get_stream(type(request))
+
+        with start_span("diator.resolve", {"diator.handler": handler_type.__name__}):
+            handler = cast(IStreamRequestHandler, await self._container.resolve(handler_type))
+
+        async def open_stream(request: IRequest[Res]) -> AsyncIterator[Res]:
+            return handler.handle(request)
+
+        wrapped_open_stream = self._middleware_chain.wrap(open_stream)
+
+        items = await wrapped_open_stream(request)
+
+        return StreamDispatchResult(items=items, events=handler.events)
+
+    async def dispatch_many(
+        self,
+        requests: Sequence[IRequest[Res]],
+        concurrency: int | None = None,
+    ) -> list[DispatchResult[Res] | Exception]:
+        """
+        Dispatches requests concurrently, at most ``concurrency`` at a time.
+
+        The handler lookup and the middleware pipeline are built once per request type and shared by the batch,
+        every request is handled in its own scope.
+        Returns a dispatch result or the raised exception for every request, in the order of ``requests``.
+        """
+        pipelines: dict[Type[IRequest], Pipeline | Exception] = {}
+        for request_type in {type(request) for request in requests}:
+            try:
+                pipelines[request_type] = self._get_pipeline(request_type)
+            except Exception as exception:
+                pipelines[request_type] = exception
+
+        return await gather_limited(
+            (_run_pipeline(pipelines[type(request)], request) for request in requests),
+            concurrency,
+        )
+
+    def _get_pipeline(self, request_type: Type[IRequest]) -> Pipeline:
+        return self._compile(request_type)
+
+    def _compile(self, request_type: Type[IRequest]) -> Pipeline:
+        handler_type = self._request_map.get(request_type)
+        resolve = self._container.resolve
+        middlewares = tuple(middleware.__call__ for middleware in reversed(self._middleware_chain.middlewares))
+        dispatch_attributes = {"diator.request": request_type.__name__}
+        handler_attributes = {"diator.handler": handler_type.__name__}
+
+        if not middlewares:
+
+            async def pipeline(request: IRequest) -> DispatchResult:
+                with start_span("diator.dispatch", dispatch_attributes):
+                    with start_span("diator.resolve", handler_attributes):
+                        handler = await resolve(handler_type)
+                    with start_span("diator.handle", handler_attributes):
+                        response = await handler.handle(request)
+                return DispatchResult(response=response, events=handler.events)
+
+            return pipeline
+
+        # The chain is built once, its innermost handle calls the handler resolved for the current call.
+        chain: Callable[[IRequest], Awaitable[Any]] = _call_handle
+        for middleware in middlewares:
+            chain = functools.partial(middleware, handle=chain)
+
+        async def wrapped_pipeline(request: IRequest) -> DispatchResult:
+            with start_span("diator.dispatch", dispatch_attributes):
+                with start_span("diator.resolve", handler_attributes):
+                    handler = await resolve(handler_type)
+                token = _handle.set(traced(handler.handle, "diator.handle", handler_attributes))
+                try:
+                    response = await chain(request)
+                finally:
+                    _handle.reset(token)
+            return DispatchResult(response=response, events=handler.events)
+
+        return wrapped_pipeline
+
+
+async def _call_handle(request: IRequest) -> Any:
+    return await _handle.get()(request)
+
+
+async def _run_pipeline(pipeline: Pipeline | Exception, request: IRequest) -> DispatchResult:
+    if isinstance(pipeline, Exception):
+        raise pipeline
+
+    with scope():
+        return await pipeline(request)
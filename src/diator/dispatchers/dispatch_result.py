@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Protocol, TypeVar
+from typing import AsyncIterator, Protocol, TypeVar
 
 from diator.events.event import Event
 from diator.responses import IResponse
@@ -14,3 +14,16 @@ class IDispatchResult(Protocol[Res]):
 class DispatchResult(IDispatchResult[Res]):
     response: Res | None = field(default=None)
     events: list[Event] = field(default_factory=list)
+
+
+@dataclass
+class StreamDispatchResult(IDispatchResult[Res]):
+    """
+    The result of dispatching a request to a streaming request handler.
+
+    ``events`` are complete only after ``items`` are exhausted.
+    """
+
+    items: AsyncIterator[Res]
+    events: list[Event] = field(default_factory=list)
+    response: Res | None = field(default=None)
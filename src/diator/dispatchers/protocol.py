@@ -1,6 +1,6 @@
 from typing import Protocol, TypeVar
 
-from diator.dispatchers.dispatch_result import IDispatchResult
+from diator.dispatchers.dispatch_result import IDispatchResult, StreamDispatchResult
 from diator.requests.request import IRequest
 from diator.responses import IResponse
 
@@ -9,3 +9,6 @@ Res = TypeVar("Res", bound=IResponse | None)
 class Dispatcher(Protocol):
     async def dispatch(self, request: IRequest[Res]) -> IDispatchResult[Res]:
         ...
+
+    async def dispatch_stream(self, request: IRequest[Res]) -> StreamDispatchResult[Res]:
+        ...
@@ -1,7 +1,28 @@
+from diator.events.decoders import (
+    FactoryEventDecoder,
+    IEventDecoder,
+    UnknownMessageError,
+)
+from diator.events.emission import (
+    BackgroundEmission,
+    ConcurrentEmission,
+    EmissionQueueFull,
+    EventEmissionError,
+    GroupedEmission,
+    IEmissionStrategy,
+    OverflowPolicy,
+    SequentialEmission,
+)
 from diator.events.event import DomainEvent, ECSTEvent, Event, NotificationEvent
-from diator.events.event_emitter import EventEmitter
+from diator.events.event_emitter import ErrorPolicy, EventEmitter, EventHandlingError
 from diator.events.event_handler import IEventHandler
 from diator.events.map import EventMap
+from diator.events.registry import MessageTypeRegistry
+from diator.events.serializers import (
+    DataclassFactoryEventSerializer,
+    IEventSerializer,
+    OrjsonEventSerializer,
+)
 
 __all__ = (
     "Event",
@@ -9,6 +30,23 @@ __all__ = (
     "ECSTEvent",
     "NotificationEvent",
     "EventEmitter",
+    "ErrorPolicy",
+    "EventHandlingError",
     "IEventHandler",
     "EventMap",
+    "IEmissionStrategy",
+    "SequentialEmission",
+    "ConcurrentEmission",
+    "GroupedEmission",
+    "EventEmissionError",
+    "BackgroundEmission",
+    "OverflowPolicy",
+    "EmissionQueueFull",
+    "IEventSerializer",
+    "OrjsonEventSerializer",
+    "DataclassFactoryEventSerializer",
+    "IEventDecoder",
+    "FactoryEventDecoder",
+    "UnknownMessageError",
+    "MessageTypeRegistry",
 )
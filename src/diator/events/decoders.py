@@ -0,0 +1,43 @@
+from typing import Iterable, Protocol, Type
+
+from dataclass_factory import Factory
+
+from diator.events.event import Event
+from diator.message_brokers.protocol import Message
+
+
+class UnknownMessageError(LookupError):
+    """
+    Raised when there is no event type registered for the message.
+    """
+
+    def __init__(self, message: Message) -> None:
+        super().__init__(f"There is no event type registered for {message.message_type} {message.message_name}.")
+        self.message = message
+
+
+class IEventDecoder(Protocol):
+    """
+    The interface of the decoder, which converts messages received from message brokers back to events.
+    """
+
+    def decode(self, message: Message) -> Event:
+        ...
+
+
+class FactoryEventDecoder(IEventDecoder):
+    """
+    Decodes messages to events of ``event_types`` by ``dataclass_factory``, the event type is looked up by
+    the message name, which is the name of the event class.
+    """
+
+    def __init__(self, event_types: Iterable[Type[Event]], factory: Factory | None = None) -> None:
+        self._event_types = {event_type.__name__: event_type for event_type in event_types}
+        self._factory = factory or Factory()
+
+    def decode(self, message: Message) -> Event:
+        event_type = self._event_types.get(message.message_name)
+        if event_type is None:
+            raise UnknownMessageError(message)
+
+        return self._factory.load(message.payload, event_type)
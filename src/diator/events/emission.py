@@ -0,0 +1,255 @@
+import asyncio
+import contextvars
+import enum
+import logging
+from typing import Awaitable, Iterable, Protocol
+
+from diator.concurrency import gather_limited
+from diator.containers.lifetime import scope
+from diator.events.event import ECSTEvent, Event, NotificationEvent
+from diator.events.event_emitter import ErrorPolicy, EventEmitter
+
+logger = logging.getLogger(__name__)
+
+
+class EventEmissionError(Exception):
+    """
+    Raised when one or more events failed to be emitted concurrently.
+    """
+
+    def __init__(self, exceptions: list[Exception]) -> None:
+        super().__init__(f"{len(exceptions)} event emission(s) failed.")
+        self.exceptions = exceptions
+
+
+class EmissionQueueFull(Exception):
+    """
+    Raised when the background emission queue is full and ``OverflowPolicy.RAISE`` is used.
+    """
+
+
+class OverflowPolicy(enum.Enum):
+    """
+    Defines what happens when events are emitted into a full background emission queue.
+
+    ``BLOCK`` waits until there is a free slot in the queue.
+    ``DROP_OLDEST`` drops the oldest pending event to free a slot.
+    ``RAISE`` raises ``EmissionQueueFull``.
+    """
+
+    BLOCK = "block"
+    DROP_OLDEST = "drop_oldest"
+    RAISE = "raise"
+
+
+class IEmissionStrategy(Protocol):
+    """
+    The interface of the strategy used by the mediator to emit events published by a request handler.
+    """
+
+    async def emit(self, event_emitter: EventEmitter, events: list[Event]) -> None:
+        ...
+
+
+class SequentialEmission(IEmissionStrategy):
+    """
+    Emits events one after another in the order they were published by the request handler.
+
+    An event is emitted only after all handlers of the previous event have finished
+    or the previous event has been sent to the message broker.
+    Consecutive Notification/ECST events are sent to the message broker as one batch.
+    The first failure stops the emission and the remaining events are not emitted.
+    """
+
+    async def emit(self, event_emitter: EventEmitter, events: list[Event]) -> None:
+        broker_events: list[NotificationEvent | ECSTEvent] = []
+        for event in events:
+            if isinstance(event, (NotificationEvent, ECSTEvent)):
+                broker_events.append(event)
+                continue
+
+            if broker_events:
+                await event_emitter.publish(broker_events)
+                broker_events = []
+
+            await event_emitter.emit(event)
+
+        if broker_events:
+            await event_emitter.publish(broker_events)
+
+
+class ConcurrentEmission(IEmissionStrategy):
+    """
+    Emits all events concurrently, at most ``limit`` events at a time.
+
+    There is no ordering guarantee between events.
+    All events are emitted even if some of them fail; failures are reported according to ``error_policy``.
+    """
+
+    def __init__(self, limit: int | None = None, *, error_policy: ErrorPolicy = ErrorPolicy.AGGREGATE) -> None:
+        self._limit = limit
+        self._error_policy = error_policy
+
+    async def emit(self, event_emitter: EventEmitter, events: list[Event]) -> None:
+        await _emit_concurrently((event_emitter.emit(event) for event in events), self._limit, self._error_policy)
+
+
+class GroupedEmission(IEmissionStrategy):
+    """
+    Groups events by category.
+
+    Domain events are handled in-process concurrently, at most ``limit`` events at a time,
+    without ordering guarantees between them.
+    Notification and ECST events are handed to the message broker as one batch, preserving their publication order.
+    The in-process group and the broker batch run concurrently.
+    Failures are reported according to ``error_policy``.
+    """
+
+    def __init__(self, limit: int | None = None, *, error_policy: ErrorPolicy = ErrorPolicy.AGGREGATE) -> None:
+        self._limit = limit
+        self._error_policy = error_policy
+
+    async def emit(self, event_emitter: EventEmitter, events: list[Event]) -> None:
+        local_events: list[Event] = []
+        broker_events: list[NotificationEvent | ECSTEvent] = []
+        for event in events:
+            if isinstance(event, (NotificationEvent, ECSTEvent)):
+                broker_events.append(event)
+            else:
+                local_events.append(event)
+
+        aws: list[Awaitable[None]] = [event_emitter.emit(event) for event in local_events]
+        if broker_events:
+            aws.append(event_emitter.publish(broker_events))
+
+        await _emit_concurrently(aws, self._limit, self._error_policy)
+
+
+class BackgroundEmission(IEmissionStrategy):
+    """
+    Puts events into a bounded queue and returns immediately, so the caller does not wait for event handling.
+
+    Events are emitted by a pool of ``workers`` background tasks, which are started on the first emission.
+    Workers do not inherit the context of the caller, so deadlines and trace spans of the request do not apply
+    to its events, and each event is emitted in its own ``scope``.
+    With a single worker events are emitted in the order they were queued,
+    with several workers there is no ordering guarantee between events.
+    Failures are logged and do not stop the workers.
+
+    The queue holds at most ``maxsize`` pending events, ``overflow`` defines what happens when it is full.
+    Call ``drain`` to wait for all queued events, and ``aclose`` on shutdown::
+
+      emission_strategy = BackgroundEmission(maxsize=10_000, workers=4, overflow=OverflowPolicy.DROP_OLDEST)
+      mediator = Mediator(request_map, container, event_emitter, emission_strategy=emission_strategy)
+      ...
+      await mediator.aclose()
+
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1000,
+        workers: int = 1,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be a positive integer.")
+
+        self._maxsize = maxsize
+        self._workers_count = workers
+        self._overflow = overflow
+        self._queue: asyncio.Queue[tuple[EventEmitter, Event]] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._closed = False
+
+    async def emit(self, event_emitter: EventEmitter, events: list[Event]) -> None:
+        if self._closed:
+            raise RuntimeError("BackgroundEmission is closed.")
+
+        queue = self._start()
+        for event in events:
+            item = (event_emitter, event)
+            if self._overflow is OverflowPolicy.BLOCK:
+                await queue.put(item)
+            elif self._overflow is OverflowPolicy.RAISE:
+                try:
+                    queue.put_nowait(item)
+                except asyncio.QueueFull:
+                    raise EmissionQueueFull(f"Background emission queue is full ({self._maxsize} events).") from None
+            else:
+                self._put_dropping_oldest(queue, item)
+
+    async def drain(self) -> None:
+        """
+        Waits until all queued events are emitted.
+        """
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def aclose(self) -> None:
+        """
+        Stops accepting events, waits until all queued events are emitted and stops the workers.
+        """
+        self._closed = True
+        await self.drain()
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _start(self) -> asyncio.Queue[tuple[EventEmitter, Event]]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(self._maxsize)
+            # Workers outlive the request, which starts them, so they are started in an empty context.
+            self._workers = [
+                contextvars.Context().run(asyncio.create_task, self._work(self._queue))
+                for _ in range(self._workers_count)
+            ]
+
+        return self._queue
+
+    @staticmethod
+    def _put_dropping_oldest(
+        queue: asyncio.Queue[tuple[EventEmitter, Event]], item: tuple[EventEmitter, Event]
+    ) -> None:
+        while True:
+            try:
+                queue.put_nowait(item)
+                return
+            except asyncio.QueueFull:
+                pass
+
+            try:
+                _, dropped = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                continue
+
+            queue.task_done()
+            logger.warning("Background emission queue is full, event %s is dropped", type(dropped).__name__)
+
+    @staticmethod
+    async def _work(queue: asyncio.Queue[tuple[EventEmitter, Event]]) -> None:
+        while True:
+            event_emitter, event = await queue.get()
+            try:
+                with scope():
+                    await event_emitter.emit(event)
+            except Exception:
+                logger.exception("Failed to emit event %s in background", type(event).__name__)
+            finally:
+                queue.task_done()
+
+
+async def _emit_concurrently(aws: Iterable[Awaitable[None]], limit: int | None, error_policy: ErrorPolicy) -> None:
+    results = await gather_limited(aws, limit)
+    exceptions = [result for result in results if isinstance(result, Exception)]
+    if not exceptions:
+        return
+
+    if error_policy is ErrorPolicy.AGGREGATE:
+        raise EventEmissionError(exceptions)
+
+    for exception in exceptions:
+        logger.error("Failed to emit event", exc_info=exception)
@@ -1,15 +1,48 @@
+import enum
 import logging
+import time
 from functools import singledispatchmethod
+from typing import Awaitable, Callable, Sequence, Type, TypeVar
 
-from dataclass_factory import Factory
-
+from diator.concurrency import gather_limited
 from diator.containers.protocol import Container
 from diator.events.event import DomainEvent, ECSTEvent, Event, NotificationEvent
+from diator.events.event_handler import IEventHandler
 from diator.events.map import EventMap
+from diator.events.serializers import IEventSerializer, OrjsonEventSerializer
 from diator.message_brokers.protocol import IMessageBroker, Message
+from diator.metrics import Metrics
+from diator.tracing import inject_context, start_span
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+EventListener = Callable[[DomainEvent], Awaitable[None]]
+
+
+class ErrorPolicy(enum.Enum):
+    """
+    Defines how failures of concurrently running event handlers are reported.
+
+    ``AGGREGATE`` waits for all handlers and raises ``EventHandlingError`` with every raised exception.
+    ``CONTINUE`` waits for all handlers, logs every raised exception and does not raise.
+    """
+
+    AGGREGATE = "aggregate"
+    CONTINUE = "continue"
+
+
+class EventHandlingError(Exception):
+    """
+    Raised when one or more concurrently running event handlers failed.
+    """
+
+    def __init__(self, event: Event, exceptions: list[Exception]) -> None:
+        super().__init__(f"{len(exceptions)} handler(s) failed to handle {type(event).__name__}.")
+        self.event = event
+        self.exceptions = exceptions
+
 
 class EventEmitter:
     """
@@ -31,6 +64,21 @@ class EventEmitter:
       # Sends event to the Redis Pub/Sub:
       await event_emitter.emit(user_joined_notification_event)
 
+    Handlers of a domain event are awaited one after another by default.
+    Pass ``concurrent=True`` to run them concurrently, optionally bounded by ``max_concurrency``;
+    failures are then reported according to ``error_policy``::
+
+      event_emitter = EventEmitter(event_map, container, concurrent=True, max_concurrency=4)
+
+    Payloads of Notification/ECST events are built by ``serializer``, ``OrjsonEventSerializer`` is used by default.
+
+    Pass ``metrics`` to record timings of event handlers and of sending messages to the message broker.
+
+    Listeners added by ``add_listener`` are awaited with every domain event before its handlers,
+    e.g. to invalidate cached query responses::
+
+      event_emitter.add_listener(caching_middleware.invalidate)
+
     """
 
     def __init__(
@@ -38,10 +86,25 @@ class EventEmitter:
         event_map: EventMap,
         container: Container,
         message_broker: IMessageBroker | None = None,
+        *,
+        concurrent: bool = False,
+        max_concurrency: int | None = None,
+        error_policy: ErrorPolicy = ErrorPolicy.AGGREGATE,
+        serializer: IEventSerializer | None = None,
+        metrics: Metrics | None = None,
     ) -> None:
         self._event_map = event_map
         self._container = container
         self._message_broker = message_broker
+        self._concurrent = concurrent
+        self._max_concurrency = max_concurrency
+        self._error_policy = error_policy
+        self._serializer = serializer or OrjsonEventSerializer()
+        self._metrics = metrics
+        self._listeners: list[EventListener] = []
+
+    def add_listener(self, listener: EventListener) -> None:
+        self._listeners.append(listener)
 
     @singledispatchmethod
     async def emit(self, event: Event) -> None:
@@ -49,23 +112,36 @@ class EventEmitter:
 
     @emit.register
     async def _(self, event: DomainEvent) -> None:
+        for listener in self._listeners:
+            await listener(event)
+
         handlers_types = self._event_map.get(type(event))
 
-        for handler_type in handlers_types:
-            handler = await self._container.resolve(handler_type)
-            logger.debug(
-                "Handling Event(%s) via event handler(%s)",
-                type(event).__name__,
-                handler_type.__name__,
-            )
-            await handler.handle(event)
+        if not self._concurrent or len(handlers_types) < 2:
+            for handler_type in handlers_types:
+                await self._handle(event, handler_type)
+            return
+
+        results = await gather_limited(
+            (self._handle(event, handler_type) for handler_type in handlers_types),
+            self._max_concurrency,
+        )
+        exceptions = [result for result in results if isinstance(result, Exception)]
+        if not exceptions:
+            return
+
+        if self._error_policy is ErrorPolicy.AGGREGATE:
+            raise EventHandlingError(event, exceptions)
+
+        for exception in exceptions:
+            logger.error("Failed to handle Event(%s)", type(event).__name__, exc_info=exception)
 
     @emit.register
     async def _(self, event: NotificationEvent) -> None:
         if not self._message_broker:
             raise RuntimeError("To use NotificationEvent, message_broker argument must be specified.")
 
-        message = _build_message(event)
+        message = self._build_message(event)
 
         logger.debug(
             "Sending Notification Event(%s) to message broker %s",
@@ -73,14 +149,14 @@ class EventEmitter:
             type(self._message_broker).__name__,
         )
 
-        await self._message_broker.send_message(message)
+        await self._send(self._message_broker.send_message, message)
 
     @emit.register
     async def _(self, event: ECSTEvent) -> None:
         if not self._message_broker:
             raise RuntimeError("To use ECSTEvent, message_broker argument must be specified.")
 
-        message = _build_message(event)
+        message = self._build_message(event)
 
         logger.debug(
             "Sending ECST event(%s) to message broker %s",
@@ -88,17 +164,80 @@ class EventEmitter:
             type(self._message_broker).__name__,
         )
 
-        await self._message_broker.send_message(message)
+        await self._send(self._message_broker.send_message, message)
+
+    async def publish(self, events: Sequence[NotificationEvent | ECSTEvent]) -> None:
+        """
+        Sends several Notification/ECST events to the message broker, preserving their order.
 
+        Several events are sent as one batch, if the message broker supports it.
+        """
+        if not events:
+            return
 
-def _build_message(event: NotificationEvent | ECSTEvent) -> Message:
-    factory = Factory()
+        if len(events) == 1:
+            await self.emit(events[0])
+            return
 
-    payload = factory.dump(event)
+        if not self._message_broker:
+            raise RuntimeError("To use NotificationEvent or ECSTEvent, message_broker argument must be specified.")
+
+        send_messages = getattr(self._message_broker, "send_messages", None)
+        if send_messages is None:
+            for event in events:
+                await self.emit(event)
+            return
 
-    return Message(
-        message_type=event._event_type,
-        message_name=type(event).__name__,
-        message_id=event.event_id,
-        payload=payload,
-    )
+        logger.debug(
+            "Sending %d events to message broker %s",
+            len(events),
+            type(self._message_broker).__name__,
+        )
+
+        await self._send(send_messages, [self._build_message(event) for event in events])
+
+    async def _handle(self, event: DomainEvent, handler_type: Type[IEventHandler]) -> None:
+        attributes = {"diator.event": type(event).__name__, "diator.handler": handler_type.__name__}
+        with start_span("diator.event_handler", attributes):
+            handler = await self._container.resolve(handler_type)
+            logger.debug(
+                "Handling Event(%s) via event handler(%s)",
+                type(event).__name__,
+                handler_type.__name__,
+            )
+            if self._metrics is None:
+                await handler.handle(event)
+                return
+
+            started = time.perf_counter()
+            try:
+                await handler.handle(event)
+            except Exception:
+                self._metrics.observe_event_handler(handler_type.__name__, time.perf_counter() - started, error=True)
+                raise
+            self._metrics.observe_event_handler(handler_type.__name__, time.perf_counter() - started)
+
+    async def _send(self, send: Callable[[T], Awaitable[None]], messages: T) -> None:
+        broker_name = type(self._message_broker).__name__
+        with start_span("diator.publish", {"diator.message_broker": broker_name}):
+            if self._metrics is None:
+                await send(messages)
+                return
+
+            started = time.perf_counter()
+            try:
+                await send(messages)
+            except Exception:
+                self._metrics.observe_publish(broker_name, time.perf_counter() - started, error=True)
+                raise
+            self._metrics.observe_publish(broker_name, time.perf_counter() - started)
+
+    def _build_message(self, event: NotificationEvent | ECSTEvent) -> Message:
+        message = Message(
+            message_type=event._event_type,
+            message_name=type(event).__name__,
+            message_id=event.event_id,
+            payload=self._serializer.dump(event),
+        )
+        inject_context(message.headers)
+        return message
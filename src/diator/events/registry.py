@@ -0,0 +1,180 @@
+import dataclasses
+import datetime
+import enum
+import sys
+import types
+import typing
+import uuid
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Sequence, Type
+
+from diator.events.decoders import IEventDecoder, UnknownMessageError
+from diator.events.event import Event
+from diator.events.map import EventMap
+from diator.message_brokers.protocol import Message
+
+Converter = Callable[[Any], Any]
+
+
+class MessageTypeRegistry(IEventDecoder):
+    """
+    The registry of event types, which decodes messages by loaders compiled once per event type.
+
+    Event types are looked up by the message type and the message name, which is the name of the event class.
+    The loader converts ``UUID``, ``datetime``, ``date``, ``time``, ``Decimal``, enum and nested dataclass fields,
+    including ones in lists, tuples, sets and dicts; other values are passed as decoded from JSON.
+
+    Usage::
+
+      registry = MessageTypeRegistry.from_event_map(event_map)
+      registry.register(MeetingArchivedECSTEvent)
+
+      event = registry.decode(message)
+      events = registry.decode_many(messages)
+
+    """
+
+    def __init__(self, event_types: Iterable[Type[Event]] = ()) -> None:
+        self._loaders: dict[tuple[str, str], _EventLoader] = {}
+        for event_type in event_types:
+            self.register(event_type)
+
+    @classmethod
+    def from_event_map(cls, event_map: EventMap) -> "MessageTypeRegistry":
+        """
+        Returns the registry of Notification/ECST event types bound to the event map.
+        """
+        return cls(event_type for event_type in event_map.get_events() if hasattr(event_type, "_event_type"))
+
+    def register(self, event_type: Type[Event], *, name: str | None = None) -> None:
+        """
+        Registers the event type for messages named ``name``, the name of the event class by default.
+        """
+        message_type = getattr(event_type, "_event_type", "")
+        self._loaders[(message_type, name or event_type.__name__)] = _EventLoader(event_type)
+
+    def decode(self, message: Message) -> Event:
+        loader = self._get_loader(message)
+        return loader.load(_load_payload(message))
+
+    def decode_many(self, messages: Sequence[Message]) -> list[Event | Exception]:
+        """
+        Decodes messages one by one, so a malformed message does not fail the others.
+
+        Returns an event or the raised exception for every message, in the order of ``messages``.
+        """
+        return [_try(self.decode, message) for message in messages]
+
+    def __contains__(self, message: Message) -> bool:
+        return (message.message_type, message.message_name) in self._loaders
+
+    def _get_loader(self, message: Message) -> "_EventLoader":
+        loader = self._loaders.get((message.message_type, message.message_name))
+        if loader is None:
+            raise UnknownMessageError(message)
+
+        return loader
+
+
+class _EventLoader:
+    def __init__(self, event_type: type) -> None:
+        self._event_type = event_type
+        hints = typing.get_type_hints(event_type)
+        fields = [field for field in dataclasses.fields(event_type) if field.init]
+        self._names = tuple(field.name for field in fields)
+        self._converters = tuple(
+            (field.name, converter)
+            for field in fields
+            if (converter := _compile_converter(hints.get(field.name, Any))) is not None
+        )
+
+    def load(self, data: dict) -> Any:
+        for name, convert in self._converters:
+            value = data.get(name)
+            if value is not None:
+                data[name] = convert(value)
+
+        return self._build(data)
+
+    def _build(self, data: dict) -> Any:
+        if len(data) == len(self._names):
+            try:
+                return self._event_type(**data)
+            except TypeError:
+                pass
+
+        return self._event_type(**{name: data[name] for name in self._names if name in data})
+
+
+def _compile_converter(hint: Any) -> Converter | None:
+    if hint is uuid.UUID:
+        return uuid.UUID
+    if hint is datetime.datetime:
+        return _parse_datetime
+    if hint is datetime.date:
+        return datetime.date.fromisoformat
+    if hint is datetime.time:
+        return datetime.time.fromisoformat
+    if hint is Decimal:
+        return Decimal
+    if isinstance(hint, type) and issubclass(hint, enum.Enum):
+        return hint
+    if dataclasses.is_dataclass(hint) and isinstance(hint, type):
+        loader = _EventLoader(hint)
+        return lambda value: loader.load(dict(value))
+
+    origin = typing.get_origin(hint)
+    args = typing.get_args(hint)
+
+    if origin is typing.Union or origin is types.UnionType:
+        not_none = [arg for arg in args if arg is not type(None)]
+        return _compile_converter(not_none[0]) if len(not_none) == 1 else None
+
+    if origin in (list, set, frozenset, tuple) or origin in (typing.Sequence, typing.AbstractSet):
+        if origin is tuple and args and args[-1] is not Ellipsis:
+            return _compile_fixed_tuple(args)
+
+        item = _compile_converter(args[0]) if args else None
+        container = origin if origin in (set, frozenset, tuple) else list
+        if item is None:
+            return None if container is list else container
+        return lambda values: container(item(value) for value in values)  # type: ignore
+
+    if origin is dict or origin is typing.Mapping:
+        value_converter = _compile_converter(args[1]) if len(args) == 2 else None
+        if value_converter is None:
+            return None
+        return lambda values: {key: value_converter(value) for key, value in values.items()}
+
+    return None
+
+
+def _compile_fixed_tuple(args: tuple) -> Converter:
+    converters = [_compile_converter(arg) or _identity for arg in args]
+    return lambda values: tuple(convert(value) for convert, value in zip(converters, values))
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+if sys.version_info >= (3, 11):
+    _parse_datetime = datetime.datetime.fromisoformat
+else:
+
+    def _parse_datetime(value: str) -> datetime.datetime:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.datetime.fromisoformat(value)
+
+
+def _load_payload(message: Message) -> dict:
+    # Loaders convert values in place, the message keeps its payload.
+    return dict(message.payload)
+
+
+def _try(load: Callable[[Any], Any], value: Any) -> Any:
+    try:
+        return load(value)
+    except Exception as exception:
+        return exception
@@ -0,0 +1,77 @@
+import dataclasses
+import operator
+from typing import Any, Callable, Protocol, Type
+
+from dataclass_factory import Factory
+
+from diator.events.event import Event
+
+Dumper = Callable[[Any], dict]
+
+
+class IEventSerializer(Protocol):
+    """
+    The interface of the serializer, which converts Notification/ECST events to message payloads.
+
+    ``dump`` returns the payload as a dict, which is set to messages sent to brokers.
+    """
+
+    def dump(self, event: Event) -> dict:
+        ...
+
+
+class OrjsonEventSerializer(IEventSerializer):
+    """
+    The default serializer.
+
+    Dumps an event to a dict of its field values and leaves ``UUID``, ``datetime``, nested dataclasses
+    and other orjson-native values as is, so they are encoded by orjson in a single pass, when the message is sent.
+    The dump function is compiled once per event type and cached.
+    Sets and ``Decimal`` values, which orjson does not support, are encoded as sorted lists and strings,
+    the same as by ``dataclass_factory``.
+    """
+
+    def __init__(self) -> None:
+        self._dumpers: dict[Type[Event], Dumper] = {}
+
+    def dump(self, event: Event) -> dict:
+        dumper = self._dumpers.get(type(event))
+        if dumper is None:
+            dumper = self._dumpers[type(event)] = _compile_dumper(type(event))
+
+        return dumper(event)
+
+
+class DataclassFactoryEventSerializer(IEventSerializer):
+    """
+    Dumps an event to a dict of JSON-compatible values by ``dataclass_factory``.
+
+    Use it, if payloads have to be plain JSON before they reach the message broker,
+    or events contain values, which are not supported by orjson.
+    The factory is created once and its serializer is cached per event type.
+    """
+
+    def __init__(self, factory: Factory | None = None) -> None:
+        self._factory = factory or Factory()
+        self._dumpers: dict[Type[Event], Dumper] = {}
+
+    def dump(self, event: Event) -> dict:
+        dumper = self._dumpers.get(type(event))
+        if dumper is None:
+            dumper = self._dumpers[type(event)] = self._factory.serializer(type(event))
+
+        return dumper(event)
+
+
+def _compile_dumper(event_type: Type[Event]) -> Dumper:
+    names = tuple(field.name for field in dataclasses.fields(event_type))
+
+    if not names:
+        return lambda event: {}
+
+    if len(names) == 1:
+        name = names[0]
+        return lambda event: {name: getattr(event, name)}
+
+    getter = operator.attrgetter(*names)
+    return lambda event: dict(zip(names, getter(event)))
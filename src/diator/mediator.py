@@ -1,14 +1,55 @@
-from typing import Protocol, Type, TypeVar, cast
+import asyncio
+import contextlib
+import contextvars
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Generic,
+    Mapping,
+    Protocol,
+    Sequence,
+    Type,
+    TypeVar,
+    cast,
+)
 
+from diator.concurrency import gather_limited
+from diator.containers.lifetime import scope
 from diator.containers.protocol import Container
+from diator.deadlines import RequestTimeoutError, deadline, remaining
 from diator.dispatchers import DefaultDispatcher, Dispatcher
-from diator.events import Event, EventEmitter
+from diator.dispatchers.dispatch_result import IDispatchResult
+from diator.events import Event, EventEmitter, IEmissionStrategy, SequentialEmission
 from diator.middlewares import MiddlewareChain
 from diator.requests import RequestMap
 from diator.requests.request import IRequest
 from diator.responses import IResponse
+from diator.tracing import start_span
 
 Res = TypeVar("Res", bound=IResponse | None, covariant=True)
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SendResult(Generic[Res]):
+    """
+    The result of a single request sent by ``Mediator.send_many``.
+
+    Holds either the response of the request or the exception raised while handling it.
+    """
+
+    response: Res | None = field(default=None)
+    exception: Exception | None = field(default=None)
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
 
 class IMediator(Protocol):
     """
@@ -43,6 +84,16 @@ class Mediator(IMediator):
       # Handles command and published events by the command handler.
       await mediator.send(join_user_command)
 
+    Events published by the handler are emitted by ``emission_strategy``,
+    ``SequentialEmission`` is used by default.
+
+    ``send`` is bounded by the timeout of the request type from ``timeouts`` or by the global ``timeout``.
+    The timeout covers handling of the request and emission of its events and sets the deadline,
+    which is visible to middlewares and handlers by ``diator.deadlines.remaining``.
+    If the deadline passes, the handling is cancelled and ``RequestTimeoutError`` is raised::
+
+      mediator = Mediator(request_map, container, timeout=5, timeouts={ReadMeetingQuery: 0.5})
+
     """
 
     def __init__(
@@ -53,17 +104,188 @@ class Mediator(IMediator):
         middleware_chain: MiddlewareChain | None = None,
         *,
         dispatcher_type: Type[Dispatcher] = DefaultDispatcher,
+        emission_strategy: IEmissionStrategy | None = None,
+        timeout: float | None = None,
+        timeouts: Mapping[Type[IRequest], float] | None = None,
     ) -> None:
         self._event_emitter = event_emitter
+        self._timeout = timeout
+        self._timeouts = dict(timeouts or {})
+        self._timed_out: Counter[str] = Counter()
+        self._emission_strategy = emission_strategy or SequentialEmission()
         self._dispatcher = dispatcher_type(
             request_map=request_map, container=container, middleware_chain=middleware_chain  # type: ignore
         )
 
+    @property
+    def timed_out(self) -> Mapping[str, int]:
+        """
+        The number of timed out requests by request type name.
+        """
+        return self._timed_out
+
     async def send(self, request: IRequest[Res]) -> Res:
+        timeout = self._timeouts.get(type(request), self._timeout)
+
+        with (
+            start_span("diator.send", {"diator.request": type(request).__name__}),
+            scope(),
+            deadline(timeout),
+        ):
+            return await self._before_deadline(request, timeout, self._send(request))
+
+    async def stream(self, request: IRequest[Res]) -> AsyncIterator[Res]:
+        """
+        Sends the request to a streaming request handler and yields results as they are produced.
+
+        Events published by the handler are emitted after the stream is exhausted.
+        Like ``send``, the stream is handled in its own scope and is bounded by the timeout of the request:
+        the deadline covers the whole stream, including the time the caller spends between items.
+        """
+        timeout = self._timeouts.get(type(request), self._timeout)
+
+        # The scope, the deadline and the span are set in a context of the stream, the handler runs in it
+        # and the caller's context is left as is between items.
+        context = contextvars.copy_context()
+        stack = contextlib.ExitStack()
+        context.run(stack.enter_context, start_span("diator.stream", {"diator.request": type(request).__name__}))
+        context.run(stack.enter_context, scope())
+        context.run(stack.enter_context, deadline(timeout))
+
+        items: AsyncIterator[Res] | None = None
+        try:
+            dispatch_result = await self._before_deadline(
+                request, timeout, self._dispatcher.dispatch_stream(request), context
+            )
+
+            items = dispatch_result.items
+            while True:
+                try:
+                    item = await self._before_deadline(request, timeout, anext(items), context)
+                except StopAsyncIteration:
+                    break
+                yield item
+
+            events = _take_events(dispatch_result)
+            if events:
+                await self._before_deadline(request, timeout, self._send_events(events), context)
+        except BaseException as exception:
+            await self._close_stream(items, context)
+            context.run(stack.__exit__, type(exception), exception, exception.__traceback__)
+            raise
+        else:
+            await self._close_stream(items, context)
+            context.run(stack.__exit__, None, None, None)
+
+    async def send_many(
+        self,
+        requests: Sequence[IRequest[Res]],
+        *,
+        concurrency: int | None = None,
+    ) -> list[SendResult[Res]]:
+        """
+        Sends requests concurrently, at most ``concurrency`` at a time.
+
+        Returns a ``SendResult`` for every request, in the order of ``requests``.
+        A failed request does not affect the others.
+        Every request is handled in its own scope and bounded by its own timeout like in ``send``,
+        timed out requests get ``RequestTimeoutError``.
+        Events of all successfully handled requests are emitted together in another scope after all requests
+        are handled, a failure during the emission is raised. The emission is bounded by the deadline
+        of the caller only.
+        """
+        dispatch_many = getattr(self._dispatcher, "dispatch_many", None)
+        timed = self._timeout is not None or self._timeouts or remaining() is not None
+        if dispatch_many is not None and not timed:
+            results = await dispatch_many(requests, concurrency)
+        else:
+            results = await gather_limited(
+                (self._dispatch_before_deadline(request) for request in requests), concurrency
+            )
+
+        events = [event for result in results if not isinstance(result, Exception) for event in _take_events(result)]
+        if events:
+            with scope():
+                await self._send_events(events)
+
+        return [
+            SendResult(exception=result) if isinstance(result, Exception) else SendResult(response=result.response)
+            for result in results
+        ]
+
+    async def drain(self) -> None:
+        """
+        Waits until all events emitted in background are handled.
+        """
+        drain = getattr(self._emission_strategy, "drain", None)
+        if drain is not None:
+            await drain()
+
+    async def aclose(self) -> None:
+        """
+        Waits until all events emitted in background are handled and releases the emission strategy resources.
+        """
+        aclose = getattr(self._emission_strategy, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def _dispatch_before_deadline(self, request: IRequest[Res]) -> IDispatchResult[Res]:
+        timeout = self._timeouts.get(type(request), self._timeout)
+
+        with scope(), deadline(timeout):
+            return await self._before_deadline(request, timeout, self._dispatcher.dispatch(request))
+
+    async def _before_deadline(
+        self,
+        request: IRequest,
+        timeout: float | None,
+        aw: Awaitable[T],
+        context: contextvars.Context | None = None,
+    ) -> T:
+        """
+        Awaits ``aw`` until the deadline of the current context, cancels it and raises ``RequestTimeoutError``
+        if the deadline passes.
+
+        If ``context`` is passed, ``aw`` runs in a task started in it and is bounded by its deadline.
+        """
+        if context is None:
+            seconds_left = remaining()
+            if seconds_left is None:
+                return await aw
+
+            task = asyncio.ensure_future(aw)
+        else:
+            seconds_left = context.run(remaining)
+            task = context.run(asyncio.ensure_future, aw)
+            if seconds_left is None:
+                return await task
+
+        try:
+            done, _ = await asyncio.wait((task,), timeout=seconds_left)
+        finally:
+            if not task.done():
+                task.cancel()
+                await asyncio.wait((task,))
+
+        if done:
+            return task.result()
+
+        self._timed_out[type(request).__name__] += 1
+        logger.warning("Handling of %s timed out", type(request).__name__)
+        raise RequestTimeoutError(request, timeout)
+
+    @staticmethod
+    async def _close_stream(items: AsyncIterator | None, context: contextvars.Context) -> None:
+        aclose = getattr(items, "aclose", None)
+        if aclose is not None:
+            await context.run(asyncio.ensure_future, aclose())
+
+    async def _send(self, request: IRequest[Res]) -> Res:
         dispatch_result = await self._dispatcher.dispatch(request)
 
-        if dispatch_result.events:
-            await self._send_events(dispatch_result.events.copy())
+        events = _take_events(dispatch_result)
+        if events:
+            await self._send_events(events)
 
         return cast(Res, dispatch_result.response)
 
@@ -71,6 +293,11 @@ class Mediator(IMediator):
         if not self._event_emitter:
             return
 
-        while events:
-            event = events.pop()
-            await self._event_emitter.emit(event)
+        await self._emission_strategy.emit(self._event_emitter, events)
+
+
+def _take_events(dispatch_result: IDispatchResult) -> list[Event]:
+    # The events list belongs to the handler, it is cleared, so a reused handler does not publish them again.
+    events = dispatch_result.events.copy()
+    dispatch_result.events.clear()
+    return events
@@ -1,24 +1,139 @@
-import orjson
+import asyncio
+import logging
+from typing import Sequence
+
 from azure.servicebus import ServiceBusMessage
-from azure.servicebus.aio import ServiceBusClient
+from azure.servicebus.aio import ServiceBusClient, ServiceBusSender
+from azure.servicebus.exceptions import MessageSizeExceededError
 
+from diator.message_brokers.encoding import (
+    CONTENT_ENCODING,
+    MessageEncoder,
+    message_headers,
+)
 from diator.message_brokers.protocol import IMessageBroker, Message
 
+logger = logging.getLogger(__name__)
+
 
 class AzureMessageBroker(IMessageBroker):
-    def __init__(self, client: ServiceBusClient, topic_name: str, *, timeout: float | None = None) -> None:
+    """
+    The message broker, which sends messages to an Azure Service Bus topic.
+
+    The connection and the topic sender are opened once, by ``start`` or lazily on the first message,
+    and reused until ``aclose`` is called::
+
+      message_broker = AzureMessageBroker(service_bus_client, topic_name, timeout=15)
+      await message_broker.start()
+      ...
+      await message_broker.aclose()
+
+    The broker can be used as an async context manager as well.
+    Batches are sent as ``ServiceBusMessageBatch``, split so that each one fits the size limit of the sender link.
+    Message bodies are encoded by ``encoder``, to JSON by default. The content type of the codec is set
+    to the ``content_type`` property and compressed bodies get the ``content_encoding`` application property,
+    consumers decode them by ``decode_body``.
+    """
+
+    def __init__(
+        self,
+        client: ServiceBusClient,
+        topic_name: str,
+        *,
+        timeout: float | None = None,
+        encoder: MessageEncoder | None = None,
+    ) -> None:
         self._client = client
         self._topic_name = topic_name
         self._timeout = timeout
+        self._encoder = encoder or MessageEncoder()
+        self._sender: ServiceBusSender | None = None
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        """
+        Opens the connection and the topic sender, if they are not opened yet.
+        """
+        await self._get_sender()
+
+    async def aclose(self) -> None:
+        """
+        Closes the topic sender and the connection.
+        """
+        async with self._lock:
+            if self._sender is None:
+                return
+
+            sender, self._sender = self._sender, None
+            try:
+                await sender.close()
+            finally:
+                await self._client.close()
+
+    async def __aenter__(self) -> "AzureMessageBroker":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
 
     async def send_message(self, message: Message) -> None:
-        async with self._client:
-            sender = self._client.get_topic_sender(self._topic_name)
+        sender = await self._get_sender()
+
+        service_bus_message = _parse_message(message, self._encoder)
+
+        await sender.send_messages(service_bus_message, timeout=self._timeout)
+
+    async def send_messages(self, messages: Sequence[Message]) -> None:
+        if not messages:
+            return
+
+        sender = await self._get_sender()
+
+        batch = await sender.create_message_batch()
+        for message in messages:
+            service_bus_message = _parse_message(message, self._encoder)
+            try:
+                batch.add_message(service_bus_message)
+                continue
+            except MessageSizeExceededError:
+                if not len(batch):
+                    raise
+
+            logger.debug("Sending batch of %d messages to Azure Service Bus.", len(batch))
+            await sender.send_messages(batch, timeout=self._timeout)
+
+            batch = await sender.create_message_batch()
+            batch.add_message(service_bus_message)
+
+        logger.debug("Sending batch of %d messages to Azure Service Bus.", len(batch))
+        await sender.send_messages(batch, timeout=self._timeout)
+
+    async def _get_sender(self) -> ServiceBusSender:
+        if self._sender is not None:
+            return self._sender
+
+        async with self._lock:
+            if self._sender is None:
+                await self._client.__aenter__()
+                sender = self._client.get_topic_sender(self._topic_name)
+                await sender.__aenter__()
+                self._sender = sender
 
-            service_bus_message = _parse_message(message)
+            return self._sender
 
-            await sender.send_messages(service_bus_message, timeout=self._timeout)
 
+def _parse_message(message: Message, encoder: MessageEncoder | None = None) -> ServiceBusMessage:
+    encoder = encoder or MessageEncoder()
+    body, content_encoding = encoder.encode_body(message)
+    application_properties = message_headers(message)
+    if content_encoding is not None:
+        application_properties[CONTENT_ENCODING] = content_encoding
 
-def _parse_message(message: Message) -> ServiceBusMessage:
-    return ServiceBusMessage(orjson.dumps(message), content_type="application/json")
+    return ServiceBusMessage(
+        body,
+        content_type=encoder.content_type,
+        message_id=str(message.message_id),
+        subject=message.message_name,
+        application_properties=application_properties,  # type: ignore
+    )
@@ -0,0 +1,82 @@
+from decimal import Decimal
+from typing import Any, Protocol
+
+import orjson
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+def json_default(value: Any) -> Any:
+    """
+    Encodes values, which orjson does not support, the way ``dataclass_factory`` does:
+    sets as sorted lists and ``Decimal`` as strings.
+    """
+    if isinstance(value, (set, frozenset)):
+        try:
+            return sorted(value)
+        except TypeError:
+            return list(value)
+    if isinstance(value, Decimal):
+        return str(value)
+
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class IMessageCodec(Protocol):
+    """
+    The interface of the codec, which converts message envelopes and payloads to bytes and back.
+
+    ``dumps`` accepts dicts of orjson-native values, e.g. ``UUID``, ``datetime`` and dataclasses,
+    ``loads`` returns plain values, which are equal to the ones decoded from JSON.
+    """
+
+    content_type: str
+
+    def dumps(self, value: Any) -> bytes:
+        ...
+
+    def loads(self, data: bytes) -> Any:
+        ...
+
+
+class JsonCodec(IMessageCodec):
+    """
+    The default codec, which encodes values to JSON by orjson.
+    """
+
+    content_type = JSON_CONTENT_TYPE
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=json_default)
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+_codecs: dict[str, IMessageCodec] = {JSON_CONTENT_TYPE: JsonCodec()}
+
+
+def register_codec(codec: IMessageCodec) -> None:
+    """
+    Registers the codec to decode messages of its content type.
+
+    JSON and msgpack codecs are available without registration.
+    """
+    _codecs[codec.content_type] = codec
+
+
+def get_codec(content_type: str) -> IMessageCodec:
+    """
+    Returns the codec registered for the content type.
+    """
+    codec = _codecs.get(content_type)
+    if codec is None and content_type == MSGPACK_CONTENT_TYPE:
+        from diator.message_brokers.msgpack import MsgpackCodec
+
+        codec = _codecs[content_type] = MsgpackCodec()
+
+    if codec is None:
+        raise ValueError(f"There is no codec registered for {content_type!r} content type.")
+
+    return codec
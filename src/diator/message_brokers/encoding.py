@@ -0,0 +1,263 @@
+import uuid
+import zlib
+from typing import Mapping
+
+import orjson
+
+from diator.message_brokers.codecs import (
+    JSON_CONTENT_TYPE,
+    IMessageCodec,
+    JsonCodec,
+    get_codec,
+    json_default,
+)
+from diator.message_brokers.protocol import Message
+
+CONTENT_TYPE = "content_type"
+CONTENT_ENCODING = "content_encoding"
+DEFLATE = "deflate"
+
+# Envelopes, which are not plain JSON, start with a zero byte, their content type and encoding,
+# e.g. b"\x00application/msgpack;deflate\x00", JSON envelopes start with "{".
+_FRAME_MARK = b"\x00"
+
+
+def with_encoded_payload(message: Message, encoded_payload: bytes) -> Message:
+    """
+    Attaches the JSON-encoded payload of the message, e.g. read from a broker, and returns the message.
+
+    The encoded payload is not a field of the message, so ``dataclasses.replace(message, payload=...)``
+    returns a message without it, and it is skipped by ``orjson.dumps(message)``.
+    """
+    object.__setattr__(message, "_encoded_payload", encoded_payload)
+    return message
+
+
+def encode_payload(message: Message) -> bytes:
+    """
+    Returns JSON-encoded payload of the message.
+
+    The payload attached by ``with_encoded_payload`` is returned as is.
+    """
+    encoded_payload = getattr(message, "_encoded_payload", None)
+    if encoded_payload is not None:
+        return encoded_payload
+
+    return orjson.dumps(message.payload, default=json_default)
+
+
+def encode_message(message: Message) -> bytes:
+    """
+    Returns JSON-encoded message envelope with ``message_type``, ``message_name``, ``message_id``, ``payload``
+    and ``headers``.
+
+    The encoded payload is embedded without being decoded or encoded again.
+    """
+    return b"".join(
+        (
+            b'{"message_type":',
+            orjson.dumps(message.message_type),
+            b',"message_name":',
+            orjson.dumps(message.message_name),
+            b',"message_id":',
+            orjson.dumps(message.message_id),
+            b',"payload":',
+            encode_payload(message),
+            b',"headers":',
+            orjson.dumps(message.headers),
+            b"}",
+        )
+    )
+
+
+def message_headers(message: Message) -> dict[str, str]:
+    """
+    Returns headers and envelope fields of the message, for brokers, which support message headers or properties.
+    """
+    return {
+        **message.headers,
+        "message_type": message.message_type,
+        "message_name": message.message_name,
+        "message_id": str(message.message_id),
+    }
+
+
+class MessageEncoder:
+    """
+    Encodes messages for message brokers by the codec, JSON by default.
+
+    Envelopes and payloads larger than ``compress_above`` bytes are compressed by zlib, compression is disabled
+    by default. The content type and the encoding are recorded in the envelope frame or in fields,
+    so ``decode_message`` and ``message_from_fields`` detect them::
+
+      encoder = MessageEncoder(MsgpackCodec(), compress_above=4096)
+      message_broker = RedisStreamsMessageBroker(redis_client, encoder=encoder)
+
+    JSON messages, which are not compressed, are encoded as before, byte for byte.
+    """
+
+    def __init__(
+        self,
+        codec: IMessageCodec | None = None,
+        *,
+        compress_above: int | None = None,
+        compress_level: int = 6,
+    ) -> None:
+        self._codec = codec or JsonCodec()
+        self._json = self._codec.content_type == JSON_CONTENT_TYPE
+        self._compress_above = compress_above
+        self._compress_level = compress_level
+
+    @property
+    def content_type(self) -> str:
+        return self._codec.content_type
+
+    def encode(self, message: Message) -> bytes:
+        """
+        Returns the encoded message envelope, see ``encode_message``.
+        """
+        data, content_encoding = self.encode_body(message)
+        if self._json and content_encoding is None:
+            return data
+
+        content_type = self._codec.content_type
+        if content_encoding is not None:
+            content_type = f"{content_type};{content_encoding}"
+
+        return b"".join((_FRAME_MARK, content_type.encode(), _FRAME_MARK, data))
+
+    def encode_body(self, message: Message) -> tuple[bytes, str | None]:
+        """
+        Returns the message envelope encoded by the codec without the frame and its content encoding,
+        ``None`` unless the envelope is compressed.
+
+        Used by brokers, which carry the content type and the encoding in message properties, e.g. Azure Service Bus,
+        see ``decode_body``.
+        """
+        if self._json:
+            data = encode_message(message)
+        else:
+            data = self._codec.dumps(
+                {
+                    "message_type": message.message_type,
+                    "message_name": message.message_name,
+                    "message_id": message.message_id,
+                    "payload": message.payload,
+                    "headers": message.headers,
+                }
+            )
+
+        if self._should_compress(data):
+            return zlib.compress(data, self._compress_level), DEFLATE
+
+        return data, None
+
+    def encode_fields(self, message: Message) -> dict[str, str | bytes]:
+        """
+        Returns headers, envelope fields and the encoded ``payload`` field of the message, e.g. for a Redis Streams
+        entry. ``content_type`` and ``content_encoding`` fields are added, unless the payload is plain JSON.
+        """
+        fields: dict[str, str | bytes] = {**message_headers(message)}
+        if self._json:
+            payload = encode_payload(message)
+        else:
+            payload = self._codec.dumps(message.payload)
+            fields[CONTENT_TYPE] = self._codec.content_type
+
+        if self._should_compress(payload):
+            payload = zlib.compress(payload, self._compress_level)
+            fields[CONTENT_ENCODING] = DEFLATE
+
+        fields["payload"] = payload
+        return fields
+
+    def _should_compress(self, data: bytes) -> bool:
+        return self._compress_above is not None and len(data) > self._compress_above
+
+
+_ENVELOPE_FIELDS = frozenset(("message_type", "message_name", "message_id", "payload", CONTENT_TYPE, CONTENT_ENCODING))
+
+
+def decode_message(data: bytes | str) -> Message:
+    """
+    Returns the message decoded from the envelope built by ``encode_message`` or ``MessageEncoder.encode``.
+
+    The payload is left decoded as a dict.
+    """
+    if isinstance(data, bytes) and data.startswith(_FRAME_MARK):
+        end = data.index(_FRAME_MARK, 1)
+        content_type, _, content_encoding = data[1:end].decode().partition(";")
+        return decode_body(data[end + 1 :], content_type, content_encoding or None)
+
+    return _from_envelope(orjson.loads(data))
+
+
+def decode_body(data: bytes, content_type: str | None = None, content_encoding: str | None = None) -> Message:
+    """
+    Returns the message decoded from the envelope built by ``MessageEncoder.encode_body``,
+    by the codec registered for ``content_type``, JSON by default.
+    """
+    if content_encoding is not None:
+        data = _decompress(data, content_encoding)
+
+    return _from_envelope(get_codec(content_type or JSON_CONTENT_TYPE).loads(data))
+
+
+def _from_envelope(envelope: dict) -> Message:
+    return Message(
+        message_type=envelope["message_type"],
+        message_name=envelope["message_name"],
+        message_id=uuid.UUID(envelope["message_id"]),
+        payload=envelope["payload"],
+        headers=envelope.get("headers") or {},
+    )
+
+
+def message_from_fields(fields: Mapping[bytes | str, bytes | str]) -> Message:
+    """
+    Returns the message built from headers and envelope fields and the encoded ``payload`` field,
+    e.g. from a Redis Streams entry.
+
+    The payload is decoded to a dict, a JSON-encoded payload is attached by ``with_encoded_payload`` as well.
+    """
+    decoded = {_to_str(key): value for key, value in fields.items()}
+    data = decoded["payload"]
+    if not isinstance(data, bytes):
+        data = data.encode()
+
+    content_encoding = decoded.get(CONTENT_ENCODING)
+    if content_encoding is not None:
+        data = _decompress(data, _to_str(content_encoding))
+
+    content_type = decoded.get(CONTENT_TYPE)
+    encoded_payload: bytes | None = None
+    if content_type is None or _to_str(content_type) == JSON_CONTENT_TYPE:
+        payload = orjson.loads(data)
+        encoded_payload = data
+    else:
+        payload = get_codec(_to_str(content_type)).loads(data)
+
+    message = Message(
+        message_type=_to_str(decoded["message_type"]),
+        message_name=_to_str(decoded["message_name"]),
+        message_id=uuid.UUID(_to_str(decoded["message_id"])),
+        payload=payload,
+        headers={key: _to_str(value) for key, value in decoded.items() if key not in _ENVELOPE_FIELDS},
+    )
+    if encoded_payload is not None:
+        with_encoded_payload(message, encoded_payload)
+
+    return message
+
+
+def _to_str(value: bytes | str) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _decompress(data: bytes, content_encoding: str) -> bytes:
+    if not content_encoding:
+        return data
+    if content_encoding != DEFLATE:
+        raise ValueError(f"Unsupported content encoding {content_encoding!r}.")
+
+    return zlib.decompress(data)
@@ -0,0 +1,53 @@
+import dataclasses
+import datetime
+import enum
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import msgpack  # type: ignore
+
+from diator.message_brokers.codecs import (
+    MSGPACK_CONTENT_TYPE,
+    IMessageCodec,
+    json_default,
+)
+
+
+class MsgpackCodec(IMessageCodec):
+    """
+    The codec, which encodes values to the compact binary MessagePack format.
+
+    ``UUID``, ``datetime``, ``date``, ``time``, ``Decimal`` and enum values are encoded as strings and numbers
+    the way orjson encodes them, so decoded payloads are the same as ones decoded from JSON.
+    Requires the ``msgpack`` package::
+
+      message_broker = RedisStreamsMessageBroker(redis_client, encoder=MessageEncoder(MsgpackCodec()))
+
+    """
+
+    content_type = MSGPACK_CONTENT_TYPE
+
+    def __init__(self) -> None:
+        self._packer = msgpack.Packer(default=_default, datetime=False)
+
+    def dumps(self, value: Any) -> bytes:
+        return self._packer.pack(value)
+
+    def loads(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, strict_map_key=False)
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, Decimal)):
+        return json_default(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+
+    raise TypeError(f"Type is not msgpack serializable: {type(value).__name__}")
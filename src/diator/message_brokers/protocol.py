@@ -1,14 +1,23 @@
 from dataclasses import dataclass, field
-from typing import Protocol
+from typing import Protocol, Sequence
 from uuid import UUID, uuid4
 
 
 @dataclass(frozen=True, kw_only=True)
 class Message:
+    """
+    The message sent to a message broker.
+
+    ``payload`` is a dict. Messages read from a broker or an outbox store keep the JSON-encoded payload as well,
+    see ``with_encoded_payload``, built-in brokers write it as is instead of encoding the payload again.
+    ``headers`` carry metadata, e.g. the trace context, and are sent along with the envelope fields.
+    """
+
     message_type: str = field()
     message_name: str = field()
     message_id: UUID = field(default_factory=uuid4)
     payload: dict = field()
+    headers: dict[str, str] = field(default_factory=dict)
 
 
 class IMessageBroker(Protocol):
@@ -20,3 +29,12 @@ class IMessageBroker(Protocol):
 
     async def send_message(self, message: Message) -> None:
         ...
+
+    async def send_messages(self, messages: Sequence[Message]) -> None:
+        """
+        Sends several messages, preserving their order.
+
+        Falls back to sending messages one by one, brokers override it to send a batch in one round trip.
+        """
+        for message in messages:
+            await self.send_message(message)
@@ -1,23 +1,153 @@
 import logging
+from typing import Callable, Mapping, Sequence
 
-import orjson
 from redis.asyncio import Redis
 
+from diator.message_brokers.encoding import MessageEncoder
 from diator.message_brokers.protocol import IMessageBroker, Message
 
 logger = logging.getLogger(__name__)
 
+ChannelNaming = Callable[[str, Message], str]
+
+
+def message_id_channel(prefix: str, message: Message) -> str:
+    """
+    One channel per message: ``prefix:message_type:message_id``.
+    """
+    return f"{prefix}:{message.message_type}:{message.message_id}"
+
+
+def message_name_channel(prefix: str, message: Message) -> str:
+    """
+    One channel per event class: ``prefix:message_type:message_name``.
+    """
+    return f"{prefix}:{message.message_type}:{message.message_name}"
+
+
+def message_type_channel(prefix: str, message: Message) -> str:
+    """
+    One channel per event type: ``prefix:message_type``.
+    """
+    return f"{prefix}:{message.message_type}"
+
 
 class RedisMessageBroker(IMessageBroker):
-    def __init__(self, client: Redis, *, channel_prefix: str | None = None) -> None:
+    """
+    The message broker, which publishes messages to Redis Pub/Sub.
+
+    Messages are published over pooled client connections, without subscribing to the channel.
+    The channel name is built by ``channel_naming`` from the prefix and the message,
+    ``message_id_channel`` is used by default. Messages are encoded by ``encoder``, to JSON by default::
+
+      message_broker = RedisMessageBroker(redis_client, channel_naming=message_name_channel)
+
+      # Subscriber side:
+      await pubsub.subscribe("python_diator_channel:notification_event:UserJoinedNotificationEvent")
+
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        channel_prefix: str | None = None,
+        channel_naming: ChannelNaming = message_id_channel,
+        encoder: MessageEncoder | None = None,
+    ) -> None:
         self._client = client
         self._channel_prefix = channel_prefix or "python_diator_channel"
+        self._channel_naming = channel_naming
+        self._encoder = encoder or MessageEncoder()
 
     async def send_message(self, message: Message) -> None:
-        async with self._client.pubsub() as pubsub:
-            channel = f"{self._channel_prefix}:{message.message_type}:{message.message_id}"
+        logger.debug("Sending message to Redis Pub/Sub %s.", message.message_id)
+        await self._client.publish(self._channel_naming(self._channel_prefix, message), self._encoder.encode(message))
+
+    async def send_messages(self, messages: Sequence[Message]) -> None:
+        if not messages:
+            return
+
+        async with self._client.pipeline(transaction=False) as pipeline:
+            for message in messages:
+                pipeline.publish(self._channel_naming(self._channel_prefix, message), self._encoder.encode(message))
+
+            logger.debug("Sending %d messages to Redis Pub/Sub.", len(messages))
+            await pipeline.execute()
+
+
+class RedisStreamsMessageBroker(IMessageBroker):
+    """
+    The message broker, which appends messages to Redis Streams.
+
+    Unlike Pub/Sub, stream entries are kept until they are trimmed,
+    so consumers, which were down while messages were published, can read them later.
+
+    Each message is appended by ``XADD`` with ``message_type``, ``message_name``, ``message_id``
+    and ``payload`` fields, encoded by ``encoder`` to JSON by default, and header fields.
+    Streams are trimmed with ``MAXLEN ~ maxlen`` (or exactly, if ``approximate=False``),
+    ``maxlen=None`` disables trimming.
+    The stream key is taken from ``stream_keys`` by message type, ``stream_prefix:message_type`` is used otherwise.
+    Batches are sent through pipelines of at most ``batch_size`` commands::
+
+      message_broker = RedisStreamsMessageBroker(
+          redis_client,
+          stream_keys={"ecst_event": "users:state"},
+          maxlen=100_000,
+      )
+
+    """
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        stream_prefix: str | None = None,
+        stream_keys: Mapping[str, str] | None = None,
+        maxlen: int | None = 10_000,
+        approximate: bool = True,
+        batch_size: int = 500,
+        encoder: MessageEncoder | None = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        self._client = client
+        self._stream_prefix = stream_prefix or "python_diator_stream"
+        self._stream_keys = dict(stream_keys or {})
+        self._maxlen = maxlen
+        self._approximate = approximate
+        self._batch_size = batch_size
+        self._encoder = encoder or MessageEncoder()
+
+    async def send_message(self, message: Message) -> None:
+        logger.debug("Sending message to Redis Stream %s.", message.message_id)
+        await self._client.xadd(
+            self._get_stream(message),
+            self._encoder.encode_fields(message),
+            maxlen=self._maxlen,
+            approximate=self._approximate,
+        )
+
+    async def send_messages(self, messages: Sequence[Message]) -> None:
+        for start in range(0, len(messages), self._batch_size):
+            batch = messages[start : start + self._batch_size]
+
+            async with self._client.pipeline(transaction=False) as pipeline:
+                for message in batch:
+                    pipeline.xadd(
+                        self._get_stream(message),
+                        self._encoder.encode_fields(message),
+                        maxlen=self._maxlen,
+                        approximate=self._approximate,
+                    )
+
+                logger.debug("Sending %d messages to Redis Streams.", len(batch))
+                await pipeline.execute()
 
-            await pubsub.subscribe(channel)
+    def _get_stream(self, message: Message) -> str:
+        stream = self._stream_keys.get(message.message_type)
+        if stream is None:
+            stream = self._stream_keys[message.message_type] = f"{self._stream_prefix}:{message.message_type}"
 
-            logger.debug("Sending message to Redis Pub/Sub %s.", message.message_id)
-            await self._client.publish(channel, orjson.dumps(message))
+        return stream
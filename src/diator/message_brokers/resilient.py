@@ -0,0 +1,207 @@
+import asyncio
+import enum
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Sequence, Type, TypeVar
+
+from diator.backoff import ExponentialBackoff
+from diator.deadlines import remaining
+from diator.message_brokers.protocol import IMessageBroker, Message
+from diator.outbox.store import IOutboxStore
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitState(enum.Enum):
+    """
+    ``CLOSED`` lets messages through.
+    ``OPEN`` rejects messages without calling the message broker.
+    ``HALF_OPEN`` lets one trial message through, its result closes or opens the circuit again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a message is rejected, because the circuit of the message broker is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Opens the circuit after ``failure_threshold`` consecutive failures and lets a trial call through
+    after ``reset_timeout`` seconds.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be a positive integer.")
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self._reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def allow(self) -> bool:
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
+        if state is CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._probing or self._failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+
+@dataclass(frozen=True)
+class ResilienceStats:
+    """
+    The counters of ``ResilientMessageBroker`` at the moment of the snapshot.
+    """
+
+    state: CircuitState = field()
+    retries: int = field(default=0)
+    failures: int = field(default=0)
+    rejected: int = field(default=0)
+    spilled: int = field(default=0)
+
+
+class ResilientMessageBroker(IMessageBroker):
+    """
+    The message broker wrapper, which retries failed sends and stops calling the message broker while it is down.
+
+    A failed send is retried at most ``max_retries`` times with ``backoff``, within the deadline of the request,
+    if there is one. Failures of every attempt are counted by ``circuit_breaker``; while the circuit is open,
+    messages are rejected immediately with ``CircuitOpenError``.
+
+    If ``spill`` is passed, messages, which could not be sent, are appended to it instead of raising.
+    Relay them to the wrapped message broker by ``OutboxRelay``::
+
+      spill = SqliteOutboxStore(sqlite3.connect("spill.db"))
+      message_broker = ResilientMessageBroker(redis_message_broker, max_retries=2, spill=spill)
+      spill_relay = OutboxRelay(spill, redis_message_broker, interval=5)
+
+    Counters are read by ``stats``.
+    """
+
+    def __init__(
+        self,
+        message_broker: IMessageBroker,
+        *,
+        max_retries: int = 3,
+        backoff: ExponentialBackoff | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        retry_on: tuple[Type[Exception], ...] = (Exception,),
+        spill: IOutboxStore | None = None,
+    ) -> None:
+        self._message_broker = message_broker
+        self._max_retries = max_retries
+        self._backoff = backoff or ExponentialBackoff()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._retry_on = retry_on
+        self._spill = spill
+        self._retries = 0
+        self._failures = 0
+        self._rejected = 0
+        self._spilled = 0
+
+    @property
+    def stats(self) -> ResilienceStats:
+        return ResilienceStats(
+            state=self._circuit_breaker.state,
+            retries=self._retries,
+            failures=self._failures,
+            rejected=self._rejected,
+            spilled=self._spilled,
+        )
+
+    async def send_message(self, message: Message) -> None:
+        await self._send(self._message_broker.send_message, message, [message])
+
+    async def send_messages(self, messages: Sequence[Message]) -> None:
+        if not messages:
+            return
+
+        send_messages = getattr(self._message_broker, "send_messages", None)
+        if send_messages is None:
+            for message in messages:
+                await self.send_message(message)
+            return
+
+        await self._send(send_messages, messages, messages)
+
+    async def _send(self, send: Callable[[T], Awaitable[None]], arg: T, messages: Sequence[Message]) -> None:
+        trial = self._circuit_breaker.state is CircuitState.HALF_OPEN
+        if not self._circuit_breaker.allow():
+            self._rejected += 1
+            await self._spill_or_raise(messages, CircuitOpenError(f"The circuit of {self._broker_name} is open."))
+            return
+
+        attempt = 0
+        while True:
+            try:
+                await send(arg)
+            except self._retry_on as exception:
+                self._circuit_breaker.record_failure()
+                attempt += 1
+
+                delay = self._backoff.delay(attempt)
+                seconds_left = remaining()
+                if (
+                    attempt > self._max_retries
+                    or self._circuit_breaker.state is CircuitState.OPEN
+                    or (seconds_left is not None and delay >= seconds_left)
+                ):
+                    self._failures += 1
+                    await self._spill_or_raise(messages, exception)
+                    return
+
+                self._retries += 1
+                logger.debug("Retrying sending to %s in %.3fs", self._broker_name, delay)
+                await asyncio.sleep(delay)
+            except BaseException:
+                # A trial call, which was cancelled or failed by an error that is not retried, opens
+                # the circuit again, otherwise every later call would be rejected as if the trial were running.
+                if trial:
+                    self._circuit_breaker.record_failure()
+                raise
+            else:
+                self._circuit_breaker.record_success()
+                return
+
+    async def _spill_or_raise(self, messages: Sequence[Message], exception: Exception) -> None:
+        if self._spill is None:
+            raise exception
+
+        logger.warning("Spilling %d messages of %s", len(messages), self._broker_name, exc_info=exception)
+        await self._spill.add([("", message) for message in messages])
+        self._spilled += len(messages)
+
+    @property
+    def _broker_name(self) -> str:
+        return type(self._message_broker).__name__
@@ -0,0 +1,110 @@
+import bisect
+from dataclasses import dataclass, field
+from typing import Sequence
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass(frozen=True)
+class TimingSnapshot:
+    """
+    The state of one timing at the moment of the snapshot.
+
+    ``buckets`` holds pairs of the upper bound in seconds and the cumulative number of observations
+    less than or equal to it, the last bound is ``inf``, as expected by Prometheus histograms.
+    """
+
+    count: int = field()
+    errors: int = field()
+    sum: float = field()
+    buckets: tuple[tuple[float, int], ...] = field()
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """
+    The state of all timings at the moment of the snapshot, by request type, event handler and message broker name.
+    """
+
+    requests: dict[str, TimingSnapshot] = field(default_factory=dict)
+    event_handlers: dict[str, TimingSnapshot] = field(default_factory=dict)
+    publishes: dict[str, TimingSnapshot] = field(default_factory=dict)
+
+
+class Timing:
+    """
+    The counter of observations, failed observations and the histogram of their durations.
+    """
+
+    __slots__ = ("_bounds", "_counts", "_errors", "_sum")
+
+    def __init__(self, bounds: Sequence[float]) -> None:
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._errors = 0
+        self._sum = 0.0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        self._counts[bisect.bisect_left(self._bounds, seconds)] += 1
+        self._sum += seconds
+        if error:
+            self._errors += 1
+
+    def snapshot(self) -> TimingSnapshot:
+        buckets = []
+        cumulative = 0
+        for bound, count in zip((*self._bounds, float("inf")), self._counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+
+        return TimingSnapshot(count=cumulative, errors=self._errors, sum=self._sum, buckets=tuple(buckets))
+
+
+class Metrics:
+    """
+    The storage of request, event handler and message broker publish timings.
+
+    Observations only increment counters of preallocated buckets, so recording is cheap.
+    Timings are read by ``snapshot``, e.g. by a Prometheus exporter::
+
+      metrics = Metrics()
+      middleware_chain.add(InstrumentationMiddleware(metrics))
+      event_emitter = EventEmitter(event_map, container, message_broker, metrics=metrics)
+
+      snapshot = metrics.snapshot()
+      snapshot.requests["ReadMeetingQuery"].count
+
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._requests: dict[str, Timing] = {}
+        self._event_handlers: dict[str, Timing] = {}
+        self._publishes: dict[str, Timing] = {}
+
+    def observe_request(self, name: str, seconds: float, error: bool = False) -> None:
+        self._get(self._requests, name).observe(seconds, error)
+
+    def observe_event_handler(self, name: str, seconds: float, error: bool = False) -> None:
+        self._get(self._event_handlers, name).observe(seconds, error)
+
+    def observe_publish(self, name: str, seconds: float, error: bool = False) -> None:
+        self._get(self._publishes, name).observe(seconds, error)
+
+    def snapshot(self) -> MetricsSnapshot:
+        return MetricsSnapshot(
+            requests={name: timing.snapshot() for name, timing in self._requests.items()},
+            event_handlers={name: timing.snapshot() for name, timing in self._event_handlers.items()},
+            publishes={name: timing.snapshot() for name, timing in self._publishes.items()},
+        )
+
+    def reset(self) -> None:
+        self._requests.clear()
+        self._event_handlers.clear()
+        self._publishes.clear()
+
+    def _get(self, timings: dict[str, Timing], name: str) -> Timing:
+        timing = timings.get(name)
+        if timing is None:
+            timing = timings[name] = Timing(self._bounds)
+        return timing
@@ -1,3 +1,20 @@
 from diator.middlewares.base import IMiddleware, MiddlewareChain
+from diator.middlewares.caching import (
+    CachingMiddleware,
+    ICacheBackend,
+    InMemoryCacheBackend,
+    request_key,
+)
+from diator.middlewares.coalescing import CoalescingMiddleware
+from diator.middlewares.instrumentation import InstrumentationMiddleware
 
-__all__ = ("IMiddleware", "MiddlewareChain")
+__all__ = (
+    "IMiddleware",
+    "MiddlewareChain",
+    "CachingMiddleware",
+    "CoalescingMiddleware",
+    "ICacheBackend",
+    "InstrumentationMiddleware",
+    "InMemoryCacheBackend",
+    "request_key",
+)
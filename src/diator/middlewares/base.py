@@ -20,12 +20,26 @@ Handle = Callable[[Req], Awaitable[Res]]
 class MiddlewareChain:
     def __init__(self) -> None:
         self._chain: list[IMiddleware] = []
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented on every change of the chain, so compiled pipelines can detect that they are stale.
+        """
+        return self._version
+
+    @property
+    def middlewares(self) -> tuple[IMiddleware, ...]:
+        return tuple(self._chain)
 
     def set(self, chain: list[IMiddleware]) -> None:
-        self._chain = chain
+        self._chain = list(chain)
+        self._version += 1
 
     def add(self, middleware: IMiddleware) -> None:
         self._chain.append(middleware)
+        self._version += 1
 
     def wrap(self, handle: Handle) -> Handle:
         for middleware in reversed(self._chain):
@@ -0,0 +1,181 @@
+import copy
+import dataclasses
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Iterable, Mapping, Protocol, Type, TypeVar
+
+import orjson
+
+from diator.events.event import DomainEvent, Event
+from diator.message_brokers.codecs import json_default
+from diator.requests.request import IRequest
+from diator.responses import IResponse
+
+Req = TypeVar("Req", bound=IRequest, contravariant=True)
+Res = TypeVar("Res", bound=IResponse | None, covariant=True)
+HandleType = Callable[[Req], Awaitable[Res]]
+
+
+class ICacheBackend(Protocol):
+    """
+    The interface of the storage of cached responses.
+
+    Entries are tagged by request type, so all responses to a request type can be invalidated at once.
+    """
+
+    async def get(self, key: str) -> Any | None:
+        ...
+
+    async def set(self, key: str, value: Any, *, ttl: float | None, tag: str) -> None:
+        ...
+
+    async def invalidate(self, tag: str) -> None:
+        ...
+
+
+class InMemoryCacheBackend(ICacheBackend):
+    """
+    The in-process cache backend, which keeps at most ``maxsize`` entries and evicts the least recently used ones.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer.")
+
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float | None, Any, str]] = OrderedDict()
+        self._tags: defaultdict[str, set[str]] = defaultdict(set)
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value, tag = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._delete(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, *, ttl: float | None, tag: str) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value, tag)
+        self._entries.move_to_end(key)
+        self._tags[tag].add(key)
+
+        while len(self._entries) > self._maxsize:
+            self._delete(next(iter(self._entries)))
+
+    async def invalidate(self, tag: str) -> None:
+        for key in self._tags.pop(tag, ()):
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _delete(self, key: str) -> None:
+        _, _, tag = self._entries.pop(key)
+        keys = self._tags.get(tag)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._tags[tag]
+
+
+class CachingMiddleware:
+    """
+    The middleware, which caches responses to idempotent queries.
+
+    Only requests of ``request_types`` are cached.
+    The cache key is built from the request type and the values of all request fields, except ``request_id``,
+    requests, whose key could not be built, are handled without caching.
+    ``None`` responses are not cached. Every caller gets its own deep copy of the cached response,
+    so changing nested lists or dicts of a response does not change the cache.
+
+    ``invalidate_on`` maps domain event types to request types, whose cached responses become stale,
+    when such an event is emitted. Register ``invalidate`` as a listener of the event emitter to enable it::
+
+      caching_middleware = CachingMiddleware(
+          [ReadMeetingQuery],
+          ttl=30,
+          invalidate_on={UserJoinedDomainEvent: [ReadMeetingQuery]},
+      )
+      middleware_chain.add(caching_middleware)
+      event_emitter.add_listener(caching_middleware.invalidate)
+
+    """
+
+    def __init__(
+        self,
+        request_types: Iterable[Type[IRequest]],
+        backend: ICacheBackend | None = None,
+        *,
+        ttl: float | None = 60,
+        invalidate_on: Mapping[Type[DomainEvent], Iterable[Type[IRequest]]] | None = None,
+    ) -> None:
+        self._request_types = frozenset(request_types)
+        self._backend = backend or InMemoryCacheBackend()
+        self._ttl = ttl
+        self._invalidate_on = {
+            event_type: tuple(_tag(request_type) for request_type in request_types)
+            for event_type, request_types in (invalidate_on or {}).items()
+        }
+
+    async def __call__(self, request: IRequest[Res], handle: HandleType) -> Res:
+        if type(request) not in self._request_types:
+            return await handle(request)
+
+        try:
+            key = request_key(request)
+        except TypeError:
+            return await handle(request)
+
+        cached = await self._backend.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        response = await handle(request)
+
+        if response is not None:
+            await self._backend.set(key, copy.deepcopy(response), ttl=self._ttl, tag=_tag(type(request)))
+
+        return response
+
+    async def invalidate(self, event: Event) -> None:
+        """
+        Drops cached responses to request types, which are configured to be invalidated by the event type.
+        """
+        for tag in self._invalidate_on.get(type(event), ()):  # type: ignore
+            await self._backend.invalidate(tag)
+
+
+_fields: dict[type, tuple[str, ...]] = {}
+
+
+def request_key(request: IRequest) -> str:
+    """
+    Builds the key of the request from its type and the values of its fields, except ``request_id``.
+
+    Keys of dicts and items of sets are sorted, so equal requests have equal keys.
+    Raises ``TypeError``, if a value cannot be encoded to JSON.
+    """
+    request_type = type(request)
+
+    names = _fields.get(request_type)
+    if names is None:
+        names = _fields[request_type] = tuple(
+            field.name for field in dataclasses.fields(request_type) if field.name != "request_id"  # type: ignore
+        )
+
+    values = orjson.dumps(
+        [getattr(request, name) for name in names],
+        default=json_default,
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return f"{_tag(request_type)}:{values.decode()}"
+
+
+def _tag(request_type: type) -> str:
+    return f"{request_type.__module__}.{request_type.__qualname__}"
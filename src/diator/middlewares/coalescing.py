@@ -0,0 +1,71 @@
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, Iterable, Type, TypeVar
+
+from diator.middlewares.caching import request_key
+from diator.requests.request import IRequest
+from diator.responses import IResponse
+
+Req = TypeVar("Req", bound=IRequest, contravariant=True)
+Res = TypeVar("Res", bound=IResponse | None, covariant=True)
+HandleType = Callable[[Req], Awaitable[Res]]
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Future[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class CoalescingMiddleware:
+    """
+    The middleware, which shares one in-flight handling among concurrent equal requests.
+
+    Only requests of ``request_types`` are coalesced, requests are equal if their ``request_key`` is equal,
+    requests, whose key could not be built, are handled on their own.
+    The first request is handled, later requests wait for its response or its exception.
+    A cancelled waiter does not affect the others, the handling is cancelled only when every waiter is cancelled.
+    Events are published only by the handler of the first request, so coalesce only idempotent queries.
+
+    Usage::
+
+      middleware_chain.add(CoalescingMiddleware([ReadMeetingQuery]))
+
+    Add it after ``CachingMiddleware`` to coalesce requests, which missed the cache.
+
+    """
+
+    def __init__(self, request_types: Iterable[Type[IRequest]]) -> None:
+        self._request_types = frozenset(request_types)
+        self._in_flight: dict[str, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def __call__(self, request: IRequest[Res], handle: HandleType) -> Res:
+        if type(request) not in self._request_types:
+            return await handle(request)
+
+        try:
+            key = request_key(request)
+        except TypeError:
+            return await handle(request)
+
+        flight = self._in_flight.get(key)
+        if flight is None:
+            flight = self._in_flight[key] = _Flight(asyncio.ensure_future(handle(request)))
+            flight.task.add_done_callback(functools.partial(self._land, key, flight))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                self._land(key, flight, flight.task)
+                flight.task.cancel()
+
+    def _land(self, key: str, flight: _Flight, task: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
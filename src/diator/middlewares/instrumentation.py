@@ -0,0 +1,36 @@
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from diator.metrics import Metrics
+from diator.requests.request import IRequest
+from diator.responses import IResponse
+
+Req = TypeVar("Req", bound=IRequest, contravariant=True)
+Res = TypeVar("Res", bound=IResponse | None, covariant=True)
+HandleType = Callable[[Req], Awaitable[Res]]
+
+
+class InstrumentationMiddleware:
+    """
+    The middleware, which records the number of handled requests, failures and latencies by request type.
+
+    Cancelled requests are not recorded. Timings are read by ``Metrics.snapshot``::
+
+      metrics = Metrics()
+      middleware_chain.add(InstrumentationMiddleware(metrics))
+
+    """
+
+    def __init__(self, metrics: Metrics | None = None) -> None:
+        self.metrics = metrics or Metrics()
+
+    async def __call__(self, request: IRequest[Res], handle: HandleType) -> Res:
+        started = time.perf_counter()
+        try:
+            response = await handle(request)
+        except Exception:
+            self.metrics.observe_request(type(request).__name__, time.perf_counter() - started, error=True)
+            raise
+
+        self.metrics.observe_request(type(request).__name__, time.perf_counter() - started)
+        return response
@@ -0,0 +1,19 @@
+from diator.outbox.broker import OrderingKey, OutboxMessageBroker, single_ordering_key
+from diator.outbox.relay import OutboxRelay
+from diator.outbox.store import (
+    InMemoryOutboxStore,
+    IOutboxStore,
+    OutboxRecord,
+    SqliteOutboxStore,
+)
+
+__all__ = (
+    "OrderingKey",
+    "OutboxMessageBroker",
+    "single_ordering_key",
+    "OutboxRelay",
+    "InMemoryOutboxStore",
+    "IOutboxStore",
+    "OutboxRecord",
+    "SqliteOutboxStore",
+)
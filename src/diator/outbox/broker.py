@@ -0,0 +1,59 @@
+from typing import Callable, Sequence
+
+from diator.message_brokers.protocol import IMessageBroker, Message
+from diator.outbox.store import IOutboxStore
+
+OrderingKey = Callable[[Message], str]
+
+
+def single_ordering_key(message: Message) -> str:
+    """
+    Relays all messages in the order they were added.
+    """
+    return ""
+
+
+class OutboxMessageBroker(IMessageBroker):
+    """
+    The message broker, which appends messages to the outbox store instead of sending them.
+
+    Messages are sent to the real message broker later by ``OutboxRelay``,
+    so the broker latency and outages do not affect handling of requests.
+
+    Messages with the same key returned by ``ordering_key`` are relayed in order. A failed batch postpones
+    every key in that batch, later batches with other keys are relayed meanwhile. All messages share one key
+    by default.
+    ``notify`` is called after messages are added, e.g. to wake the relay up::
+
+      message_broker = OutboxMessageBroker(
+          outbox_store,
+          ordering_key=lambda message: str(message.payload["meeting_id"]),
+          notify=outbox_relay.notify,
+      )
+      event_emitter = EventEmitter(event_map, container, message_broker)
+
+    """
+
+    def __init__(
+        self,
+        store: IOutboxStore,
+        *,
+        ordering_key: OrderingKey = single_ordering_key,
+        notify: Callable[[], None] | None = None,
+    ) -> None:
+        self._store = store
+        self._ordering_key = ordering_key
+        self._notify = notify
+
+    async def send_message(self, message: Message) -> None:
+        await self._store.add([(self._ordering_key(message), message)])
+        if self._notify is not None:
+            self._notify()
+
+    async def send_messages(self, messages: Sequence[Message]) -> None:
+        if not messages:
+            return
+
+        await self._store.add([(self._ordering_key(message), message) for message in messages])
+        if self._notify is not None:
+            self._notify()
@@ -0,0 +1,159 @@
+import asyncio
+import contextlib
+import logging
+import time
+from collections import defaultdict
+from typing import Sequence
+
+from diator.backoff import ExponentialBackoff
+from diator.message_brokers.protocol import IMessageBroker, Message
+from diator.outbox.store import IOutboxStore, OutboxRecord
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Sends messages from the outbox store to the message broker in the background.
+
+    Every ``interval`` seconds or when ``notify`` is called, the relay sends batches of at most ``batch_size``
+    messages, until there are no messages available.
+    Sent messages are deleted from the store, so every message is sent at least once.
+    A failed batch is retried with ``backoff``; after ``max_attempts`` failed attempts messages are dropped
+    and logged, ``None`` retries forever::
+
+      outbox_relay = OutboxRelay(SqliteOutboxStore(sqlite3.connect("app.db")), redis_message_broker)
+
+      async with outbox_relay:
+          ...
+
+    Run a single relay per outbox store.
+    """
+
+    def __init__(
+        self,
+        store: IOutboxStore,
+        message_broker: IMessageBroker,
+        *,
+        batch_size: int = 100,
+        interval: float = 1.0,
+        backoff: ExponentialBackoff | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+
+        self._store = store
+        self._message_broker = message_broker
+        self._batch_size = batch_size
+        self._interval = interval
+        self._backoff = backoff or ExponentialBackoff()
+        self._max_attempts = max_attempts
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def notify(self) -> None:
+        """
+        Wakes the relay up to send new messages without waiting for the next interval.
+        """
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self.run())
+
+    async def aclose(self) -> None:
+        """
+        Stops the relay. Messages, which were not sent yet, stay in the store.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def __aenter__(self) -> "OutboxRelay":
+        self.start()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.drain()
+            except Exception:
+                logger.exception("Failed to relay outbox messages")
+
+            await self._sleep()
+
+    async def drain(self) -> int:
+        """
+        Sends batches, until there are no messages available, and returns the number of sent messages.
+        """
+        total = 0
+        while True:
+            sent = await self.relay_once()
+            total += sent
+            if sent < self._batch_size:
+                return total
+
+    async def relay_once(self) -> int:
+        """
+        Sends one batch of available messages and returns the number of sent messages.
+        """
+        records = await self._store.fetch(self._batch_size)
+        if not records:
+            return 0
+
+        try:
+            await self._send([record.message for record in records])
+        except Exception:
+            logger.warning("Failed to send %d outbox messages", len(records), exc_info=True)
+            await self._retry(records)
+            return 0
+
+        await self._store.delete([record.id for record in records])
+        return len(records)
+
+    async def _send(self, messages: Sequence[Message]) -> None:
+        send_messages = getattr(self._message_broker, "send_messages", None)
+        if send_messages is not None:
+            await send_messages(messages)
+            return
+
+        for message in messages:
+            await self._message_broker.send_message(message)
+
+    async def _retry(self, records: Sequence[OutboxRecord]) -> None:
+        by_attempts: defaultdict[int, list[int]] = defaultdict(list)
+        dropped = []
+        for record in records:
+            attempts = record.attempts + 1
+            if self._max_attempts is not None and attempts >= self._max_attempts:
+                dropped.append(record)
+            else:
+                by_attempts[attempts].append(record.id)
+
+        if dropped:
+            for record in dropped:
+                logger.error(
+                    "Dropping outbox message %s after %d attempts", record.message.message_id, record.attempts + 1
+                )
+            await self._store.delete([record.id for record in dropped])
+
+        now = time.time()
+        for attempts, ids in by_attempts.items():
+            await self._store.retry(ids, now + self._backoff.delay(attempts))
+
+    async def _sleep(self) -> None:
+        if self._wakeup is None:
+            await asyncio.sleep(self._interval)
+            return
+
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._wakeup.wait(), self._interval)
+        self._wakeup.clear()
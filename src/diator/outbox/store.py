@@ -0,0 +1,212 @@
+import dataclasses
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Protocol, Sequence
+
+import orjson
+
+from diator.message_brokers.encoding import encode_payload, with_encoded_payload
+from diator.message_brokers.protocol import Message
+
+
+@dataclass(frozen=True, kw_only=True)
+class OutboxRecord:
+    """
+    The message stored in the outbox.
+
+    Records with the same ``ordering_key`` are relayed in the order they were added.
+    """
+
+    id: int = field()
+    message: Message = field()
+    ordering_key: str = field(default="")
+    attempts: int = field(default=0)
+
+
+class IOutboxStore(Protocol):
+    """
+    The interface of the storage of messages, which are waiting to be sent to the message broker.
+    """
+
+    async def add(self, entries: Sequence[tuple[str, Message]]) -> None:
+        """
+        Appends messages with their ordering keys.
+        """
+        ...
+
+    async def fetch(self, limit: int) -> list[OutboxRecord]:
+        """
+        Returns at most ``limit`` oldest records, which are available for sending, ordered by their ids.
+
+        A record is not returned, if an older record with the same ordering key waits for a retry.
+        """
+        ...
+
+    async def delete(self, ids: Sequence[int]) -> None:
+        ...
+
+    async def retry(self, ids: Sequence[int], available_at: float) -> None:
+        """
+        Increments the number of attempts of records and postpones them until ``available_at`` (``time.time``).
+        """
+        ...
+
+
+class InMemoryOutboxStore(IOutboxStore):
+    """
+    The outbox store, which keeps records in the process memory, e.g. for tests.
+
+    Records are lost on restart, use a persistent store in production.
+    """
+
+    def __init__(self) -> None:
+        self._records: dict[int, tuple[OutboxRecord, float]] = {}
+        self._last_id = 0
+
+    async def add(self, entries: Sequence[tuple[str, Message]]) -> None:
+        for ordering_key, message in entries:
+            self._last_id += 1
+            self._records[self._last_id] = (
+                OutboxRecord(id=self._last_id, message=message, ordering_key=ordering_key),
+                0.0,
+            )
+
+    async def fetch(self, limit: int) -> list[OutboxRecord]:
+        now = time.time()
+        blocked: set[str] = set()
+        records: list[OutboxRecord] = []
+
+        for record, available_at in self._records.values():
+            if len(records) >= limit:
+                break
+            if record.ordering_key in blocked:
+                continue
+            if available_at > now:
+                blocked.add(record.ordering_key)
+                continue
+            records.append(record)
+
+        return records
+
+    async def delete(self, ids: Sequence[int]) -> None:
+        for id_ in ids:
+            self._records.pop(id_, None)
+
+    async def retry(self, ids: Sequence[int], available_at: float) -> None:
+        for id_ in ids:
+            if id_ in self._records:
+                record, _ = self._records[id_]
+                self._records[id_] = (dataclasses.replace(record, attempts=record.attempts + 1), available_at)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class SqliteOutboxStore(IOutboxStore):
+    """
+    The outbox store, which keeps records in a SQLite table.
+
+    Pass the connection used by your handlers and ``commit=False`` to append messages within their transaction,
+    so messages are stored only if the transaction is committed::
+
+      connection = sqlite3.connect("app.db")
+      outbox_store = SqliteOutboxStore(connection, commit=False)
+
+    ``Mediator`` emits events after the handler returns, so with ``commit=False`` the caller commits
+    the transaction after ``mediator.send`` returns, not the handler. ``BackgroundEmission`` emits events
+    after the request and is not supported with ``commit=False``.
+    The relay deletes and postpones records committing immediately, so give it a store with its own connection.
+    The table is created if it does not exist. SQLite calls are blocking, but fast for local databases.
+    """
+
+    def __init__(
+        self,
+        connection: sqlite3.Connection,
+        *,
+        table: str = "diator_outbox",
+        commit: bool = True,
+    ) -> None:
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table!r}.")
+
+        self._connection = connection
+        self._table = table
+        self._commit = commit
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "ordering_key TEXT NOT NULL, "
+            "message_type TEXT NOT NULL, "
+            "message_name TEXT NOT NULL, "
+            "message_id TEXT NOT NULL, "
+            "payload BLOB NOT NULL, "
+            "headers BLOB NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, "
+            "available_at REAL NOT NULL DEFAULT 0)"
+        )
+        self._connection.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_ordering_key ON {table} (ordering_key, available_at)"
+        )
+        self._connection.commit()
+
+    async def add(self, entries: Sequence[tuple[str, Message]]) -> None:
+        self._connection.executemany(
+            f"INSERT INTO {self._table} "
+            "(ordering_key, message_type, message_name, message_id, payload, headers) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    ordering_key,
+                    message.message_type,
+                    message.message_name,
+                    str(message.message_id),
+                    encode_payload(message),
+                    orjson.dumps(message.headers),
+                )
+                for ordering_key, message in entries
+            ],
+        )
+        if self._commit:
+            self._connection.commit()
+
+    async def fetch(self, limit: int) -> list[OutboxRecord]:
+        now = time.time()
+        rows = self._connection.execute(
+            "SELECT id, ordering_key, message_type, message_name, message_id, payload, headers, attempts "
+            f"FROM {self._table} AS record WHERE available_at <= ? AND NOT EXISTS ("
+            f"SELECT 1 FROM {self._table} AS waiting WHERE waiting.ordering_key = record.ordering_key "
+            "AND waiting.id < record.id AND waiting.available_at > ?) "
+            "ORDER BY id LIMIT ?",
+            (now, now, limit),
+        ).fetchall()
+
+        return [
+            OutboxRecord(
+                id=id_,
+                ordering_key=ordering_key,
+                message=with_encoded_payload(
+                    Message(
+                        message_type=message_type,
+                        message_name=message_name,
+                        message_id=uuid.UUID(message_id),
+                        payload=orjson.loads(payload),
+                        headers=orjson.loads(headers),
+                    ),
+                    payload,
+                ),
+                attempts=attempts,
+            )
+            for id_, ordering_key, message_type, message_name, message_id, payload, headers, attempts in rows
+        ]
+
+    async def delete(self, ids: Sequence[int]) -> None:
+        self._connection.executemany(f"DELETE FROM {self._table} WHERE id = ?", [(id_,) for id_ in ids])
+        self._connection.commit()
+
+    async def retry(self, ids: Sequence[int], available_at: float) -> None:
+        self._connection.executemany(
+            f"UPDATE {self._table} SET attempts = attempts + 1, available_at = ? WHERE id = ?",
+            [(available_at, id_) for id_ in ids],
+        )
+        self._connection.commit()
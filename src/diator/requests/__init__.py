@@ -1,5 +1,18 @@
 from diator.requests.map import RequestMap
 from diator.requests.request import IRequest, Request
-from diator.requests.request_handler import IRequestHandler, RequestHandler
+from diator.requests.request_handler import (
+    IRequestHandler,
+    IStreamRequestHandler,
+    RequestHandler,
+    StreamRequestHandler,
+)
 
-__all__ = ("RequestMap", "IRequest", "Request", "IRequestHandler", "RequestHandler")
+__all__ = (
+    "RequestMap",
+    "IRequest",
+    "Request",
+    "IRequestHandler",
+    "RequestHandler",
+    "IStreamRequestHandler",
+    "StreamRequestHandler",
+)
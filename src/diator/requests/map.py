@@ -1,30 +1,72 @@
-from typing import Type
+import inspect
+from typing import Type, cast
 
 from diator.requests.request import IRequest
-from diator.requests.request_handler import IRequestHandler
+from diator.requests.request_handler import IRequestHandler, IStreamRequestHandler
+
+HandlerType = Type[IRequestHandler] | Type[IStreamRequestHandler]
 
 
 class RequestMap:
     def __init__(self) -> None:
-        self._request_map: dict[Type[IRequest], Type[IRequestHandler]] = {}
+        self._request_map: dict[Type[IRequest], HandlerType] = {}
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented on every binding, so cached lookups can detect that they are stale.
+        """
+        return self._version
 
     def bind(
         self,
         request_type: Type[IRequest],
-        handler_type: Type[IRequestHandler],
+        handler_type: HandlerType,
     ) -> None:
         self._request_map[request_type] = handler_type
+        self._version += 1
 
     def get(self, request_type: Type[IRequest]) -> Type[IRequestHandler]:
+        handler_type = self._get(request_type)
+        if inspect.isasyncgenfunction(getattr(handler_type, "handle", None)):
+            raise RequestHandlerKindMismatch(
+                f"{handler_type.__name__} bound to {request_type.__name__} is a streaming request handler, "
+                "send the request by Mediator.stream."
+            )
+
+        return cast(Type[IRequestHandler], handler_type)
+
+    def get_stream(self, request_type: Type[IRequest]) -> Type[IStreamRequestHandler]:
+        handler_type = self._get(request_type)
+        if inspect.iscoroutinefunction(getattr(handler_type, "handle", None)):
+            raise RequestHandlerKindMismatch(
+                f"{handler_type.__name__} bound to {request_type.__name__} is not a streaming request handler, "
+                "send the request by Mediator.send."
+            )
+
+        return cast(Type[IStreamRequestHandler], handler_type)
+
+    def get_requests(self) -> list[Type[IRequest]]:
+        return list(self._request_map.keys())
+
+    def __str__(self) -> str:
+        return str(self._request_map)
+
+    def _get(self, request_type: Type[IRequest]) -> HandlerType:
         handler_type = self._request_map.get(request_type)
         if not handler_type:
             raise RequestHandlerDoesNotExist("RequestHandler not found matching Request type.")
 
         return handler_type
 
-    def __str__(self) -> str:
-        return str(self._request_map)
-
 
 class RequestHandlerDoesNotExist(Exception):
     ...
+
+
+class RequestHandlerKindMismatch(Exception):
+    """
+    Raised when a request is sent to a streaming request handler by ``Mediator.send``
+    or to an ordinary request handler by ``Mediator.stream``.
+    """
@@ -1,4 +1,4 @@
-from typing import Protocol, TypeVar
+from typing import AsyncIterator, Protocol, TypeVar
 
 from diator.events.event import Event
 from diator.requests.request import IRequest
@@ -54,3 +54,44 @@ class RequestHandler(IRequestHandler[Req, Res]):
 
     async def handle(self, request: Req) -> Res:
         raise NotImplementedError
+
+
+class IStreamRequestHandler(Protocol[Req, Res]):
+    @property
+    def events(self) -> list[Event]:
+        ...
+
+    def handle(self, request: Req) -> AsyncIterator[Res]:
+        ...
+
+
+class StreamRequestHandler(IStreamRequestHandler[Req, Res]):
+    """
+    The streaming request handler interface.
+
+    The streaming request handler is an object, which gets a request as input and yields results incrementally,
+    so large results are not materialized in memory at once.
+    Events are emitted when the stream is exhausted.
+
+    Query handler example::
+
+      class ExportMeetingsQueryHandler(StreamRequestHandler[ExportMeetingsQuery, MeetingRow])
+          def __init__(self, meetings_api: MeetingAPIProtocol) -> None:
+              super().__init__()
+              self._meetings_api = meetings_api
+
+          async def handle(self, request: ExportMeetingsQuery) -> AsyncIterator[MeetingRow]:
+              async for meeting in self._meetings_api.iter_meetings(request.owner_id):
+                  yield MeetingRow(meeting_id=meeting.id, link=meeting.link)
+
+    """
+
+    def __init__(self) -> None:
+        self._events: list[Event] = []
+
+    @property
+    def events(self) -> list[Event]:
+        return self._events
+
+    def handle(self, request: Req) -> AsyncIterator[Res]:
+        raise NotImplementedError
@@ -0,0 +1,78 @@
+import contextlib
+import functools
+from typing import Any, Awaitable, Callable, ContextManager, Mapping, Protocol, TypeVar
+
+T = TypeVar("T")
+Injector = Callable[[dict[str, str]], None]
+
+
+class ITracer(Protocol):
+    """
+    The interface of a tracer, which is satisfied by ``opentelemetry.trace.Tracer``.
+    """
+
+    def start_as_current_span(self, name: str, *, attributes: Mapping[str, Any] | None = None) -> ContextManager[Any]:
+        ...
+
+
+_NOOP_SPAN: ContextManager[Any] = contextlib.nullcontext()
+
+_tracer: ITracer | None = None
+_inject: Injector | None = None
+
+
+def set_tracer(tracer: ITracer | None, inject: Injector | None = None) -> None:
+    """
+    Enables tracing of sending requests, dispatching, resolving and handling them, handling events and
+    publishing messages. ``None`` disables tracing, which is the default.
+
+    ``inject`` writes the current trace context to headers of every message sent to a message broker,
+    so consumers can continue the trace::
+
+      from opentelemetry import propagate, trace
+
+      set_tracer(trace.get_tracer("diator"), inject=propagate.inject)
+
+    """
+    global _tracer, _inject
+    _tracer = tracer
+    _inject = inject if tracer is not None else None
+
+
+def is_enabled() -> bool:
+    return _tracer is not None
+
+
+def start_span(name: str, attributes: Mapping[str, Any] | None = None) -> ContextManager[Any]:
+    """
+    Starts the span as the current one or returns a shared no-op context manager if tracing is disabled.
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def traced(
+    func: Callable[..., Awaitable[T]], name: str, attributes: Mapping[str, Any] | None = None
+) -> Callable[..., Awaitable[T]]:
+    """
+    Wraps the coroutine function to run within the span, returns it as is if tracing is disabled.
+    """
+    if _tracer is None:
+        return func
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        with start_span(name, attributes):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def inject_context(headers: dict[str, str]) -> None:
+    """
+    Writes the current trace context to the message headers if an injector is configured.
+    """
+    if _inject is not None:
+        _inject(headers)
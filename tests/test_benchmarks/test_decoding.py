@@ -0,0 +1,60 @@
+import time
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+import orjson
+
+from diator.events import FactoryEventDecoder, MessageTypeRegistry, NotificationEvent
+from diator.message_brokers.protocol import Message
+
+NUMBER = 2000
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserJoinedNotificationEvent(NotificationEvent):
+    user_id: UUID = field()
+    meeting_id: int = field()
+    nickname: str = field()
+
+
+def _messages() -> list[Message]:
+    messages = []
+    for meeting_id in range(NUMBER):
+        event = UserJoinedNotificationEvent(user_id=uuid4(), meeting_id=meeting_id, nickname="kend")
+        message = Message(
+            message_type=event._event_type,
+            message_name=type(event).__name__,
+            message_id=event.event_id,
+            payload=orjson.loads(orjson.dumps(event)),
+        )
+        messages.append(message)
+    return messages
+
+
+def _measure(decode, messages: list[Message]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        decode(messages)
+        best = min(best, time.perf_counter() - started)
+
+    return NUMBER / best
+
+
+def test_event_decoding_throughput() -> None:
+    messages = _messages()
+    factory_decoder = FactoryEventDecoder([UserJoinedNotificationEvent])
+    registry = MessageTypeRegistry([UserJoinedNotificationEvent])
+
+    factory = _measure(lambda messages: [factory_decoder.decode(message) for message in messages], messages)
+    registry_each = _measure(lambda messages: [registry.decode(message) for message in messages], messages)
+    registry_many = _measure(registry.decode_many, messages)
+
+    print(
+        "\nEvent decoding throughput:",
+        f"\n  FactoryEventDecoder.decode:      {factory:,.0f} messages/s",
+        f"\n  MessageTypeRegistry.decode:      {registry_each:,.0f} messages/s",
+        f"\n  MessageTypeRegistry.decode_many: {registry_many:,.0f} messages/s",
+    )
+
+    assert registry.decode_many(messages) == [factory_decoder.decode(message) for message in messages]
@@ -0,0 +1,57 @@
+import time
+
+from di import Container, bind_by_type
+from di.dependent import Dependent
+
+from diator.containers.di import DIContainer
+
+NUMBER = 500
+
+
+class Repository:
+    ...
+
+
+class Service:
+    def __init__(self, repository: Repository) -> None:
+        self.repository = repository
+
+
+class Handler:
+    def __init__(self, service: Service, repository: Repository) -> None:
+        self.service = service
+        self.repository = repository
+
+
+def _di_container(cache: bool) -> DIContainer:
+    external_container = Container()
+    for type_ in (Repository, Service, Handler):
+        external_container.bind(bind_by_type(Dependent(type_, scope="request"), type_))
+
+    di_container = DIContainer(cache=cache)
+    di_container.attach_external_container(external_container)
+    return di_container
+
+
+async def _measure(di_container: DIContainer) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(NUMBER):
+            await di_container.resolve(Handler)
+        best = min(best, time.perf_counter() - started)
+
+    return NUMBER / best
+
+
+async def test_di_container_resolve_throughput() -> None:
+    without_cache = await _measure(_di_container(cache=False))
+    with_cache = await _measure(_di_container(cache=True))
+
+    print(
+        "\nDIContainer.resolve throughput:",
+        f"\n  without cache: {without_cache:,.0f} resolves/s",
+        f"\n  with cache:    {with_cache:,.0f} resolves/s",
+    )
+
+    assert with_cache > without_cache
@@ -0,0 +1,41 @@
+import timeit
+from dataclasses import dataclass, field
+
+import orjson
+from dataclass_factory import Factory
+
+from diator.events import (
+    DataclassFactoryEventSerializer,
+    NotificationEvent,
+    OrjsonEventSerializer,
+)
+
+NUMBER = 2000
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserJoinedNotificationEvent(NotificationEvent):
+    user_id: int = field()
+    meeting_id: int = field()
+    nickname: str = field()
+
+
+def _measure(dump) -> float:
+    event = UserJoinedNotificationEvent(user_id=1, meeting_id=2, nickname="kend")
+    return min(timeit.repeat(lambda: orjson.dumps(dump(event)), number=NUMBER, repeat=3)) / NUMBER
+
+
+def test_event_serialization_cost() -> None:
+    factory_per_event = _measure(lambda event: Factory().dump(event))
+    dataclass_factory_serializer = _measure(DataclassFactoryEventSerializer().dump)
+    orjson_serializer = _measure(OrjsonEventSerializer().dump)
+
+    print(
+        "\nPer-event serialization cost:",
+        f"\n  Factory per event:               {factory_per_event * 1e6:.2f} us",
+        f"\n  DataclassFactoryEventSerializer: {dataclass_factory_serializer * 1e6:.2f} us",
+        f"\n  OrjsonEventSerializer:           {orjson_serializer * 1e6:.2f} us",
+    )
+
+    assert dataclass_factory_serializer < factory_per_event
+    assert orjson_serializer < factory_per_event
@@ -0,0 +1,81 @@
+import time
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+from diator.events import ECSTEvent, OrjsonEventSerializer
+from diator.message_brokers.encoding import MessageEncoder, decode_message
+from diator.message_brokers.msgpack import MsgpackCodec
+from diator.message_brokers.protocol import Message
+
+NUMBER = 500
+
+
+@dataclass(frozen=True, kw_only=True)
+class Participant:
+    user_id: UUID = field()
+    nickname: str = field()
+    is_muted: bool = field()
+    volume: float = field()
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingChangedECSTEvent(ECSTEvent):
+    meeting_id: int = field()
+    title: str = field()
+    participants: list[Participant] = field()
+
+
+def _message() -> Message:
+    event = MeetingChangedECSTEvent(
+        meeting_id=1,
+        title="Weekly sync",
+        participants=[
+            Participant(user_id=uuid4(), nickname=f"user-{number}", is_muted=number % 2 == 0, volume=0.75)
+            for number in range(100)
+        ],
+    )
+    return Message(
+        message_type=event._event_type,
+        message_name=type(event).__name__,
+        message_id=event.event_id,
+        payload=OrjsonEventSerializer().dump(event),
+    )
+
+
+def _measure(function) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(NUMBER):
+            function()
+        best = min(best, time.perf_counter() - started)
+
+    return NUMBER / best
+
+
+def test_wire_format_size_and_throughput() -> None:
+    message = _message()
+    encoders = {
+        "JSON": MessageEncoder(),
+        "JSON + deflate": MessageEncoder(compress_above=1024),
+        "msgpack": MessageEncoder(MsgpackCodec()),
+        "msgpack + deflate": MessageEncoder(MsgpackCodec(), compress_above=1024),
+    }
+
+    sizes = {}
+    lines = ["\nMessage wire formats:"]
+    for name, encoder in encoders.items():
+        data = encoder.encode(message)
+        sizes[name] = len(data)
+        encodes = _measure(lambda: encoder.encode(message))
+        decodes = _measure(lambda: decode_message(data))
+        lines.append(f"\n  {name + ':':19} {len(data):6,} bytes, {encodes:8,.0f} encodes/s, {decodes:8,.0f} decodes/s")
+
+    print(*lines)
+
+    assert (
+        decode_message(encoders["msgpack + deflate"].encode(message)).payload
+        == decode_message(encoders["JSON"].encode(message)).payload
+    )
+    assert sizes["msgpack"] < sizes["JSON"]
+    assert sizes["JSON + deflate"] < sizes["JSON"] / 2
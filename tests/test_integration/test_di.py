@@ -19,3 +19,26 @@ async def test_rodi_container_resolve() -> None:
     resolved = await di_container.resolve(Dependency)
 
     assert isinstance(resolved, Dependency)
+
+
+async def test_di_container_caches_solved_dependency() -> None:
+    external_container = Container()
+    external_container.bind(bind_by_type(Dependent(Dependency, scope="request"), Dependency))
+
+    di_container = DIContainer()
+    di_container.attach_external_container(external_container)
+
+    first = await di_container.resolve(Dependency)
+    second = await di_container.resolve(Dependency)
+
+    assert first is not second
+    assert list(di_container._solved) == [Dependency]
+
+    di_container.clear_cache()
+
+    assert not di_container._solved
+
+    await di_container.resolve(Dependency)
+    di_container.attach_external_container(external_container)
+
+    assert not di_container._solved
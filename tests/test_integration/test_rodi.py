@@ -1,4 +1,5 @@
-from rodi import Container
+import pytest
+from rodi import Container, Services
 
 from diator.containers.rodi import RodiContainer
 
@@ -18,3 +19,37 @@ async def test_rodi_container_resolve() -> None:
     resolved = await rodi_container.resolve(Dependency)
 
     assert isinstance(resolved, Dependency)
+
+
+class ContainerWithoutResolve:
+    def __init__(self, container: Container) -> None:
+        self._container = container
+        self.built = 0
+
+    def build_provider(self) -> Services:
+        self.built += 1
+        return self._container.build_provider()
+
+
+@pytest.mark.parametrize("eager", [False, True])
+async def test_rodi_container_builds_provider_once(eager: bool) -> None:
+    external_container = Container()
+    external_container.register(Dependency)
+    container_without_resolve = ContainerWithoutResolve(external_container)
+
+    rodi_container = RodiContainer(eager=eager)
+    rodi_container.attach_external_container(container_without_resolve)  # type: ignore
+
+    assert container_without_resolve.built == int(eager)
+
+    first = await rodi_container.resolve(Dependency)
+    second = await rodi_container.resolve(Dependency)
+
+    assert isinstance(first, Dependency)
+    assert first is not second
+    assert container_without_resolve.built == 1
+
+    rodi_container.attach_external_container(container_without_resolve)  # type: ignore
+    await rodi_container.resolve(Dependency)
+
+    assert container_without_resolve.built == 2
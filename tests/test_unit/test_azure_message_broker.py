@@ -0,0 +1,73 @@
+from azure.servicebus import ServiceBusMessage, ServiceBusMessageBatch
+
+from diator.message_brokers.azure import AzureMessageBroker
+from diator.message_brokers.protocol import Message
+
+
+class TestServiceBusSender:
+    def __init__(self) -> None:
+        self.opened = 0
+        self.closed = 0
+        self.sent: list[ServiceBusMessage | ServiceBusMessageBatch] = []
+
+    async def __aenter__(self) -> "TestServiceBusSender":
+        self.opened += 1
+        return self
+
+    async def close(self) -> None:
+        self.closed += 1
+
+    async def create_message_batch(self) -> ServiceBusMessageBatch:
+        return ServiceBusMessageBatch(max_size_in_bytes=600)
+
+    async def send_messages(self, message, timeout=None) -> None:
+        self.sent.append(message)
+
+
+class TestServiceBusClient:
+    def __init__(self) -> None:
+        self.opened = 0
+        self.closed = 0
+        self.sender = TestServiceBusSender()
+
+    async def __aenter__(self) -> "TestServiceBusClient":
+        self.opened += 1
+        return self
+
+    async def close(self) -> None:
+        self.closed += 1
+
+    def get_topic_sender(self, topic_name: str) -> TestServiceBusSender:
+        return self.sender
+
+
+def _message(index: int) -> Message:
+    return Message(payload={"index": index}, message_type="notification_event", message_name="UserJoined")
+
+
+async def test_azure_message_broker_reuses_sender() -> None:
+    client = TestServiceBusClient()
+
+    async with AzureMessageBroker(client, "topic") as message_broker:  # type: ignore
+        await message_broker.send_message(_message(1))
+        await message_broker.send_message(_message(2))
+
+    assert client.opened == 1
+    assert client.sender.opened == 1
+    assert client.sender.closed == 1
+    assert client.closed == 1
+    assert len(client.sender.sent) == 2
+
+
+async def test_azure_message_broker_splits_batches_by_size() -> None:
+    client = TestServiceBusClient()
+    message_broker = AzureMessageBroker(client, "topic")  # type: ignore
+
+    await message_broker.send_messages([_message(index) for index in range(5)])
+    await message_broker.aclose()
+
+    batches = client.sender.sent
+    assert client.sender.opened == 1
+    assert len(batches) > 1
+    assert all(isinstance(batch, ServiceBusMessageBatch) for batch in batches)
+    assert sum(len(batch) for batch in batches) == 5  # type: ignore
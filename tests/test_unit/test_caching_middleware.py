@@ -0,0 +1,196 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from diator.events import DomainEvent, EventEmitter, EventMap
+from diator.mediator import Mediator
+from diator.middlewares import (
+    CachingMiddleware,
+    InMemoryCacheBackend,
+    MiddlewareChain,
+    request_key,
+)
+from diator.requests import Request, RequestHandler, RequestMap
+from diator.responses import Response
+
+
+@dataclass(kw_only=True)
+class ReadMeetingQueryResult(Response):
+    meeting_id: uuid.UUID = field()
+    calls: int = field()
+    participants: list[str] = field(default_factory=list)
+
+
+@dataclass(kw_only=True)
+class ReadMeetingQuery(Request[ReadMeetingQueryResult]):
+    meeting_id: uuid.UUID = field()
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingRenamedDomainEvent(DomainEvent):
+    meeting_id: uuid.UUID = field()
+
+
+@dataclass(kw_only=True)
+class RenameMeetingCommand(Request[None]):
+    meeting_id: uuid.UUID = field()
+
+
+class ReadMeetingQueryHandler(RequestHandler[ReadMeetingQuery, ReadMeetingQueryResult]):
+    calls = 0
+
+    @property
+    def events(self) -> list:
+        return []
+
+    async def handle(self, request: ReadMeetingQuery) -> ReadMeetingQueryResult:
+        ReadMeetingQueryHandler.calls += 1
+        return ReadMeetingQueryResult(
+            meeting_id=request.meeting_id,
+            calls=ReadMeetingQueryHandler.calls,
+            participants=["kend"],
+        )
+
+
+class RenameMeetingCommandHandler(RequestHandler[RenameMeetingCommand, None]):
+    def __init__(self) -> None:
+        self._events: list = []
+
+    @property
+    def events(self) -> list:
+        return self._events
+
+    async def handle(self, request: RenameMeetingCommand) -> None:
+        self._events.append(MeetingRenamedDomainEvent(meeting_id=request.meeting_id))
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+def build_mediator(caching_middleware: CachingMiddleware) -> Mediator:
+    request_map = RequestMap()
+    request_map.bind(ReadMeetingQuery, ReadMeetingQueryHandler)
+    request_map.bind(RenameMeetingCommand, RenameMeetingCommandHandler)
+
+    middleware_chain = MiddlewareChain()
+    middleware_chain.add(caching_middleware)
+
+    event_emitter = EventEmitter(EventMap(), TestContainer())  # type: ignore
+    event_emitter.add_listener(caching_middleware.invalidate)
+
+    return Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        event_emitter=event_emitter,
+        middleware_chain=middleware_chain,
+    )
+
+
+async def test_request_key_ignores_request_id() -> None:
+    key = request_key(ReadMeetingQuery(meeting_id=uuid.UUID(int=1)))
+
+    assert key == request_key(ReadMeetingQuery(meeting_id=uuid.UUID(int=1)))
+    assert key != request_key(ReadMeetingQuery(meeting_id=uuid.UUID(int=2)))
+
+
+@dataclass(kw_only=True)
+class SearchMeetingsQuery(Request[ReadMeetingQueryResult]):
+    tags: set[str] = field()
+    price: Decimal = field()
+    filters: dict[str, int] = field()
+
+
+async def test_request_key_does_not_depend_on_order_of_items() -> None:
+    key = request_key(SearchMeetingsQuery(tags={"b", "a"}, price=Decimal("1.5"), filters={"x": 1, "y": 2}))
+
+    assert key == request_key(SearchMeetingsQuery(tags={"a", "b"}, price=Decimal("1.5"), filters={"y": 2, "x": 1}))
+    assert key != request_key(SearchMeetingsQuery(tags={"a"}, price=Decimal("1.5"), filters={"y": 2, "x": 1}))
+
+
+async def test_caching_middleware_handles_requests_whose_key_could_not_be_built() -> None:
+    ReadMeetingQueryHandler.calls = 0
+    mediator = build_mediator(CachingMiddleware([ReadMeetingQuery]))
+    query = ReadMeetingQuery(meeting_id=uuid.uuid4())
+    query.meeting_id = object()  # type: ignore
+
+    await mediator.send(query)
+    await mediator.send(query)
+
+    assert ReadMeetingQueryHandler.calls == 2
+
+
+async def test_caching_middleware_returns_copies_of_cached_responses() -> None:
+    ReadMeetingQueryHandler.calls = 0
+    mediator = build_mediator(CachingMiddleware([ReadMeetingQuery]))
+    meeting_id = uuid.uuid4()
+
+    first = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+    first.calls = -1
+    second = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+    second.calls = -2
+    third = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+
+    assert second is not first
+    assert third.calls == 1
+
+
+async def test_caching_middleware_returns_deep_copies_of_cached_responses() -> None:
+    ReadMeetingQueryHandler.calls = 0
+    mediator = build_mediator(CachingMiddleware([ReadMeetingQuery]))
+    meeting_id = uuid.uuid4()
+
+    first = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+    first.participants.append("first")
+    second = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+    second.participants.append("second")
+    third = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+
+    assert third.participants == ["kend"]
+    assert third.calls == 1
+
+
+async def test_caching_middleware_reuses_responses_until_invalidated() -> None:
+    ReadMeetingQueryHandler.calls = 0
+    caching_middleware = CachingMiddleware(
+        [ReadMeetingQuery],
+        invalidate_on={MeetingRenamedDomainEvent: [ReadMeetingQuery]},
+    )
+    mediator = build_mediator(caching_middleware)
+    meeting_id = uuid.uuid4()
+
+    first = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+    second = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+    other = await mediator.send(ReadMeetingQuery(meeting_id=uuid.uuid4()))
+
+    assert first == second
+    assert other.calls == 2
+
+    await mediator.send(RenameMeetingCommand(meeting_id=meeting_id))
+    third = await mediator.send(ReadMeetingQuery(meeting_id=meeting_id))
+
+    assert third.calls == 3
+
+
+async def test_in_memory_backend_expires_and_evicts_entries() -> None:
+    backend = InMemoryCacheBackend(maxsize=2)
+
+    await backend.set("a", 1, ttl=None, tag="t")
+    await backend.set("b", 2, ttl=None, tag="t")
+    await backend.get("a")
+    await backend.set("c", 3, ttl=None, tag="t")
+
+    assert await backend.get("a") == 1
+    assert await backend.get("b") is None
+    assert len(backend) == 2
+
+    await backend.set("d", 4, ttl=0.01, tag="t")
+    await asyncio.sleep(0.02)
+
+    assert await backend.get("d") is None
+
+    await backend.invalidate("t")
+
+    assert len(backend) == 0
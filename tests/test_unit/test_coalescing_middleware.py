@@ -0,0 +1,106 @@
+import asyncio
+from dataclasses import dataclass, field
+from fractions import Fraction
+
+import pytest
+
+from diator.mediator import Mediator
+from diator.middlewares import CoalescingMiddleware, MiddlewareChain
+from diator.requests import Request, RequestHandler, RequestMap
+from diator.responses import Response
+
+
+@dataclass(kw_only=True)
+class ReadMeetingQueryResult(Response):
+    meeting_id: int = field()
+
+
+@dataclass(kw_only=True)
+class ReadMeetingQuery(Request[ReadMeetingQueryResult]):
+    meeting_id: int = field()
+
+
+class ReadMeetingQueryHandler(RequestHandler[ReadMeetingQuery, ReadMeetingQueryResult]):
+    calls = 0
+
+    @property
+    def events(self) -> list:
+        return []
+
+    async def handle(self, request: ReadMeetingQuery) -> ReadMeetingQueryResult:
+        ReadMeetingQueryHandler.calls += 1
+        await asyncio.sleep(0.01)
+        if request.meeting_id < 0:
+            raise ValueError(request.meeting_id)
+        return ReadMeetingQueryResult(meeting_id=request.meeting_id)
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+@pytest.fixture
+def coalescing_middleware() -> CoalescingMiddleware:
+    ReadMeetingQueryHandler.calls = 0
+    return CoalescingMiddleware([ReadMeetingQuery])
+
+
+@pytest.fixture
+def mediator(coalescing_middleware: CoalescingMiddleware) -> Mediator:
+    request_map = RequestMap()
+    request_map.bind(ReadMeetingQuery, ReadMeetingQueryHandler)
+    middleware_chain = MiddlewareChain()
+    middleware_chain.add(coalescing_middleware)
+
+    return Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        middleware_chain=middleware_chain,
+    )
+
+
+async def test_coalescing_middleware_shares_in_flight_handling(
+    mediator: Mediator, coalescing_middleware: CoalescingMiddleware
+) -> None:
+    responses = await asyncio.gather(
+        *(mediator.send(ReadMeetingQuery(meeting_id=meeting_id)) for meeting_id in (1, 1, 1, 2))
+    )
+
+    assert ReadMeetingQueryHandler.calls == 2
+    assert responses[0] is responses[1] is responses[2]
+    assert responses[3].meeting_id == 2
+    assert coalescing_middleware.in_flight == 0
+
+
+async def test_coalescing_middleware_handles_requests_whose_key_could_not_be_built(
+    mediator: Mediator, coalescing_middleware: CoalescingMiddleware
+) -> None:
+    query = ReadMeetingQuery(meeting_id=Fraction(1, 2))  # type: ignore
+
+    await asyncio.gather(mediator.send(query), mediator.send(query))
+
+    assert ReadMeetingQueryHandler.calls == 2
+    assert coalescing_middleware.in_flight == 0
+
+
+async def test_coalescing_middleware_propagates_errors_to_every_waiter(mediator: Mediator) -> None:
+    results = await asyncio.gather(
+        *(mediator.send(ReadMeetingQuery(meeting_id=-1)) for _ in range(3)), return_exceptions=True
+    )
+
+    assert ReadMeetingQueryHandler.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_cancelled_waiter_does_not_cancel_the_others(mediator: Mediator) -> None:
+    cancelled = asyncio.ensure_future(mediator.send(ReadMeetingQuery(meeting_id=1)))
+    waiting = asyncio.ensure_future(mediator.send(ReadMeetingQuery(meeting_id=1)))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    response = await waiting
+
+    assert response.meeting_id == 1
+    assert cancelled.cancelled()
+    assert ReadMeetingQueryHandler.calls == 1
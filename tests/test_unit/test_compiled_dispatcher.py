@@ -0,0 +1,139 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+from diator.dispatchers import CompiledDispatcher
+from diator.events import Event
+from diator.middlewares import MiddlewareChain
+from diator.requests import IRequestHandler, Request, RequestMap
+from diator.requests.request import IRequest
+from diator.responses import Response
+
+
+@dataclass(kw_only=True)
+class ReadCounterQueryResult(Response):
+    value: int = field()
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass(kw_only=True)
+class ReadCounterQuery(Request[ReadCounterQueryResult]):
+    value: int = field()
+
+
+class ReadCounterQueryHandler(IRequestHandler[ReadCounterQuery, ReadCounterQueryResult]):  # type: ignore
+    def __init__(self) -> None:
+        self._events: list[Event] = []
+
+    @property
+    def events(self) -> list:
+        return self._events
+
+    async def handle(self, request: ReadCounterQuery) -> ReadCounterQueryResult:
+        return ReadCounterQueryResult(value=request.value)
+
+
+class AnotherReadCounterQueryHandler(ReadCounterQueryHandler):
+    async def handle(self, request: ReadCounterQuery) -> ReadCounterQueryResult:
+        return ReadCounterQueryResult(value=-request.value)
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+class TagMiddleware:
+    def __init__(self, tag: str) -> None:
+        self._tag = tag
+
+    async def __call__(self, request: IRequest[Any], handle):
+        response = await handle(request)
+        response.tags.append(self._tag)
+        return response
+
+
+class SleepMiddleware:
+    async def __call__(self, request: IRequest[Any], handle):
+        await asyncio.sleep(0.01 - request.value / 1000)
+        return await handle(request)
+
+
+def _dispatcher(request_map: RequestMap, middleware_chain: MiddlewareChain) -> CompiledDispatcher:
+    return CompiledDispatcher(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        middleware_chain=middleware_chain,
+    )
+
+
+async def test_compiled_dispatcher_reuses_pipeline() -> None:
+    request_map = RequestMap()
+    request_map.bind(ReadCounterQuery, ReadCounterQueryHandler)
+    middleware_chain = MiddlewareChain()
+    middleware_chain.set([TagMiddleware("first"), TagMiddleware("second")])
+    dispatcher = _dispatcher(request_map, middleware_chain)
+    dispatcher.freeze()
+
+    result = await dispatcher.dispatch(ReadCounterQuery(value=1))
+    second_result = await dispatcher.dispatch(ReadCounterQuery(value=2))
+
+    assert result.response is not None
+    assert result.response.value == 1
+    assert result.response.tags == ["second", "first"]
+    assert second_result.response is not None
+    assert second_result.response.value == 2
+
+
+async def test_compiled_pipeline_calls_handler_of_each_dispatch() -> None:
+    request_map = RequestMap()
+    request_map.bind(ReadCounterQuery, ReadCounterQueryHandler)
+    middleware_chain = MiddlewareChain()
+    middleware_chain.set([SleepMiddleware(), TagMiddleware("tag")])
+    dispatcher = _dispatcher(request_map, middleware_chain)
+
+    results = await asyncio.gather(*(dispatcher.dispatch(ReadCounterQuery(value=value)) for value in range(5)))
+
+    assert [result.response.value for result in results if result.response] == list(range(5))
+    assert all(result.response and result.response.tags == ["tag"] for result in results)
+
+
+async def test_compiled_dispatcher_invalidates_pipeline_on_changes() -> None:
+    request_map = RequestMap()
+    request_map.bind(ReadCounterQuery, ReadCounterQueryHandler)
+    middleware_chain = MiddlewareChain()
+    dispatcher = _dispatcher(request_map, middleware_chain)
+
+    result = await dispatcher.dispatch(ReadCounterQuery(value=1))
+
+    assert result.response is not None
+    assert result.response.tags == []
+
+    middleware_chain.add(TagMiddleware("added"))
+    result = await dispatcher.dispatch(ReadCounterQuery(value=1))
+
+    assert result.response is not None
+    assert result.response.tags == ["added"]
+
+    request_map.bind(ReadCounterQuery, AnotherReadCounterQueryHandler)
+    result = await dispatcher.dispatch(ReadCounterQuery(value=1))
+
+    assert result.response is not None
+    assert result.response.value == -1
+
+
+async def test_middleware_chain_keeps_its_own_copy_of_set_middlewares() -> None:
+    request_map = RequestMap()
+    request_map.bind(ReadCounterQuery, ReadCounterQueryHandler)
+    middlewares: list = [TagMiddleware("first")]
+    middleware_chain = MiddlewareChain()
+    middleware_chain.set(middlewares)
+    dispatcher = _dispatcher(request_map, middleware_chain)
+
+    await dispatcher.dispatch(ReadCounterQuery(value=1))
+    middlewares.append(TagMiddleware("appended"))
+    result = await dispatcher.dispatch(ReadCounterQuery(value=1))
+
+    assert result.response is not None
+    assert result.response.tags == ["first"]
+    assert len(middleware_chain.middlewares) == 1
@@ -0,0 +1,176 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import fakeredis
+import pytest
+
+from diator.consumers import EventConsumer
+from diator.consumers.redis import RedisPubSubSource, RedisStreamsSource
+from diator.consumers.source import ReceivedMessage
+from diator.events import (
+    EventEmitter,
+    EventMap,
+    FactoryEventDecoder,
+    IEventHandler,
+    NotificationEvent,
+    UnknownMessageError,
+)
+from diator.message_brokers.encoding import decode_message, encode_message
+from diator.message_brokers.protocol import Message
+from diator.message_brokers.redis import (
+    RedisMessageBroker,
+    RedisStreamsMessageBroker,
+)
+
+STREAM = "python_diator_stream:notification_event"
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserJoinedNotificationEvent(NotificationEvent):
+    user_id: int = field()
+
+
+class UserJoinedEventHandler(IEventHandler[UserJoinedNotificationEvent]):
+    handled: list[UserJoinedNotificationEvent] = []
+
+    async def handle(self, event: UserJoinedNotificationEvent) -> None:
+        if event.user_id < 0:
+            raise ValueError(event.user_id)
+        self.handled.append(event)
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+@pytest.fixture
+def redis_client() -> fakeredis.FakeAsyncRedis:
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture
+def event_map() -> EventMap:
+    UserJoinedEventHandler.handled = []
+    event_map = EventMap()
+    event_map.bind(UserJoinedNotificationEvent, UserJoinedEventHandler)
+    return event_map
+
+
+async def wait_until(condition) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+async def test_factory_event_decoder_restores_events(event_map: EventMap) -> None:
+    event = UserJoinedNotificationEvent(user_id=1)
+    sent = EventEmitter(event_map, TestContainer())._build_message(event)  # type: ignore
+    message = decode_message(encode_message(sent))
+    decoder = FactoryEventDecoder(event_map.get_events())
+
+    assert decoder.decode(message) == event
+
+    with pytest.raises(UnknownMessageError):
+        FactoryEventDecoder([]).decode(message)
+
+
+async def test_consumer_handles_and_acknowledges_stream_messages(
+    redis_client: fakeredis.FakeAsyncRedis, event_map: EventMap
+) -> None:
+    events = [UserJoinedNotificationEvent(user_id=user_id) for user_id in (1, -1, 2)]
+    event_emitter = EventEmitter(event_map, TestContainer(), RedisStreamsMessageBroker(redis_client))  # type: ignore
+    await event_emitter.publish(events)
+
+    source = RedisStreamsSource(redis_client, [STREAM], group="tests", consumer="tests-1", block=10)
+    consumer = EventConsumer(source, event_map, TestContainer(), concurrency=2, ack_interval=0.01)  # type: ignore
+
+    async with consumer:
+        await wait_until(lambda: len(UserJoinedEventHandler.handled) == 2)
+
+    pending = await redis_client.xpending(STREAM, "tests")
+
+    assert sorted(event.user_id for event in UserJoinedEventHandler.handled) == [1, 2]
+    assert UserJoinedEventHandler.handled[0] in events
+    assert pending["pending"] == 1
+
+
+class FlakyEventHandler(IEventHandler[UserJoinedNotificationEvent]):
+    attempts: list[int] = []
+
+    async def handle(self, event: UserJoinedNotificationEvent) -> None:
+        self.attempts.append(event.user_id)
+        if self.attempts.count(event.user_id) == 1:
+            raise ValueError(event.user_id)
+
+
+async def test_streams_source_claims_idle_pending_entries(redis_client: fakeredis.FakeAsyncRedis) -> None:
+    FlakyEventHandler.attempts = []
+    event_map = EventMap()
+    event_map.bind(UserJoinedNotificationEvent, FlakyEventHandler)
+    event_emitter = EventEmitter(event_map, TestContainer(), RedisStreamsMessageBroker(redis_client))  # type: ignore
+    await event_emitter.publish([UserJoinedNotificationEvent(user_id=1), UserJoinedNotificationEvent(user_id=2)])
+
+    source = RedisStreamsSource(redis_client, [STREAM], group="tests", consumer="tests-1", block=10, min_idle_time=20)
+    consumer = EventConsumer(source, event_map, TestContainer(), ack_interval=0.01)  # type: ignore
+
+    async with consumer:
+        await wait_until(lambda: len(FlakyEventHandler.attempts) == 4)
+        await asyncio.sleep(0.05)
+
+    pending = await redis_client.xpending(STREAM, "tests")
+
+    assert sorted(FlakyEventHandler.attempts) == [1, 1, 2, 2]
+    assert pending["pending"] == 0
+
+
+class HangingEventHandler(IEventHandler[UserJoinedNotificationEvent]):
+    async def handle(self, event: UserJoinedNotificationEvent) -> None:
+        await asyncio.Event().wait()
+
+
+class EndlessMessageSource:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def receive(self, max_messages: int) -> list[ReceivedMessage]:
+        event = UserJoinedNotificationEvent(user_id=1)
+        message = Message(message_type=event._event_type, message_name=type(event).__name__, payload={"user_id": 1})
+        return [ReceivedMessage(message=message) for _ in range(max_messages)]
+
+    async def ack(self, receipts) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+async def test_consumer_closes_in_time_when_handlers_hang() -> None:
+    event_map = EventMap()
+    event_map.bind(UserJoinedNotificationEvent, HangingEventHandler)
+    source = EndlessMessageSource()
+    consumer = EventConsumer(source, event_map, TestContainer(), prefetch=1)  # type: ignore
+    consumer.start()
+    await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(consumer.aclose(timeout=0.05), 1)
+
+    assert source.closed
+
+
+async def test_pub_sub_source_receives_published_messages(
+    redis_client: fakeredis.FakeAsyncRedis, event_map: EventMap
+) -> None:
+    source = RedisPubSubSource(redis_client, timeout=0.01)
+    event = UserJoinedNotificationEvent(user_id=1)
+    event_emitter = EventEmitter(event_map, TestContainer(), RedisMessageBroker(redis_client))  # type: ignore
+
+    assert await source.receive(10) == []
+
+    await event_emitter.emit(event)
+    received = await source.receive(10)
+    await source.aclose()
+
+    assert [received_message.message.message_id for received_message in received] == [event.event_id]
+    assert FactoryEventDecoder(event_map.get_events()).decode(received[0].message) == event
@@ -0,0 +1,194 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from diator.containers.lifetime import Lifetime, LifetimeContainer, scope
+from diator.deadlines import deadline, remaining
+from diator.events import (
+    BackgroundEmission,
+    ConcurrentEmission,
+    DomainEvent,
+    EmissionQueueFull,
+    EventEmissionError,
+    EventEmitter,
+    EventMap,
+    GroupedEmission,
+    IEventHandler,
+    NotificationEvent,
+    OverflowPolicy,
+    SequentialEmission,
+)
+from diator.message_brokers.protocol import Message
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserJoinedDomainEvent(DomainEvent):
+    user_id: int = field()
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserJoinedNotificationEvent(NotificationEvent):
+    user_id: int = field()
+
+
+class UserJoinedEventHandler(IEventHandler[UserJoinedDomainEvent]):
+    handled: list[int] = []
+
+    async def handle(self, event: UserJoinedDomainEvent) -> None:
+        await asyncio.sleep(0.01 if event.user_id == 1 else 0)
+        if event.user_id < 0:
+            raise ValueError(event.user_id)
+        self.handled.append(event.user_id)
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+class TestMessageBroker:
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+
+    async def send_message(self, message: Message) -> None:
+        self.messages.append(message)
+
+
+class BatchingMessageBroker(TestMessageBroker):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[Message]] = []
+
+    async def send_messages(self, messages: list[Message]) -> None:
+        self.batches.append(list(messages))
+        self.messages.extend(messages)
+
+
+@pytest.fixture
+def message_broker() -> TestMessageBroker:
+    return TestMessageBroker()
+
+
+@pytest.fixture
+def event_emitter(message_broker: TestMessageBroker) -> EventEmitter:
+    UserJoinedEventHandler.handled = []
+    event_map = EventMap()
+    event_map.bind(UserJoinedDomainEvent, UserJoinedEventHandler)
+    return EventEmitter(
+        event_map=event_map,
+        container=TestContainer(),  # type: ignore
+        message_broker=message_broker,
+    )
+
+
+async def test_sequential_emission_preserves_order(event_emitter: EventEmitter) -> None:
+    events = [UserJoinedDomainEvent(user_id=1), UserJoinedDomainEvent(user_id=2)]
+
+    await SequentialEmission().emit(event_emitter, events)
+
+    assert UserJoinedEventHandler.handled == [1, 2]
+
+
+async def test_sequential_emission_batches_consecutive_broker_events() -> None:
+    message_broker = BatchingMessageBroker()
+    event_emitter = EventEmitter(
+        event_map=EventMap(),
+        container=TestContainer(),  # type: ignore
+        message_broker=message_broker,
+    )
+    events = [
+        UserJoinedNotificationEvent(user_id=1),
+        UserJoinedNotificationEvent(user_id=2),
+        UserJoinedDomainEvent(user_id=3),
+        UserJoinedNotificationEvent(user_id=4),
+    ]
+
+    await SequentialEmission().emit(event_emitter, events)
+
+    assert [message.payload["user_id"] for message in message_broker.batches[0]] == [1, 2]
+    assert len(message_broker.batches) == 1
+    assert [message.payload["user_id"] for message in message_broker.messages] == [1, 2, 4]
+
+
+async def test_concurrent_emission(event_emitter: EventEmitter) -> None:
+    events = [UserJoinedDomainEvent(user_id=1), UserJoinedDomainEvent(user_id=2), UserJoinedDomainEvent(user_id=-1)]
+
+    with pytest.raises(EventEmissionError) as exc_info:
+        await ConcurrentEmission(limit=2).emit(event_emitter, events)
+
+    assert UserJoinedEventHandler.handled == [2, 1]
+    assert len(exc_info.value.exceptions) == 1
+
+
+async def test_grouped_emission_batches_broker_events(
+    event_emitter: EventEmitter, message_broker: TestMessageBroker
+) -> None:
+    events = [
+        UserJoinedNotificationEvent(user_id=1),
+        UserJoinedDomainEvent(user_id=1),
+        UserJoinedNotificationEvent(user_id=2),
+    ]
+
+    await GroupedEmission().emit(event_emitter, events)
+
+    assert UserJoinedEventHandler.handled == [1]
+    assert [message.payload["user_id"] for message in message_broker.messages] == [1, 2]
+
+
+async def test_background_emission_drains_events(event_emitter: EventEmitter) -> None:
+    emission = BackgroundEmission(workers=1)
+
+    await emission.emit(event_emitter, [UserJoinedDomainEvent(user_id=1), UserJoinedDomainEvent(user_id=2)])
+
+    assert UserJoinedEventHandler.handled == []
+
+    await emission.aclose()
+
+    assert UserJoinedEventHandler.handled == [1, 2]
+
+
+class ScopedEventHandler(IEventHandler[UserJoinedDomainEvent]):
+    handled: list[tuple["ScopedEventHandler", float | None]] = []
+
+    async def handle(self, event: UserJoinedDomainEvent) -> None:
+        self.handled.append((self, remaining()))
+
+
+async def test_background_emission_does_not_inherit_request_context() -> None:
+    ScopedEventHandler.handled = []
+    event_map = EventMap()
+    event_map.bind(UserJoinedDomainEvent, ScopedEventHandler)
+    container = LifetimeContainer(TestContainer(), default=Lifetime.SCOPED)  # type: ignore
+    event_emitter = EventEmitter(event_map=event_map, container=container)
+    emission = BackgroundEmission(workers=1)
+
+    for user_id in range(3):
+        with scope(), deadline(0.01):
+            await emission.emit(event_emitter, [UserJoinedDomainEvent(user_id=user_id)])
+        await asyncio.sleep(0.02)
+    await emission.aclose()
+
+    handlers = [handler for handler, _ in ScopedEventHandler.handled]
+    assert len(set(map(id, handlers))) == 3
+    assert [seconds_left for _, seconds_left in ScopedEventHandler.handled] == [None, None, None]
+
+
+async def test_background_emission_drops_oldest_events(event_emitter: EventEmitter) -> None:
+    emission = BackgroundEmission(maxsize=1, overflow=OverflowPolicy.DROP_OLDEST)
+
+    await emission.emit(event_emitter, [UserJoinedDomainEvent(user_id=2), UserJoinedDomainEvent(user_id=3)])
+    await emission.aclose()
+
+    assert UserJoinedEventHandler.handled == [3]
+
+
+async def test_background_emission_raises_on_full_queue(event_emitter: EventEmitter) -> None:
+    emission = BackgroundEmission(maxsize=1, overflow=OverflowPolicy.RAISE)
+
+    with pytest.raises(EmissionQueueFull):
+        await emission.emit(event_emitter, [UserJoinedDomainEvent(user_id=2), UserJoinedDomainEvent(user_id=3)])
+
+    await emission.aclose()
+
+    assert UserJoinedEventHandler.handled == [2]
@@ -0,0 +1,115 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from diator.events import (
+    DomainEvent,
+    ErrorPolicy,
+    EventEmitter,
+    EventHandlingError,
+    EventMap,
+    IEventHandler,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingClosedDomainEvent(DomainEvent):
+    meeting_id: int = field()
+
+
+class SlowMeetingClosedEventHandler(IEventHandler[MeetingClosedDomainEvent]):
+    running = 0
+    max_running = 0
+
+    async def handle(self, event: MeetingClosedDomainEvent) -> None:
+        SlowMeetingClosedEventHandler.running += 1
+        SlowMeetingClosedEventHandler.max_running = max(
+            SlowMeetingClosedEventHandler.max_running, SlowMeetingClosedEventHandler.running
+        )
+        await asyncio.sleep(0.01)
+        SlowMeetingClosedEventHandler.running -= 1
+
+
+class AnotherSlowMeetingClosedEventHandler(SlowMeetingClosedEventHandler):
+    ...
+
+
+class ThirdSlowMeetingClosedEventHandler(SlowMeetingClosedEventHandler):
+    ...
+
+
+class FailingMeetingClosedEventHandler(IEventHandler[MeetingClosedDomainEvent]):
+    async def handle(self, event: MeetingClosedDomainEvent) -> None:
+        raise ValueError(event.meeting_id)
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+def _event_map(*handler_types) -> EventMap:
+    event_map = EventMap()
+    for handler_type in handler_types:
+        event_map.bind(MeetingClosedDomainEvent, handler_type)
+    return event_map
+
+
+@pytest.mark.parametrize(
+    ["max_concurrency", "expected_max_running"],
+    [(None, 3), (2, 2)],
+)
+async def test_event_emitter_runs_handlers_concurrently(
+    max_concurrency: int | None, expected_max_running: int
+) -> None:
+    SlowMeetingClosedEventHandler.max_running = 0
+    event_emitter = EventEmitter(
+        event_map=_event_map(
+            SlowMeetingClosedEventHandler, AnotherSlowMeetingClosedEventHandler, ThirdSlowMeetingClosedEventHandler
+        ),
+        container=TestContainer(),  # type: ignore
+        concurrent=True,
+        max_concurrency=max_concurrency,
+    )
+
+    await event_emitter.emit(MeetingClosedDomainEvent(meeting_id=1))
+
+    assert SlowMeetingClosedEventHandler.max_running == expected_max_running
+
+
+async def test_event_emitter_runs_handlers_sequentially_by_default() -> None:
+    SlowMeetingClosedEventHandler.max_running = 0
+    event_emitter = EventEmitter(
+        event_map=_event_map(SlowMeetingClosedEventHandler, AnotherSlowMeetingClosedEventHandler),
+        container=TestContainer(),  # type: ignore
+    )
+
+    await event_emitter.emit(MeetingClosedDomainEvent(meeting_id=1))
+
+    assert SlowMeetingClosedEventHandler.max_running == 1
+
+
+async def test_event_emitter_aggregates_handler_errors() -> None:
+    event_emitter = EventEmitter(
+        event_map=_event_map(FailingMeetingClosedEventHandler, SlowMeetingClosedEventHandler),
+        container=TestContainer(),  # type: ignore
+        concurrent=True,
+    )
+
+    with pytest.raises(EventHandlingError) as exc_info:
+        await event_emitter.emit(MeetingClosedDomainEvent(meeting_id=1))
+
+    assert len(exc_info.value.exceptions) == 1
+    assert isinstance(exc_info.value.exceptions[0], ValueError)
+
+
+async def test_event_emitter_continues_on_handler_errors() -> None:
+    event_emitter = EventEmitter(
+        event_map=_event_map(FailingMeetingClosedEventHandler, FailingMeetingClosedEventHandler),
+        container=TestContainer(),  # type: ignore
+        concurrent=True,
+        error_policy=ErrorPolicy.CONTINUE,
+    )
+
+    await event_emitter.emit(MeetingClosedDomainEvent(meeting_id=1))
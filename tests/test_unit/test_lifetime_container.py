@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from diator.containers.lifetime import Lifetime, LifetimeContainer, scope
+
+
+class Handler:
+    ...
+
+
+class TestContainer:
+    def __init__(self) -> None:
+        self.resolved = 0
+
+    async def resolve(self, type_):
+        self.resolved += 1
+        return type_()
+
+
+@pytest.fixture
+def container() -> TestContainer:
+    return TestContainer()
+
+
+async def test_transient_lifetime(container: TestContainer) -> None:
+    lifetime_container = LifetimeContainer(container)  # type: ignore
+
+    with scope():
+        assert await lifetime_container.resolve(Handler) is not await lifetime_container.resolve(Handler)
+
+
+async def test_singleton_lifetime(container: TestContainer) -> None:
+    lifetime_container = LifetimeContainer(container, {Handler: Lifetime.SINGLETON})  # type: ignore
+
+    instances = await asyncio.gather(*(lifetime_container.resolve(Handler) for _ in range(3)))
+    with scope():
+        instances.append(await lifetime_container.resolve(Handler))
+
+    assert all(instance is instances[0] for instance in instances)
+
+
+async def test_scoped_lifetime(container: TestContainer) -> None:
+    lifetime_container = LifetimeContainer(container, default=Lifetime.SCOPED)  # type: ignore
+
+    with scope():
+        first = await lifetime_container.resolve(Handler)
+        assert await lifetime_container.resolve(Handler) is first
+
+    with scope():
+        assert await lifetime_container.resolve(Handler) is not first
+
+    assert await lifetime_container.resolve(Handler) is not await lifetime_container.resolve(Handler)
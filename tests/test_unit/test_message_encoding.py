@@ -0,0 +1,153 @@
+import dataclasses
+import uuid
+from dataclasses import dataclass, field
+
+import orjson
+import pytest
+
+from diator.events import (
+    ECSTEvent,
+    MessageTypeRegistry,
+    NotificationEvent,
+    OrjsonEventSerializer,
+)
+from diator.message_brokers.azure import _parse_message
+from diator.message_brokers.codecs import IMessageCodec, JsonCodec
+from diator.message_brokers.encoding import (
+    MessageEncoder,
+    decode_body,
+    decode_message,
+    encode_message,
+    encode_payload,
+    message_from_fields,
+    with_encoded_payload,
+)
+from diator.message_brokers.msgpack import MsgpackCodec
+from diator.message_brokers.protocol import Message
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserJoinedNotificationEvent(NotificationEvent):
+    user_id: int = field()
+
+
+def test_encode_message_embeds_encoded_payload() -> None:
+    event = UserJoinedNotificationEvent(user_id=1)
+    payload = OrjsonEventSerializer().dump(event)
+    encoded_payload = orjson.dumps(payload)
+    message = with_encoded_payload(
+        Message(
+            message_type=event._event_type,
+            message_name=type(event).__name__,
+            message_id=event.event_id,
+            payload=payload,
+        ),
+        encoded_payload,
+    )
+
+    assert encode_payload(message) is encoded_payload
+    assert encode_message(message) == orjson.dumps(message)
+
+
+def test_replaced_message_does_not_keep_encoded_payload() -> None:
+    message = message_from_fields(
+        {
+            b"message_type": b"notification_event",
+            b"message_name": b"UserJoined",
+            b"message_id": str(uuid.uuid4()),
+            b"payload": b'{"user_id":1}',
+        }
+    )
+
+    replaced = dataclasses.replace(message, payload={"user_id": 2})
+
+    assert encode_payload(replaced) == b'{"user_id":2}'
+    assert orjson.loads(encode_message(replaced))["payload"] == {"user_id": 2}
+
+
+def test_message_from_fields_keeps_payload_a_dict() -> None:
+    message = message_from_fields(
+        {
+            b"message_type": b"notification_event",
+            b"message_name": b"UserJoined",
+            b"message_id": str(uuid.uuid4()),
+            b"payload": b'{"user_id":1}',
+        }
+    )
+
+    assert message.payload == {"user_id": 1}
+    assert encode_payload(message) == b'{"user_id":1}'
+    assert b"_encoded_payload" not in orjson.dumps(message)
+
+
+def test_azure_message_carries_envelope_headers() -> None:
+    message = Message(message_type="notification_event", message_name="UserJoined", payload={"user_id": 1})
+
+    service_bus_message = _parse_message(message)
+
+    assert orjson.loads(str(service_bus_message))["payload"] == {"user_id": 1}
+    assert service_bus_message.message_id == str(message.message_id)
+    assert service_bus_message.application_properties == {
+        "message_type": "notification_event",
+        "message_name": "UserJoined",
+        "message_id": str(message.message_id),
+    }
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserChangedECSTEvent(ECSTEvent):
+    user_id: int = field()
+    biography: str = field()
+
+
+def build_message(event) -> Message:
+    return Message(
+        message_type=event._event_type,
+        message_name=type(event).__name__,
+        message_id=event.event_id,
+        payload=OrjsonEventSerializer().dump(event),
+        headers={"traceparent": "00-1-2-01"},
+    )
+
+
+def test_default_encoder_keeps_json_envelope() -> None:
+    message = build_message(UserJoinedNotificationEvent(user_id=1))
+
+    assert MessageEncoder().encode(message) == encode_message(message)
+    assert _parse_message(message).content_type == "application/json"
+
+
+@pytest.mark.parametrize("codec", [JsonCodec(), MsgpackCodec()])
+@pytest.mark.parametrize("compress_above", [None, 64])
+def test_encoded_messages_are_detected_and_decoded(codec: IMessageCodec, compress_above: int | None) -> None:
+    event = UserChangedECSTEvent(user_id=1, biography="Lorem ipsum " * 50)
+    message = build_message(event)
+    encoder = MessageEncoder(codec, compress_above=compress_above)
+
+    from_envelope = decode_message(encoder.encode(message))
+    fields = encoder.encode_fields(message)
+    from_fields = message_from_fields({key.encode(): value for key, value in fields.items()})
+    service_bus_message = _parse_message(message, encoder)
+    from_service_bus = decode_body(
+        b"".join(service_bus_message.body),
+        service_bus_message.content_type,
+        service_bus_message.application_properties.get("content_encoding"),  # type: ignore
+    )
+
+    for decoded in (from_envelope, from_fields, from_service_bus):
+        assert decoded.message_id == message.message_id
+        assert decoded.headers == message.headers
+        assert MessageTypeRegistry([UserChangedECSTEvent]).decode(decoded) == event
+
+    assert (fields.get("content_encoding") == "deflate") is (compress_above is not None)
+    assert service_bus_message.content_type == codec.content_type
+    assert not b"".join(service_bus_message.body).startswith(b"\x00")
+
+
+def test_msgpack_encoder_is_more_compact_than_json() -> None:
+    message = build_message(UserChangedECSTEvent(user_id=1, biography="Lorem ipsum " * 50))
+
+    json_size = len(MessageEncoder().encode(message))
+
+    assert len(MessageEncoder(MsgpackCodec()).encode(message)) < json_size
+    assert len(MessageEncoder(MsgpackCodec(), compress_above=256).encode(message)) < json_size / 2
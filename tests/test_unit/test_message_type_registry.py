@@ -0,0 +1,137 @@
+import datetime
+import enum
+import uuid
+from dataclasses import dataclass, field
+
+import pytest
+
+from diator.events import (
+    DomainEvent,
+    ECSTEvent,
+    EventMap,
+    IEventHandler,
+    MessageTypeRegistry,
+    NotificationEvent,
+    OrjsonEventSerializer,
+    UnknownMessageError,
+)
+from diator.message_brokers.encoding import decode_message, encode_message
+from diator.message_brokers.protocol import Message
+
+
+class Role(enum.Enum):
+    HOST = "host"
+    GUEST = "guest"
+
+
+@dataclass(frozen=True, kw_only=True)
+class Participant:
+    user_id: uuid.UUID = field()
+    role: Role = field()
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserJoinedNotificationEvent(NotificationEvent):
+    user_id: int = field()
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingUpdatedECSTEvent(ECSTEvent):
+    meeting_id: uuid.UUID = field()
+    starts_on: datetime.date = field()
+    host: Participant = field()
+    participants: tuple[Participant, ...] = field()
+    closed_at: datetime.datetime | None = field(default=None)
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserLeftDomainEvent(DomainEvent):
+    user_id: int = field()
+
+
+class EventHandler(IEventHandler):
+    async def handle(self, event) -> None:
+        pass
+
+
+def to_message(event) -> Message:
+    message = Message(
+        message_type=event._event_type,
+        message_name=type(event).__name__,
+        message_id=event.event_id,
+        payload=OrjsonEventSerializer().dump(event),
+    )
+    return decode_message(encode_message(message))
+
+
+@pytest.fixture
+def registry() -> MessageTypeRegistry:
+    event_map = EventMap()
+    event_map.bind(UserJoinedNotificationEvent, EventHandler)
+    event_map.bind(UserLeftDomainEvent, EventHandler)
+    return MessageTypeRegistry.from_event_map(event_map)
+
+
+def test_registry_restores_nested_fields(registry: MessageTypeRegistry) -> None:
+    registry.register(MeetingUpdatedECSTEvent)
+    host = Participant(user_id=uuid.uuid4(), role=Role.HOST)
+    event = MeetingUpdatedECSTEvent(
+        meeting_id=uuid.uuid4(),
+        starts_on=datetime.date(2023, 3, 6),
+        host=host,
+        participants=(host, Participant(user_id=uuid.uuid4(), role=Role.GUEST)),
+        closed_at=datetime.datetime(2023, 3, 6, 12, 11, tzinfo=datetime.timezone.utc),
+        tags=["weekly"],
+    )
+
+    assert registry.decode(to_message(event)) == event
+
+
+def test_registry_decodes_batches_in_order(registry: MessageTypeRegistry) -> None:
+    registry.register(UserJoinedNotificationEvent, name="UserJoined")
+    events = [UserJoinedNotificationEvent(user_id=user_id) for user_id in range(3)]
+    messages = [to_message(event) for event in events]
+    renamed = Message(
+        message_type="notification_event",
+        message_name="UserJoined",
+        message_id=events[0].event_id,
+        payload=messages[0].payload,
+    )
+    unknown = Message(message_type="ecst_event", message_name="UserJoinedNotificationEvent", payload={})
+    malformed = Message(message_type="notification_event", message_name="UserJoinedNotificationEvent", payload={})
+
+    decoded = registry.decode_many([messages[0], unknown, messages[1], malformed, renamed, messages[2]])
+
+    assert [decoded[0], decoded[2], decoded[5]] == events
+    assert isinstance(decoded[1], UnknownMessageError)
+    assert isinstance(decoded[3], TypeError)
+    assert decoded[4] == events[0]
+
+
+def test_registry_isolates_values_which_could_not_be_converted(registry: MessageTypeRegistry) -> None:
+    event = UserJoinedNotificationEvent(user_id=1)
+    message = to_message(event)
+    invalid = Message(
+        message_type="notification_event",
+        message_name="UserJoinedNotificationEvent",
+        payload={"event_id": "not-a-uuid", "user_id": 2},
+    )
+
+    decoded = registry.decode_many([message, invalid])
+
+    assert decoded[0] == event
+    assert isinstance(decoded[1], ValueError)
+
+
+def test_registry_skips_domain_events(registry: MessageTypeRegistry) -> None:
+    event = UserLeftDomainEvent(user_id=1)
+    message = Message(message_type="domain_event", message_name="UserLeftDomainEvent", payload={"user_id": 1})
+
+    assert message not in registry
+    with pytest.raises(UnknownMessageError):
+        registry.decode(message)
+
+    registry.register(UserLeftDomainEvent)
+    message = Message(message_type="", message_name="UserLeftDomainEvent", payload={"user_id": 1})
+    assert registry.decode(message) == event
@@ -0,0 +1,105 @@
+import math
+from dataclasses import dataclass, field
+
+import pytest
+
+from diator.events import (
+    DomainEvent,
+    EventEmitter,
+    EventMap,
+    IEventHandler,
+    NotificationEvent,
+)
+from diator.mediator import Mediator
+from diator.message_brokers.protocol import Message
+from diator.metrics import Metrics, Timing
+from diator.middlewares import InstrumentationMiddleware, MiddlewareChain
+from diator.requests import Request, RequestHandler, RequestMap
+
+
+@dataclass(kw_only=True)
+class CloseMeetingCommand(Request[None]):
+    fail: bool = field(default=False)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingClosedDomainEvent(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingClosedNotificationEvent(NotificationEvent):
+    pass
+
+
+class CloseMeetingCommandHandler(RequestHandler[CloseMeetingCommand, None]):
+    def __init__(self) -> None:
+        self._events: list = []
+
+    @property
+    def events(self) -> list:
+        return self._events
+
+    async def handle(self, request: CloseMeetingCommand) -> None:
+        if request.fail:
+            raise ValueError
+        self._events.append(MeetingClosedDomainEvent())
+        self._events.append(MeetingClosedNotificationEvent())
+
+
+class MeetingClosedEventHandler(IEventHandler[MeetingClosedDomainEvent]):
+    async def handle(self, event: MeetingClosedDomainEvent) -> None:
+        pass
+
+
+class TestMessageBroker:
+    async def send_message(self, message: Message) -> None:
+        pass
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+def test_timing_snapshot_has_cumulative_buckets() -> None:
+    timing = Timing((0.1, 1.0))
+
+    timing.observe(0.05)
+    timing.observe(0.1)
+    timing.observe(0.5, error=True)
+    timing.observe(5)
+
+    snapshot = timing.snapshot()
+
+    assert snapshot.count == 4
+    assert snapshot.errors == 1
+    assert snapshot.sum == pytest.approx(5.65)
+    assert snapshot.buckets == ((0.1, 2), (1.0, 3), (math.inf, 4))
+
+
+async def test_mediator_records_requests_event_handlers_and_publishes() -> None:
+    metrics = Metrics()
+    request_map = RequestMap()
+    request_map.bind(CloseMeetingCommand, CloseMeetingCommandHandler)
+    event_map = EventMap()
+    event_map.bind(MeetingClosedDomainEvent, MeetingClosedEventHandler)
+    middleware_chain = MiddlewareChain()
+    middleware_chain.add(InstrumentationMiddleware(metrics))
+    mediator = Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        event_emitter=EventEmitter(event_map, TestContainer(), TestMessageBroker(), metrics=metrics),  # type: ignore
+        middleware_chain=middleware_chain,
+    )
+
+    await mediator.send(CloseMeetingCommand())
+    with pytest.raises(ValueError):
+        await mediator.send(CloseMeetingCommand(fail=True))
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot.requests["CloseMeetingCommand"].count == 2
+    assert snapshot.requests["CloseMeetingCommand"].errors == 1
+    assert snapshot.event_handlers["MeetingClosedEventHandler"].count == 1
+    assert snapshot.publishes["TestMessageBroker"].count == 1
@@ -0,0 +1,111 @@
+import asyncio
+import sqlite3
+from typing import Callable
+
+import pytest
+
+from diator.backoff import ExponentialBackoff
+from diator.message_brokers.protocol import Message
+from diator.outbox import (
+    InMemoryOutboxStore,
+    IOutboxStore,
+    OutboxMessageBroker,
+    OutboxRelay,
+    SqliteOutboxStore,
+)
+
+
+class TestMessageBroker:
+    def __init__(self, failures: int = 0, failing_names: frozenset[str] = frozenset()) -> None:
+        self.batches: list[list[str]] = []
+        self._failures = failures
+        self._failing_names = failing_names
+
+    async def send_message(self, message: Message) -> None:
+        await self.send_messages([message])
+
+    async def send_messages(self, messages: list[Message]) -> None:
+        if self._failures or self._failing_names & {message.message_name for message in messages}:
+            self._failures = max(self._failures - 1, 0)
+            raise ConnectionError
+        self.batches.append([message.message_name for message in messages])
+
+
+def message(name: str, key: str = "") -> Message:
+    return Message(message_type="notification_event", message_name=name, payload={}, headers={"key": key})
+
+
+def by_key(message: Message) -> str:
+    return message.headers["key"]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store_factory(request) -> Callable[[], IOutboxStore]:
+    if request.param == "memory":
+        return InMemoryOutboxStore
+    return lambda: SqliteOutboxStore(sqlite3.connect(":memory:"))
+
+
+async def test_relay_sends_stored_messages_in_batches(store_factory) -> None:
+    store = store_factory()
+    outbox_broker = OutboxMessageBroker(store)
+    message_broker = TestMessageBroker()
+    relay = OutboxRelay(store, message_broker, batch_size=2)
+
+    await outbox_broker.send_messages([message("first"), message("second"), message("third")])
+    sent = await relay.drain()
+
+    assert sent == 3
+    assert message_broker.batches == [["first", "second"], ["third"]]
+    assert await store.fetch(10) == []
+
+
+async def test_failed_messages_delay_only_messages_with_the_same_key(store_factory) -> None:
+    store = store_factory()
+    outbox_broker = OutboxMessageBroker(store, ordering_key=by_key)
+    message_broker = TestMessageBroker(failing_names=frozenset({"a1"}))
+    relay = OutboxRelay(store, message_broker, batch_size=1, backoff=ExponentialBackoff(initial=10, jitter=False))
+
+    for name in ("a1", "b1", "a2", "b2"):
+        await outbox_broker.send_message(message(name, key=name[0]))
+    await relay.drain()
+    await relay.drain()
+
+    assert message_broker.batches == [["b1"], ["b2"]]
+    assert await store.fetch(10) == []
+
+    await store.retry([1], 0)
+    [record] = await store.fetch(1)
+
+    assert record.message.message_name == "a1"
+    assert record.attempts == 2
+
+
+async def test_relay_drops_messages_after_max_attempts(store_factory) -> None:
+    store = store_factory()
+    relay = OutboxRelay(
+        store,
+        TestMessageBroker(failures=1),
+        backoff=ExponentialBackoff(initial=0, maximum=0),
+        max_attempts=1,
+    )
+
+    await OutboxMessageBroker(store).send_message(message("first"))
+    await relay.drain()
+
+    assert await store.fetch(10) == []
+
+
+async def test_background_relay_is_woken_up_by_outbox_broker() -> None:
+    store = InMemoryOutboxStore()
+    message_broker = TestMessageBroker()
+    relay = OutboxRelay(store, message_broker, interval=60)
+
+    async with relay:
+        await asyncio.sleep(0)
+        await OutboxMessageBroker(store, notify=relay.notify).send_message(message("first"))
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    assert message_broker.batches == [["first"]]
+    assert len(store) == 0
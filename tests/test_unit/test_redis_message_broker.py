@@ -0,0 +1,78 @@
+import fakeredis
+import orjson
+import pytest
+
+from diator.message_brokers.protocol import Message
+from diator.message_brokers.redis import (
+    RedisMessageBroker,
+    RedisStreamsMessageBroker,
+    message_name_channel,
+)
+
+
+@pytest.fixture
+def redis_client() -> fakeredis.FakeAsyncRedis:
+    return fakeredis.FakeAsyncRedis()
+
+
+async def test_redis_message_broker_sends_batch(redis_client: fakeredis.FakeAsyncRedis) -> None:
+    message_broker = RedisMessageBroker(redis_client, channel_prefix="test_diator_channel")
+    messages = [
+        Message(payload={"phrase": "hello"}, message_type="notification_event", message_name="First"),
+        Message(payload={"phrase": "bye"}, message_type="notification_event", message_name="Second"),
+    ]
+
+    async with redis_client.pubsub() as pubsub:
+        await pubsub.psubscribe("test_diator_channel:*")
+        await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1)
+
+        await message_broker.send_messages(messages)
+
+        received = [await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1) for _ in messages]
+
+    assert [orjson.loads(data["data"])["message_name"] for data in received if data] == ["First", "Second"]
+    assert received[0] is not None
+    assert received[0]["channel"] == f"test_diator_channel:notification_event:{messages[0].message_id}".encode()
+
+
+async def test_redis_message_broker_publishes_to_stable_channel(redis_client: fakeredis.FakeAsyncRedis) -> None:
+    message_broker = RedisMessageBroker(redis_client, channel_naming=message_name_channel)
+    message = Message(payload={"phrase": "hello"}, message_type="notification_event", message_name="UserJoined")
+
+    async with redis_client.pubsub() as pubsub:
+        await pubsub.subscribe("python_diator_channel:notification_event:UserJoined")
+        await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1)
+
+        await message_broker.send_message(message)
+
+        data = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.1)
+
+    assert data is not None
+    assert orjson.loads(data["data"])["payload"] == {"phrase": "hello"}
+
+
+async def test_redis_streams_message_broker_appends_batch(redis_client: fakeredis.FakeAsyncRedis) -> None:
+    message_broker = RedisStreamsMessageBroker(
+        redis_client,
+        stream_keys={"ecst_event": "test_users_state"},
+        maxlen=2,
+        approximate=False,
+        batch_size=2,
+    )
+    messages = [
+        Message(payload={"user_id": user_id}, message_type="ecst_event", message_name="UserChanged")
+        for user_id in range(3)
+    ]
+
+    await message_broker.send_messages(messages)
+    await message_broker.send_message(
+        Message(payload={"user_id": 3}, message_type="notification_event", message_name="UserJoined")
+    )
+
+    entries = await redis_client.xrange("test_users_state")
+    notification_entries = await redis_client.xrange("python_diator_stream:notification_event")
+
+    assert [orjson.loads(fields[b"payload"]) for _, fields in entries] == [{"user_id": 1}, {"user_id": 2}]
+    assert entries[0][1][b"message_id"] == str(messages[1].message_id).encode()
+    assert len(notification_entries) == 1
+    assert notification_entries[0][1][b"message_name"] == b"UserJoined"
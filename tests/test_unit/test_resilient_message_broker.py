@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from diator.backoff import ExponentialBackoff
+from diator.message_brokers.protocol import Message
+from diator.message_brokers.resilient import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    ResilientMessageBroker,
+)
+from diator.outbox import InMemoryOutboxStore
+
+NO_BACKOFF = ExponentialBackoff(initial=0, maximum=0)
+
+
+class TestMessageBroker:
+    def __init__(self, failures: int = 0) -> None:
+        self.calls = 0
+        self.sent: list[Message] = []
+        self._failures = failures
+
+    async def send_message(self, message: Message) -> None:
+        self.calls += 1
+        if self._failures:
+            self._failures -= 1
+            raise ConnectionError
+        self.sent.append(message)
+
+
+def message() -> Message:
+    return Message(message_type="notification_event", message_name="UserJoined", payload={})
+
+
+async def test_transient_failures_are_retried() -> None:
+    inner = TestMessageBroker(failures=2)
+    message_broker = ResilientMessageBroker(inner, max_retries=2, backoff=NO_BACKOFF)
+
+    await message_broker.send_message(message())
+
+    assert len(inner.sent) == 1
+    assert message_broker.stats.retries == 2
+    assert message_broker.stats.state is CircuitState.CLOSED
+
+
+async def test_open_circuit_rejects_messages_without_calling_broker() -> None:
+    inner = TestMessageBroker(failures=100)
+    message_broker = ResilientMessageBroker(
+        inner,
+        max_retries=5,
+        backoff=NO_BACKOFF,
+        circuit_breaker=CircuitBreaker(failure_threshold=3, reset_timeout=60),
+    )
+
+    with pytest.raises(ConnectionError):
+        await message_broker.send_message(message())
+    with pytest.raises(CircuitOpenError):
+        await message_broker.send_message(message())
+
+    assert inner.calls == 3
+    assert message_broker.stats.state is CircuitState.OPEN
+    assert message_broker.stats.failures == 1
+    assert message_broker.stats.rejected == 1
+
+
+async def test_half_open_circuit_is_closed_by_successful_trial() -> None:
+    inner = TestMessageBroker(failures=1)
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    message_broker = ResilientMessageBroker(inner, max_retries=0, circuit_breaker=circuit_breaker)
+
+    with pytest.raises(ConnectionError):
+        await message_broker.send_message(message())
+
+    assert circuit_breaker.state is CircuitState.HALF_OPEN
+
+    await message_broker.send_messages([message(), message()])
+
+    assert circuit_breaker.state is CircuitState.CLOSED
+    assert len(inner.sent) == 2
+
+
+class HangingMessageBroker(TestMessageBroker):
+    async def send_message(self, message: Message) -> None:
+        if self.calls == 1:
+            self.calls += 1
+            await asyncio.Event().wait()
+        await super().send_message(message)
+
+
+async def test_cancelled_trial_opens_circuit_again() -> None:
+    inner = HangingMessageBroker(failures=1)
+    circuit_breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    message_broker = ResilientMessageBroker(inner, max_retries=0, circuit_breaker=circuit_breaker)
+
+    with pytest.raises(ConnectionError):
+        await message_broker.send_message(message())
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(message_broker.send_message(message()), 0.01)
+
+    assert circuit_breaker.state is CircuitState.HALF_OPEN
+
+    await message_broker.send_message(message())
+
+    assert circuit_breaker.state is CircuitState.CLOSED
+    assert len(inner.sent) == 1
+
+
+async def test_unsent_messages_are_spilled() -> None:
+    spill = InMemoryOutboxStore()
+    message_broker = ResilientMessageBroker(
+        TestMessageBroker(failures=100), max_retries=1, backoff=NO_BACKOFF, spill=spill
+    )
+
+    await message_broker.send_message(message())
+
+    assert len(spill) == 1
+    assert message_broker.stats.spilled == 1
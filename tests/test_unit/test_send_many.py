@@ -0,0 +1,143 @@
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+from diator.containers.lifetime import Lifetime, LifetimeContainer
+from diator.dispatchers import CompiledDispatcher, DefaultDispatcher
+from diator.events import DomainEvent, Event, EventEmitter, EventMap
+from diator.mediator import Mediator
+from diator.requests import IRequestHandler, Request, RequestMap
+from diator.requests.map import RequestHandlerDoesNotExist
+from diator.responses import Response
+
+
+@dataclass(kw_only=True)
+class DoubleQueryResult(Response):
+    value: int = field()
+
+
+@dataclass(kw_only=True)
+class DoubleQuery(Request[DoubleQueryResult]):
+    value: int = field()
+
+
+@dataclass(kw_only=True)
+class UnboundQuery(Request[None]):
+    ...
+
+
+@dataclass(frozen=True, kw_only=True)
+class ValueDoubledDomainEvent(DomainEvent):
+    value: int = field()
+
+
+class DoubleQueryHandler(IRequestHandler[DoubleQuery, DoubleQueryResult]):  # type: ignore
+    def __init__(self) -> None:
+        self._events: list[Event] = []
+
+    @property
+    def events(self) -> list:
+        return self._events
+
+    async def handle(self, request: DoubleQuery) -> DoubleQueryResult:
+        await asyncio.sleep(0.001 * (5 - request.value))
+        if request.value < 0:
+            raise ValueError(request.value)
+        self._events.append(ValueDoubledDomainEvent(value=request.value))
+        return DoubleQueryResult(value=request.value * 2)
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+class RecordingEmission:
+    def __init__(self) -> None:
+        self.batches: list[list[Event]] = []
+
+    async def emit(self, event_emitter: EventEmitter, events: list[Event]) -> None:
+        self.batches.append(events)
+
+
+@pytest.mark.parametrize("dispatcher_type", [DefaultDispatcher, CompiledDispatcher])
+async def test_send_many(dispatcher_type) -> None:
+    request_map = RequestMap()
+    request_map.bind(DoubleQuery, DoubleQueryHandler)
+    emission = RecordingEmission()
+    mediator = Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        event_emitter=EventEmitter(event_map=EventMap(), container=TestContainer()),  # type: ignore
+        dispatcher_type=dispatcher_type,
+        emission_strategy=emission,
+    )
+
+    results = await mediator.send_many(
+        [DoubleQuery(value=1), DoubleQuery(value=-1), UnboundQuery(), DoubleQuery(value=3)],  # type: ignore
+        concurrency=2,
+    )
+
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert results[0].response == DoubleQueryResult(value=2)
+    assert isinstance(results[1].exception, ValueError)
+    assert isinstance(results[2].exception, RequestHandlerDoesNotExist)
+    assert results[3].response == DoubleQueryResult(value=6)
+    assert len(emission.batches) == 1
+    assert sorted(event.value for event in emission.batches[0]) == [1, 3]  # type: ignore
+
+
+class ScopedDoubleQueryHandler(DoubleQueryHandler):
+    instances: list["ScopedDoubleQueryHandler"] = []
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.instances.append(self)
+        self.values: list[int] = []
+
+    async def handle(self, request: DoubleQuery) -> DoubleQueryResult:
+        self.values.append(request.value)
+        return await super().handle(request)
+
+
+@pytest.mark.parametrize("dispatcher_type", [DefaultDispatcher, CompiledDispatcher])
+@pytest.mark.parametrize("timeout", [None, 1])
+async def test_send_many_handles_every_request_in_its_own_scope(dispatcher_type, timeout: float | None) -> None:
+    ScopedDoubleQueryHandler.instances = []
+    request_map = RequestMap()
+    request_map.bind(DoubleQuery, ScopedDoubleQueryHandler)
+    mediator = Mediator(
+        request_map=request_map,
+        container=LifetimeContainer(TestContainer(), {ScopedDoubleQueryHandler: Lifetime.SCOPED}),  # type: ignore
+        dispatcher_type=dispatcher_type,
+        timeout=timeout,
+    )
+
+    results = await mediator.send_many([DoubleQuery(value=value) for value in (1, 2, 3)])
+
+    assert [result.response for result in results] == [DoubleQueryResult(value=value * 2) for value in (1, 2, 3)]
+    assert sorted(handler.values for handler in ScopedDoubleQueryHandler.instances) == [[1], [2], [3]]
+
+
+@pytest.mark.parametrize("dispatcher_type", [DefaultDispatcher, CompiledDispatcher])
+async def test_mediator_does_not_emit_events_of_reused_handler_again(dispatcher_type) -> None:
+    request_map = RequestMap()
+    request_map.bind(DoubleQuery, DoubleQueryHandler)
+    container = LifetimeContainer(TestContainer(), {DoubleQueryHandler: Lifetime.SINGLETON})  # type: ignore
+    emission = RecordingEmission()
+    mediator = Mediator(
+        request_map=request_map,
+        container=container,
+        event_emitter=EventEmitter(event_map=EventMap(), container=TestContainer()),  # type: ignore
+        dispatcher_type=dispatcher_type,
+        emission_strategy=emission,
+    )
+
+    await mediator.send(DoubleQuery(value=1))
+    await mediator.send(DoubleQuery(value=2))
+    await mediator.send_many([DoubleQuery(value=3)])
+
+    handler = await container.resolve(DoubleQueryHandler)
+    assert [[event.value for event in batch] for batch in emission.batches] == [[1], [2], [3]]  # type: ignore
+    assert handler.events == []
@@ -0,0 +1,76 @@
+from dataclasses import dataclass, field
+from decimal import Decimal
+from uuid import UUID
+
+import orjson
+
+from diator.events import (
+    DataclassFactoryEventSerializer,
+    ECSTEvent,
+    NotificationEvent,
+    OrjsonEventSerializer,
+)
+from diator.message_brokers.encoding import encode_payload
+from diator.message_brokers.protocol import Message
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserJoinedNotificationEvent(NotificationEvent):
+    user_id: int = field()
+    meeting_ids: list[int] = field(default_factory=list)
+
+
+@dataclass(frozen=True, kw_only=True)
+class UserChangedECSTEvent(ECSTEvent):
+    pass
+
+
+def test_orjson_event_serializer_keeps_native_values() -> None:
+    event = UserJoinedNotificationEvent(user_id=1, meeting_ids=[1, 2])
+    serializer = OrjsonEventSerializer()
+
+    payload = serializer.dump(event)
+
+    assert payload == {
+        "event_id": event.event_id,
+        "event_timestamp": event.event_timestamp,
+        "user_id": 1,
+        "meeting_ids": [1, 2],
+    }
+    assert isinstance(payload["event_id"], UUID)
+    assert serializer.dump(event) == payload
+
+
+def test_serializers_produce_the_same_json() -> None:
+    orjson_serializer = OrjsonEventSerializer()
+    dataclass_factory_serializer = DataclassFactoryEventSerializer()
+
+    for event in (UserJoinedNotificationEvent(user_id=1, meeting_ids=[1]), UserChangedECSTEvent()):
+        assert orjson.loads(orjson.dumps(orjson_serializer.dump(event))) == orjson.loads(
+            orjson.dumps(dataclass_factory_serializer.dump(event))
+        )
+
+
+@dataclass(frozen=True, kw_only=True)
+class PriceChangedECSTEvent(ECSTEvent):
+    price: Decimal = field()
+    tags: frozenset[str] = field()
+    meeting_ids: set[int] = field()
+
+
+def _encode(payload: dict) -> bytes:
+    return encode_payload(Message(message_type="ecst_event", message_name="PriceChangedECSTEvent", payload=payload))
+
+
+def test_orjson_event_serializer_encodes_values_not_supported_by_orjson() -> None:
+    event = PriceChangedECSTEvent(price=Decimal("1.10"), tags=frozenset({"b", "a"}), meeting_ids={3, 1})
+
+    payload = orjson.loads(_encode(OrjsonEventSerializer().dump(event)))
+    dataclass_factory_payload = orjson.loads(_encode(DataclassFactoryEventSerializer().dump(event)))
+
+    assert {key: sorted(value) if isinstance(value, list) else value for key, value in payload.items()} == {
+        key: sorted(value) if isinstance(value, list) else value for key, value in dataclass_factory_payload.items()
+    }
+    assert payload["price"] == "1.10"
+    assert payload["tags"] == ["a", "b"]
+    assert payload["meeting_ids"] == [1, 3]
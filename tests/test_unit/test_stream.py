@@ -0,0 +1,154 @@
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
+
+import pytest
+
+from diator.containers.lifetime import _scope
+from diator.deadlines import remaining
+from diator.events import DomainEvent, EventEmitter, EventMap, IEventHandler
+from diator.mediator import Mediator
+from diator.middlewares import MiddlewareChain
+from diator.requests import Request, RequestHandler, RequestMap, StreamRequestHandler
+from diator.requests.map import RequestHandlerKindMismatch
+from diator.requests.request import IRequest
+from diator.responses import Response
+
+
+@dataclass(kw_only=True)
+class MeetingRow(Response):
+    meeting_id: int = field()
+
+
+@dataclass(kw_only=True)
+class ExportMeetingsQuery(Request[MeetingRow]):
+    count: int = field()
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingsExportedDomainEvent(DomainEvent):
+    count: int = field()
+
+
+class ExportMeetingsQueryHandler(StreamRequestHandler[ExportMeetingsQuery, MeetingRow]):
+    seconds_left: list[float | None] = []
+    closed: list[bool] = []
+
+    async def handle(self, request: ExportMeetingsQuery) -> AsyncIterator[MeetingRow]:
+        self.seconds_left.append(remaining())
+        try:
+            for meeting_id in range(request.count):
+                yield MeetingRow(meeting_id=meeting_id)
+        finally:
+            self.closed.append(True)
+
+        self._events.append(MeetingsExportedDomainEvent(count=request.count))
+
+
+@dataclass(kw_only=True)
+class ReadMeetingQuery(Request[MeetingRow]):
+    meeting_id: int = field()
+
+
+class ReadMeetingQueryHandler(RequestHandler[ReadMeetingQuery, MeetingRow]):
+    async def handle(self, request: ReadMeetingQuery) -> MeetingRow:
+        return MeetingRow(meeting_id=request.meeting_id)
+
+
+class MeetingsExportedEventHandler(IEventHandler[MeetingsExportedDomainEvent]):
+    handled: list[int] = []
+
+    async def handle(self, event: MeetingsExportedDomainEvent) -> None:
+        self.handled.append(event.count)
+
+
+class OffsetMiddleware:
+    async def __call__(self, request: IRequest[Any], handle):
+        items = await handle(request)
+        return self._offset(items)
+
+    @staticmethod
+    async def _offset(items: AsyncIterator[MeetingRow]) -> AsyncIterator[MeetingRow]:
+        async for item in items:
+            yield MeetingRow(meeting_id=item.meeting_id + 10)
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+async def test_mediator_streams_results() -> None:
+    request_map = RequestMap()
+    request_map.bind(ExportMeetingsQuery, ExportMeetingsQueryHandler)
+    event_map = EventMap()
+    event_map.bind(MeetingsExportedDomainEvent, MeetingsExportedEventHandler)
+    middleware_chain = MiddlewareChain()
+    middleware_chain.add(OffsetMiddleware())
+    mediator = Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        event_emitter=EventEmitter(event_map=event_map, container=TestContainer()),  # type: ignore
+        middleware_chain=middleware_chain,
+    )
+    rows: list[MeetingRow] = []
+
+    async for row in mediator.stream(ExportMeetingsQuery(count=3)):
+        assert not MeetingsExportedEventHandler.handled
+        rows.append(row)
+
+    assert rows == [MeetingRow(meeting_id=10), MeetingRow(meeting_id=11), MeetingRow(meeting_id=12)]
+    assert MeetingsExportedEventHandler.handled == [3]
+
+
+async def test_mediator_stream_sets_deadline() -> None:
+    ExportMeetingsQueryHandler.seconds_left = []
+    request_map = RequestMap()
+    request_map.bind(ExportMeetingsQuery, ExportMeetingsQueryHandler)
+    mediator = Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        timeouts={ExportMeetingsQuery: 5},
+    )
+
+    rows = [row async for row in mediator.stream(ExportMeetingsQuery(count=2))]
+
+    assert len(rows) == 2
+    assert 0 < ExportMeetingsQueryHandler.seconds_left[0] <= 5  # type: ignore
+    assert remaining() is None
+
+
+async def test_request_sent_to_handler_of_other_kind_is_rejected() -> None:
+    request_map = RequestMap()
+    request_map.bind(ExportMeetingsQuery, ExportMeetingsQueryHandler)
+    request_map.bind(ReadMeetingQuery, ReadMeetingQueryHandler)
+    mediator = Mediator(request_map=request_map, container=TestContainer())  # type: ignore
+
+    with pytest.raises(RequestHandlerKindMismatch, match="Mediator.stream"):
+        await mediator.send(ExportMeetingsQuery(count=1))
+    with pytest.raises(RequestHandlerKindMismatch, match="Mediator.send"):
+        async for _ in mediator.stream(ReadMeetingQuery(meeting_id=1)):
+            pass
+
+
+async def test_mediator_stream_does_not_leak_context_to_caller() -> None:
+    ExportMeetingsQueryHandler.seconds_left = []
+    ExportMeetingsQueryHandler.closed = []
+    request_map = RequestMap()
+    request_map.bind(ExportMeetingsQuery, ExportMeetingsQueryHandler)
+    mediator = Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        timeouts={ExportMeetingsQuery: 5},
+    )
+    stream = mediator.stream(ExportMeetingsQuery(count=3))
+
+    async for _ in stream:
+        assert remaining() is None
+        assert _scope.get() is None
+        break
+    await stream.aclose()  # type: ignore
+
+    assert remaining() is None
+    assert _scope.get() is None
+    assert ExportMeetingsQueryHandler.closed == [True]
+    assert ExportMeetingsQueryHandler.seconds_left[0] is not None
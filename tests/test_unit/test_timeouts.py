@@ -0,0 +1,161 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+import pytest
+
+from diator.deadlines import RequestTimeoutError, remaining
+from diator.events import DomainEvent, EventEmitter, EventMap, IEventHandler
+from diator.mediator import Mediator
+from diator.requests import (
+    Request,
+    RequestHandler,
+    RequestMap,
+    StreamRequestHandler,
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingClosedDomainEvent(DomainEvent):
+    delay: float = field()
+
+
+@dataclass(kw_only=True)
+class CloseMeetingCommand(Request[None]):
+    delay: float = field(default=0)
+    event_delay: float | None = field(default=None)
+
+
+class CloseMeetingCommandHandler(RequestHandler[CloseMeetingCommand, None]):
+    remaining: list[float | None] = []
+    cancelled: list[bool] = []
+
+    def __init__(self) -> None:
+        self._events: list = []
+
+    @property
+    def events(self) -> list:
+        return self._events
+
+    async def handle(self, request: CloseMeetingCommand) -> None:
+        self.remaining.append(remaining())
+        try:
+            await asyncio.sleep(request.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(True)
+            raise
+
+        if request.event_delay is not None:
+            self._events.append(MeetingClosedDomainEvent(delay=request.event_delay))
+
+
+class MeetingClosedEventHandler(IEventHandler[MeetingClosedDomainEvent]):
+    async def handle(self, event: MeetingClosedDomainEvent) -> None:
+        await asyncio.sleep(event.delay)
+
+
+@dataclass(kw_only=True)
+class ExportMeetingsQuery(Request[None]):
+    delays: list[float] = field()
+
+
+class ExportMeetingsQueryHandler(StreamRequestHandler[ExportMeetingsQuery, None]):
+    async def handle(self, request: ExportMeetingsQuery) -> AsyncIterator[None]:
+        for delay in request.delays:
+            await asyncio.sleep(delay)
+            yield None
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+def build_mediator(**kwargs) -> Mediator:
+    CloseMeetingCommandHandler.remaining = []
+    CloseMeetingCommandHandler.cancelled = []
+    request_map = RequestMap()
+    request_map.bind(CloseMeetingCommand, CloseMeetingCommandHandler)
+    request_map.bind(ExportMeetingsQuery, ExportMeetingsQueryHandler)
+    event_map = EventMap()
+    event_map.bind(MeetingClosedDomainEvent, MeetingClosedEventHandler)
+
+    return Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        event_emitter=EventEmitter(event_map, TestContainer()),  # type: ignore
+        **kwargs,
+    )
+
+
+async def test_send_without_timeout_has_no_deadline() -> None:
+    mediator = build_mediator()
+
+    await mediator.send(CloseMeetingCommand())
+
+    assert CloseMeetingCommandHandler.remaining == [None]
+
+
+async def test_send_times_out_and_cancels_handler() -> None:
+    mediator = build_mediator(timeout=0.02)
+
+    with pytest.raises(RequestTimeoutError) as exc_info:
+        await mediator.send(CloseMeetingCommand(delay=1))
+
+    assert isinstance(exc_info.value, asyncio.TimeoutError)
+    assert CloseMeetingCommandHandler.cancelled == [True]
+    assert 0 < CloseMeetingCommandHandler.remaining[0] <= 0.02  # type: ignore
+    assert mediator.timed_out == {"CloseMeetingCommand": 1}
+
+
+async def test_timeout_of_request_type_overrides_global_timeout() -> None:
+    mediator = build_mediator(timeout=0.01, timeouts={CloseMeetingCommand: 1})
+
+    await mediator.send(CloseMeetingCommand(delay=0.02))
+
+    assert not mediator.timed_out
+
+
+async def test_timeout_covers_event_emission() -> None:
+    mediator = build_mediator(timeout=0.02)
+
+    with pytest.raises(RequestTimeoutError):
+        await mediator.send(CloseMeetingCommand(event_delay=1))
+
+
+async def test_cancellation_is_propagated_to_handler() -> None:
+    mediator = build_mediator(timeout=1)
+
+    task = asyncio.ensure_future(mediator.send(CloseMeetingCommand(delay=1)))
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert CloseMeetingCommandHandler.cancelled == [True]
+    assert not mediator.timed_out
+
+
+async def test_send_many_bounds_every_request_by_its_timeout() -> None:
+    mediator = build_mediator(timeout=0.05)
+
+    results = await mediator.send_many([CloseMeetingCommand(), CloseMeetingCommand(delay=1), CloseMeetingCommand()])
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1].exception, RequestTimeoutError)
+    assert all(0 < seconds_left <= 0.05 for seconds_left in CloseMeetingCommandHandler.remaining)  # type: ignore
+    assert CloseMeetingCommandHandler.cancelled == [True]
+    assert mediator.timed_out == {"CloseMeetingCommand": 1}
+
+
+async def test_stream_times_out() -> None:
+    mediator = build_mediator(timeout=0.05)
+    rows = 0
+
+    with pytest.raises(RequestTimeoutError):
+        async for _ in mediator.stream(ExportMeetingsQuery(delays=[0, 0, 1])):
+            rows += 1
+
+    assert rows == 2
+    assert mediator.timed_out == {"ExportMeetingsQuery": 1}
@@ -0,0 +1,139 @@
+import contextlib
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Mapping
+
+import orjson
+import pytest
+
+from diator import tracing
+from diator.dispatchers import CompiledDispatcher
+from diator.events import (
+    DomainEvent,
+    EventEmitter,
+    EventMap,
+    IEventHandler,
+    NotificationEvent,
+)
+from diator.mediator import Mediator
+from diator.message_brokers.encoding import encode_message
+from diator.message_brokers.protocol import Message
+from diator.middlewares import MiddlewareChain
+from diator.requests import Request, RequestHandler, RequestMap
+
+
+@dataclass(kw_only=True)
+class CloseMeetingCommand(Request[None]):
+    meeting_id: int = field()
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingClosedDomainEvent(DomainEvent):
+    meeting_id: int = field()
+
+
+@dataclass(frozen=True, kw_only=True)
+class MeetingClosedNotificationEvent(NotificationEvent):
+    meeting_id: int = field()
+
+
+class CloseMeetingCommandHandler(RequestHandler[CloseMeetingCommand, None]):
+    def __init__(self) -> None:
+        self._events: list = []
+
+    @property
+    def events(self) -> list:
+        return self._events
+
+    async def handle(self, request: CloseMeetingCommand) -> None:
+        self._events.append(MeetingClosedDomainEvent(meeting_id=request.meeting_id))
+        self._events.append(MeetingClosedNotificationEvent(meeting_id=request.meeting_id))
+
+
+class MeetingClosedEventHandler(IEventHandler[MeetingClosedDomainEvent]):
+    async def handle(self, event: MeetingClosedDomainEvent) -> None:
+        pass
+
+
+class TestMessageBroker:
+    def __init__(self) -> None:
+        self.messages: list[Message] = []
+
+    async def send_message(self, message: Message) -> None:
+        self.messages.append(message)
+
+
+class TestContainer:
+    async def resolve(self, type_):
+        return type_()
+
+
+class TestTracer:
+    def __init__(self) -> None:
+        self.spans: list[tuple[str, str | None]] = []
+        self._stack: list[str] = []
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name: str, *, attributes: Mapping[str, Any] | None = None) -> Iterator[None]:
+        self.spans.append((name, self._stack[-1] if self._stack else None))
+        self._stack.append(name)
+        try:
+            yield
+        finally:
+            self._stack.pop()
+
+    def inject(self, headers: dict[str, str]) -> None:
+        headers["traceparent"] = self._stack[-1]
+
+
+@pytest.fixture
+def tracer() -> Iterator[TestTracer]:
+    tracer = TestTracer()
+    tracing.set_tracer(tracer, inject=tracer.inject)
+    yield tracer
+    tracing.set_tracer(None)
+
+
+def build_mediator(message_broker: TestMessageBroker, **kwargs) -> Mediator:
+    request_map = RequestMap()
+    request_map.bind(CloseMeetingCommand, CloseMeetingCommandHandler)
+    event_map = EventMap()
+    event_map.bind(MeetingClosedDomainEvent, MeetingClosedEventHandler)
+
+    return Mediator(
+        request_map=request_map,
+        container=TestContainer(),  # type: ignore
+        event_emitter=EventEmitter(event_map, TestContainer(), message_broker),  # type: ignore
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("dispatcher_type", [None, CompiledDispatcher])
+async def test_mediator_opens_spans_around_each_stage(tracer: TestTracer, dispatcher_type) -> None:
+    message_broker = TestMessageBroker()
+    kwargs = {"dispatcher_type": dispatcher_type} if dispatcher_type else {}
+    mediator = build_mediator(message_broker, middleware_chain=MiddlewareChain(), **kwargs)
+
+    await mediator.send(CloseMeetingCommand(meeting_id=1))
+
+    assert tracer.spans == [
+        ("diator.send", None),
+        ("diator.dispatch", "diator.send"),
+        ("diator.resolve", "diator.dispatch"),
+        ("diator.handle", "diator.dispatch"),
+        ("diator.event_handler", "diator.send"),
+        ("diator.publish", "diator.send"),
+    ]
+    assert message_broker.messages[0].headers == {"traceparent": "diator.send"}
+    assert orjson.loads(encode_message(message_broker.messages[0]))["headers"] == {"traceparent": "diator.send"}
+
+
+async def test_tracing_is_disabled_by_default() -> None:
+    message_broker = TestMessageBroker()
+    mediator = build_mediator(message_broker)
+
+    await mediator.send(CloseMeetingCommand(meeting_id=1))
+
+    assert not tracing.is_enabled()
+    assert tracing.start_span("diator.send") is tracing.start_span("diator.dispatch")
+    assert tracing.traced(mediator.send, "diator.send") == mediator.send
+    assert message_broker.messages[0].headers == {}